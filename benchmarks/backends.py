@@ -0,0 +1,333 @@
+"""In-process stand-ins for the cloud backends, with injectable latency and quotas."""
+
+import random
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import deque
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from azure.core.exceptions import HttpResponseError, ResourceNotFoundError
+from botocore.exceptions import ClientError
+from google.api_core import exceptions as gcp_exceptions
+
+
+def _sleep(latency: float) -> None:
+    if latency:
+        time.sleep(latency)
+
+
+class FakeBackend(ABC):
+    """Secrets in a dict, plus per-call latency and an optional request quota.
+
+    With ``tail_latency``, a ``tail_fraction`` of calls (chosen with a seeded
+    random generator) take that long instead of ``latency``. Listing calls
+    return ``PAGE_SIZE`` names per page.
+    """
+
+    PAGE_SIZE = 100
+
+    def __init__(
+        self,
+        secrets: Optional[Dict[str, str]] = None,
+        latency: float = 0.0,
+        quota: Optional[float] = None,
+        tail_latency: float = 0.0,
+        tail_fraction: float = 0.0,
+        seed: int = 0,
+    ):
+        self.secrets: Dict[str, str] = dict(secrets or {})
+        self.versions: Dict[str, str] = {}
+        self.latency = latency
+        self.tail_latency = tail_latency
+        self.tail_fraction = tail_fraction
+        self._random = random.Random(seed)
+        self.calls = 0
+        self.bytes_served = 0
+        # Requests allowed per rolling second; more raise _throttled()
+        self.quota = quota
+        self.throttled = 0
+        self._recent: deque = deque()
+        self._quota_lock = threading.Lock()
+
+    @abstractmethod
+    def _throttled(self, operation: str) -> Exception:
+        """Return the error the real SDK raises when ``operation`` is throttled."""
+
+    def _charge(self, operation: str) -> None:
+        self.calls += 1
+        if self.quota is not None:
+            with self._quota_lock:
+                now = time.monotonic()
+                while self._recent and now - self._recent[0] >= 1.0:
+                    self._recent.popleft()
+                if len(self._recent) >= self.quota:
+                    self.throttled += 1
+                    raise self._throttled(operation)
+                self._recent.append(now)
+        if self.tail_fraction and self._random.random() < self.tail_fraction:
+            _sleep(self.tail_latency)
+        else:
+            _sleep(self.latency)
+
+    def _version(self, secret_name: str) -> str:
+        return self.versions.setdefault(secret_name, uuid.uuid4().hex)
+
+    def _payload(self, secret_name: str) -> str:
+        value = self.secrets[secret_name]
+        self.bytes_served += len(value.encode("UTF-8"))
+        return value
+
+    def _page(
+        self, prefix: str, token: Optional[str], operation: str
+    ) -> Tuple[List[str], Optional[str]]:
+        """Return one charged page of sorted names starting with ``prefix``.
+
+        ``token`` is the offset of the page; the token of the next page is
+        returned with it, or None after the last page.
+        """
+        self._charge(operation)
+        names = sorted(name for name in self.secrets if name.startswith(prefix))
+        start = int(token or 0)
+        end = start + self.PAGE_SIZE
+        return names[start:end], str(end) if end < len(names) else None
+
+    def rotate(self, secret_name: str, value: str) -> None:
+        """Change a secret behind the provider's back, as another writer would."""
+        self.secrets[secret_name] = value
+        self.versions.pop(secret_name, None)
+
+
+class ResourceNotFoundException(ClientError):
+    pass
+
+
+class FakeAWSClient(FakeBackend):
+    """Mimics the boto3 ``secretsmanager`` client calls used by the provider."""
+
+    exceptions = SimpleNamespace(ResourceNotFoundException=ResourceNotFoundException)
+
+    def _throttled(self, operation: str) -> Exception:
+        return ClientError(
+            {"Error": {"Code": "ThrottlingException", "Message": "Rate exceeded"}},
+            operation,
+        )
+
+    def _not_found(self, operation: str) -> ClientError:
+        return ResourceNotFoundException(
+            {"Error": {"Code": "ResourceNotFoundException", "Message": "missing"}},
+            operation,
+        )
+
+    def get_secret_value(self, SecretId: str, **kwargs) -> dict:
+        self._charge("GetSecretValue")
+        if SecretId not in self.secrets:
+            raise self._not_found("GetSecretValue")
+        return {
+            "Name": SecretId,
+            "SecretString": self._payload(SecretId),
+            "VersionId": self._version(SecretId),
+        }
+
+    def describe_secret(self, SecretId: str) -> dict:
+        self._charge("DescribeSecret")
+        if SecretId not in self.secrets:
+            raise self._not_found("DescribeSecret")
+        return {
+            "Name": SecretId,
+            "VersionIdsToStages": {self._version(SecretId): ["AWSCURRENT"]},
+        }
+
+    def batch_get_secret_value(self, SecretIdList, **kwargs) -> dict:
+        self._charge("BatchGetSecretValue")
+        values, errors = [], []
+        for secret_id in SecretIdList:
+            if secret_id in self.secrets:
+                values.append(
+                    {
+                        "Name": secret_id,
+                        "SecretString": self._payload(secret_id),
+                        "VersionId": self._version(secret_id),
+                    }
+                )
+            else:
+                errors.append(
+                    {"SecretId": secret_id, "ErrorCode": "ResourceNotFoundException"}
+                )
+        return {"SecretValues": values, "Errors": errors}
+
+    def list_secrets(self, MaxResults: int = 100, Filters=(), NextToken=None) -> dict:
+        self._charge("ListSecrets")
+        prefix = next((f["Values"][0] for f in Filters if f["Key"] == "name"), "")
+        names = sorted(name for name in self.secrets if name.startswith(prefix))
+        start = int(NextToken or 0)
+        page = names[start : start + MaxResults]
+        response: dict = {"SecretList": [{"Name": name} for name in page]}
+        if start + MaxResults < len(names):
+            response["NextToken"] = str(start + MaxResults)
+        return response
+
+    def put_secret_value(self, SecretId: str, SecretString: str) -> dict:
+        self._charge("PutSecretValue")
+        if SecretId not in self.secrets:
+            raise self._not_found("PutSecretValue")
+        self.secrets[SecretId] = SecretString
+        self.versions.pop(SecretId, None)
+        return {}
+
+    def create_secret(self, Name: str, SecretString: str) -> dict:
+        self._charge("CreateSecret")
+        self.secrets[Name] = SecretString
+        return {}
+
+    def delete_secret(self, SecretId: str, **kwargs) -> dict:
+        self._charge("DeleteSecret")
+        self.secrets.pop(SecretId, None)
+        return {}
+
+
+class FakeGCPClient(FakeBackend):
+    """Mimics the ``SecretManagerServiceClient`` calls used by the provider."""
+
+    def _throttled(self, operation: str) -> Exception:
+        return gcp_exceptions.ResourceExhausted(f"{operation}: quota exceeded")
+
+    @staticmethod
+    def _secret_id(name: str) -> str:
+        # projects/<p>/secrets/<id>[/versions/<v>]
+        return name.split("/")[3]
+
+    def access_secret_version(self, request: dict) -> SimpleNamespace:
+        self._charge("AccessSecretVersion")
+        secret_id = self._secret_id(request["name"])
+        if secret_id not in self.secrets:
+            raise gcp_exceptions.NotFound(f"Secret {secret_id} not found")
+        parent = request["name"].rsplit("/versions/", 1)[0]
+        return SimpleNamespace(
+            name=f"{parent}/versions/{self._version(secret_id)}",
+            payload=SimpleNamespace(data=self._payload(secret_id).encode("UTF-8")),
+        )
+
+    def get_secret_version(self, request: dict) -> SimpleNamespace:
+        self._charge("GetSecretVersion")
+        secret_id = self._secret_id(request["name"])
+        if secret_id not in self.secrets:
+            raise gcp_exceptions.NotFound(f"Secret {secret_id} not found")
+        parent = request["name"].rsplit("/versions/", 1)[0]
+        return SimpleNamespace(name=f"{parent}/versions/{self._version(secret_id)}")
+
+    def list_secrets(self, request: dict) -> SimpleNamespace:
+        """Return the page at ``request["page_token"]``, like a pager's response."""
+        prefix = request.get("filter", "").partition("name:")[2]
+        names, token = self._page(prefix, request.get("page_token"), "ListSecrets")
+        return SimpleNamespace(
+            secrets=[
+                SimpleNamespace(name=f"{request['parent']}/secrets/{name}")
+                for name in names
+            ],
+            next_page_token=token or "",
+        )
+
+    def get_secret(self, request: dict) -> SimpleNamespace:
+        self._charge("GetSecret")
+        if self._secret_id(request["name"]) not in self.secrets:
+            raise gcp_exceptions.NotFound("Secret not found")
+        return SimpleNamespace(name=request["name"])
+
+    def create_secret(self, request: dict) -> SimpleNamespace:
+        self._charge("CreateSecret")
+        self.secrets.setdefault(request["secret_id"], "")
+        return SimpleNamespace(
+            name=f"{request['parent']}/secrets/{request['secret_id']}"
+        )
+
+    def add_secret_version(self, request: dict) -> SimpleNamespace:
+        self._charge("AddSecretVersion")
+        secret_id = self._secret_id(request["parent"])
+        self.secrets[secret_id] = request["payload"]["data"].decode("UTF-8")
+        self.versions.pop(secret_id, None)
+        return SimpleNamespace(
+            name=f"{request['parent']}/versions/{self._version(secret_id)}"
+        )
+
+    def delete_secret(self, request: dict) -> None:
+        self._charge("DeleteSecret")
+        secret_id = self._secret_id(request["name"])
+        if self.secrets.pop(secret_id, None) is None:
+            raise gcp_exceptions.NotFound(f"Secret {secret_id} not found")
+
+
+class FakePageIterator:
+    """Mimics azure.core's ``PageIterator``: one backend call per page.
+
+    After each page, ``continuation_token`` holds the token of the next one.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[Optional[str]], Tuple[List[Any], Optional[str]]],
+        continuation_token: Optional[str] = None,
+    ):
+        self._fetch = fetch
+        self.continuation_token = continuation_token
+        self._done = False
+
+    def __iter__(self) -> "FakePageIterator":
+        return self
+
+    def __next__(self) -> Iterator[Any]:
+        if self._done:
+            raise StopIteration
+        page, self.continuation_token = self._fetch(self.continuation_token)
+        self._done = self.continuation_token is None
+        return iter(page)
+
+
+class FakeAzureClient(FakeBackend):
+    """Mimics the Key Vault ``SecretClient`` calls used by the provider."""
+
+    def _throttled(self, operation: str) -> Exception:
+        error = HttpResponseError(f"{operation}: too many requests")
+        error.status_code = 429
+        return error
+
+    def get_secret(self, name: str, version: Optional[str] = None) -> SimpleNamespace:
+        self._charge("GetSecret")
+        if name not in self.secrets:
+            raise ResourceNotFoundError(f"Secret {name} not found")
+        return SimpleNamespace(
+            name=name,
+            value=self._payload(name),
+            properties=SimpleNamespace(version=self._version(name)),
+        )
+
+    def list_properties_of_secrets(self) -> SimpleNamespace:
+        """Return an ``ItemPaged`` stand-in; only ``by_page`` is supported."""
+        return SimpleNamespace(
+            by_page=lambda continuation_token=None: FakePageIterator(
+                self._properties_page, continuation_token
+            )
+        )
+
+    def _properties_page(
+        self, token: Optional[str]
+    ) -> Tuple[List[SimpleNamespace], Optional[str]]:
+        names, token = self._page("", token, "ListSecretProperties")
+        return [SimpleNamespace(name=name, enabled=True) for name in names], token
+
+    def set_secret(self, name: str, value: str) -> SimpleNamespace:
+        self._charge("SetSecret")
+        self.secrets[name] = value
+        self.versions.pop(name, None)
+        return SimpleNamespace(
+            name=name,
+            value=value,
+            properties=SimpleNamespace(version=self._version(name)),
+        )
+
+    def begin_delete_secret(self, name: str) -> None:
+        self._charge("DeleteSecret")
+        if self.secrets.pop(name, None) is None:
+            raise ResourceNotFoundError(f"Secret {name} not found")
@@ -0,0 +1,50 @@
+"""Compare SecretManager construction with and without shared SDK clients.
+
+Run with ``python -m benchmarks.bench_client_reuse``. Builds several AWS
+managers per iteration, as a process with several libraries would. Client
+construction makes no network calls, so this measures only credential,
+endpoint and connection-pool setup.
+"""
+
+from statistics import median
+
+from benchmarks.common import emit, parse_args, timer
+from cloud_secrets import SecretManager
+from cloud_secrets.common.clients import client_registry
+
+MANAGERS = 10
+
+
+def build(share_client: bool) -> float:
+    client_registry.clear()
+    with timer() as elapsed:
+        for _ in range(MANAGERS):
+            SecretManager(
+                provider_type="aws",
+                region_name="us-east-1",
+                share_client=share_client,
+            )
+    return elapsed["seconds"]
+
+
+def main() -> None:
+    args = parse_args(__doc__.splitlines()[0])
+    iterations = 3 if args.quick else 10
+    private = median(build(False) for _ in range(iterations))
+    shared = median(build(True) for _ in range(iterations))
+    build(True)
+    emit(
+        "client_reuse",
+        {
+            "managers": MANAGERS,
+            "private_clients_median_seconds": private,
+            "shared_clients_median_seconds": shared,
+            "speedup": private / shared,
+            "registry": client_registry.stats(),
+        },
+        args,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Compare cold-start secret loading with and without the encrypted disk cache.
+
+Run with ``python -m benchmarks.bench_cold_start``. Each iteration simulates a
+fresh process: a new provider (and a new EncryptedDiskCache loaded from the
+file) reads every secret once against a stand-in AWS backend with fixed
+per-call latency.
+"""
+
+import tempfile
+from pathlib import Path
+from statistics import median
+
+from benchmarks.backends import FakeAWSClient
+from benchmarks.common import emit, parse_args, timer
+from cloud_secrets.common.disk_cache import EncryptedDiskCache
+from cloud_secrets.providers.aws_provider import AWSSecretsProvider
+
+SECRET_COUNT = 50
+
+
+def make_provider(backend: FakeAWSClient, **kwargs) -> AWSSecretsProvider:
+    provider = AWSSecretsProvider(region_name="us-east-1", export_env=False, **kwargs)
+    provider.client = backend
+    return provider
+
+
+def cold_start(backend: FakeAWSClient, names, disk_cache=None) -> float:
+    provider = make_provider(backend, disk_cache=disk_cache)
+    with timer() as elapsed:
+        for name in names:
+            provider.get_secret(name)
+    provider.wait_revalidated()
+    return elapsed["seconds"]
+
+
+def main() -> None:
+    args = parse_args(__doc__.splitlines()[0])
+    iterations = 3 if args.quick else 10
+    latency = 0.002 if args.quick else 0.01
+    names = [f"SECRET_{i}" for i in range(SECRET_COUNT)]
+    backend = FakeAWSClient({name: f"value-{name}" for name in names}, latency)
+
+    without = [cold_start(backend, names) for _ in range(iterations)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "secrets.cache"
+        key = EncryptedDiskCache.generate_key()
+        # Warm the file once, as a previous process would have
+        warm = EncryptedDiskCache(path, key=key)
+        cold_start(backend, names, disk_cache=warm)
+        warm.flush()
+
+        with_cache = []
+        for _ in range(iterations):
+            with timer() as load:
+                disk_cache = EncryptedDiskCache(path, key=key)
+            with_cache.append(load["seconds"] + cold_start(backend, names, disk_cache))
+
+    emit(
+        "cold_start",
+        {
+            "secrets": SECRET_COUNT,
+            "backend_latency_seconds": latency,
+            "without_disk_cache_median_seconds": median(without),
+            "with_disk_cache_median_seconds": median(with_cache),
+            "speedup": median(without) / median(with_cache),
+        },
+        args,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Measure how much a version check saves when refreshing mostly unchanged secrets.
+
+Run with ``python -m benchmarks.bench_conditional_refresh``. A set of large
+secrets is fetched once, then refreshed for several rounds while a tenth of
+them are rotated between rounds. Each round is done twice against the AWS and
+GCP stand-ins: by re-downloading every value, and with ``refresh_if_changed``,
+which checks the current version first. Reports payload bytes and backend calls
+for both, and the wall time of a round.
+"""
+
+from benchmarks.bench_providers import cloud_factory
+from benchmarks.common import emit, parse_args, timer
+
+
+def run(build, names, rounds, conditional):
+    manager = build()
+    backend = manager.provider.client
+    for name in names:
+        manager.get_secret(name)
+    backend.calls = backend.bytes_served = 0
+
+    seconds = 0.0
+    for round_number in range(rounds):
+        for name in names[round_number % 10 :: 10]:
+            backend.rotate(name, f"{name}-{round_number}-" + "y" * 4096)
+        with timer() as elapsed:
+            for name in names:
+                if conditional:
+                    manager.refresh_if_changed(name)
+                else:
+                    manager.provider._cache_set(
+                        name, manager.provider._coalesced_fetch(name)
+                    )
+        seconds += elapsed["seconds"]
+    return {
+        "bytes": backend.bytes_served,
+        "calls": backend.calls,
+        "round_ms": seconds / rounds * 1000,
+    }
+
+
+def main() -> None:
+    args = parse_args(__doc__.splitlines()[0])
+    secret_count = 50 if args.quick else 200
+    rounds = 5 if args.quick else 20
+    latency = 0.0002 if args.quick else 0.001
+    names = [f"SECRET_{i}" for i in range(secret_count)]
+    secrets = {name: f"{name}-" + "x" * 4096 for name in names}
+
+    metrics = {"secrets": secret_count, "rounds": rounds}
+    for provider_type in ("aws", "gcp"):
+        build = cloud_factory(provider_type, secrets, latency)
+        for mode, conditional in (("full", False), ("conditional", True)):
+            result = run(build, names, rounds, conditional)
+            for key, value in result.items():
+                metrics[f"{provider_type}_{mode}_{key}"] = value
+        # Share of the full download still transferred; lower is better
+        metrics[f"{provider_type}_bytes_fraction"] = (
+            metrics[f"{provider_type}_conditional_bytes"]
+            / metrics[f"{provider_type}_full_bytes"]
+        )
+    emit("conditional_refresh", metrics, args)
+
+
+if __name__ == "__main__":
+    main()
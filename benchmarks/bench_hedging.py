@@ -0,0 +1,60 @@
+"""Measure AWS read latency with and without hedging to a replica region.
+
+Run with ``python -m benchmarks.bench_hedging``. The primary stand-in answers
+most calls quickly but a few percent of them very slowly, as during a regional
+incident; the replica has a steady, slightly higher latency. Reports p50, p99
+and max latency of uncached reads for both modes, plus how many hedges were
+issued and won.
+"""
+
+from benchmarks.backends import FakeAWSClient
+from benchmarks.common import emit, parse_args, percentile, timer
+from cloud_secrets.providers.aws_provider import AWSSecretsProvider
+
+
+def run(names, reads, hedged, latency, tail_latency):
+    secrets = {name: f"value-{name}" for name in names}
+    primary = FakeAWSClient(
+        secrets, latency, tail_latency=tail_latency, tail_fraction=0.05
+    )
+    options = {}
+    if hedged:
+        replica = FakeAWSClient(secrets, latency * 2, seed=1)
+        options = {
+            "replica_clients": {"us-west-2": replica},
+            "hedge_delay": latency * 4,
+        }
+    provider = AWSSecretsProvider(export_env=False, share_client=False, **options)
+    provider.client = primary
+
+    samples = []
+    for i in range(reads):
+        with timer() as elapsed:
+            provider.get_secret(names[i % len(names)])
+        samples.append(elapsed["seconds"])
+    stats = provider.backend_stats()
+    return {
+        "p50_ms": percentile(samples, 50) * 1000,
+        "p99_ms": percentile(samples, 99) * 1000,
+        "max_ms": max(samples) * 1000,
+        "hedges_issued": stats["hedges_issued"],
+        "hedges_won": stats["hedges_won"],
+    }
+
+
+def main() -> None:
+    args = parse_args(__doc__.splitlines()[0])
+    reads = 200 if args.quick else 2000
+    latency = 0.001 if args.quick else 0.002
+    tail_latency = 0.05 if args.quick else 0.2
+    names = [f"SECRET_{i}" for i in range(50)]
+
+    metrics = {"reads": reads, "tail_latency_ms": tail_latency * 1000}
+    for mode, hedged in (("unhedged", False), ("hedged", True)):
+        for key, value in run(names, reads, hedged, latency, tail_latency).items():
+            metrics[f"{mode}_{key}"] = value
+    emit("hedging", metrics, args)
+
+
+if __name__ == "__main__":
+    main()
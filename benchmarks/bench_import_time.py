@@ -0,0 +1,53 @@
+"""Measure import time of the package and of each provider via -X importtime.
+
+Run with ``python -m benchmarks.bench_import_time``. Each measurement runs in a
+fresh interpreter so earlier imports don't hide the cost of later ones.
+"""
+
+import subprocess
+import sys
+from statistics import median
+from typing import Dict
+
+from benchmarks.common import emit, parse_args
+
+SCENARIOS = {
+    "import_cloud_secrets": "import cloud_secrets",
+    "local_provider": "import cloud_secrets.providers.local_provider",
+    "aws_provider": "import cloud_secrets.providers.aws_provider",
+    "gcp_provider": "import cloud_secrets.providers.gcp_provider",
+    "azure_provider": "import cloud_secrets.providers.azure_provider",
+}
+
+
+def cumulative_us(code: str) -> Dict[str, int]:
+    """Return cumulative import time in microseconds per top-level import."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        # "import time: <self us> | <cumulative us> | <indented module name>"
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def main() -> None:
+    args = parse_args(__doc__.splitlines()[0])
+    runs = 3 if args.quick else 10
+    metrics = {}
+    for scenario, code in SCENARIOS.items():
+        module = code.split()[-1]
+        samples = [cumulative_us(code)[module] for _ in range(runs)]
+        metrics[f"{scenario}_median_ms"] = median(samples) / 1000
+    emit("import_time", metrics, args)
+
+
+if __name__ == "__main__":
+    main()
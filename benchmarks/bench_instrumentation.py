@@ -0,0 +1,61 @@
+"""Measure the cost of instrumentation hooks on cached secret reads.
+
+Run with ``python -m benchmarks.bench_instrumentation``. Times cached
+``get_secret`` calls three ways: the uninstrumented inner read
+(``_get_secret``, what ``get_secret`` did before hooks existed), ``get_secret``
+with no hooks registered, and ``get_secret`` feeding a ``MetricsRecorder``.
+"""
+
+from statistics import median
+
+from benchmarks.backends import FakeAWSClient
+from benchmarks.common import emit, parse_args, timer
+from cloud_secrets.common.instrumentation import MetricsRecorder
+from cloud_secrets.providers.aws_provider import AWSSecretsProvider
+
+
+def make_provider(**kwargs) -> AWSSecretsProvider:
+    provider = AWSSecretsProvider(
+        region_name="us-east-1", export_env=False, cache_ttl=3600, **kwargs
+    )
+    provider.client = FakeAWSClient({"API_KEY": "secret123"})
+    provider.get_secret("API_KEY")
+    return provider
+
+
+def ns_per_call(read, calls: int, rounds: int) -> float:
+    samples = []
+    for _ in range(rounds):
+        with timer() as elapsed:
+            for _ in range(calls):
+                read("API_KEY")
+        samples.append(elapsed["seconds"] / calls * 1e9)
+    return median(samples)
+
+
+def main() -> None:
+    args = parse_args(__doc__.splitlines()[0])
+    calls = 20_000 if args.quick else 200_000
+    rounds = 3 if args.quick else 7
+
+    plain = make_provider()
+    recorded = make_provider(hooks=[MetricsRecorder()])
+    baseline = ns_per_call(plain._get_secret, calls, rounds)
+    disabled = ns_per_call(plain.get_secret, calls, rounds)
+    enabled = ns_per_call(recorded.get_secret, calls, rounds)
+    emit(
+        "instrumentation",
+        {
+            "calls": calls,
+            "baseline_ns_per_call": baseline,
+            "hooks_disabled_ns_per_call": disabled,
+            "hooks_enabled_ns_per_call": enabled,
+            "disabled_overhead_pct": (disabled - baseline) / baseline * 100,
+            "enabled_overhead_pct": (enabled - baseline) / baseline * 100,
+        },
+        args,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""Measure a manage.py-style startup that defines 50 secrets but uses 5.
+
+Run with ``python -m benchmarks.bench_lazy``. A settings module is built
+against the AWS stand-in either with ``get_secret`` for every setting or with
+``lazy`` proxies, then a command reads five of the settings. Reports the time
+to import the settings, the time until the command has its values, and the
+backend calls made.
+"""
+
+from benchmarks.bench_providers import cloud_factory
+from benchmarks.common import emit, parse_args, timer
+
+DEFINED = 50
+USED = 5
+
+
+def settings_module(manager, lazy):
+    read = manager.lazy if lazy else manager.get_secret
+    return {f"SETTING_{i}": read(f"SECRET_{i}") for i in range(DEFINED)}
+
+
+def main() -> None:
+    args = parse_args(__doc__.splitlines()[0])
+    latency = 0.001 if args.quick else 0.005
+    secrets = {f"SECRET_{i}": f"value-{i}" for i in range(DEFINED)}
+    build = cloud_factory("aws", secrets, latency)
+
+    metrics = {"defined": DEFINED, "used": USED, "backend_latency_ms": latency * 1000}
+    for mode, lazy in (("eager", False), ("lazy", True)):
+        manager = build()
+        with timer() as total:
+            with timer() as startup:
+                settings = settings_module(manager, lazy)
+            used = [str(settings[f"SETTING_{i * 10}"]) for i in range(USED)]
+        assert used == [f"value-{i * 10}" for i in range(USED)]
+        metrics[f"{mode}_settings_import_ms"] = startup["seconds"] * 1000
+        metrics[f"{mode}_command_ms"] = total["seconds"] * 1000
+        metrics[f"{mode}_backend_calls"] = manager.provider.client.calls
+    emit("lazy", metrics, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Measure loading a namespace with ``iter_secrets`` against reading names one by one.
+
+Run with ``python -m benchmarks.bench_listing``. The AWS, GCP and Azure
+stand-ins hold several namespaces; one of them is loaded either by calling
+``get_secret`` for each known name, or by listing the prefix with
+``iter_secrets(include_values=True)``. Reports wall time and backend calls for
+both, and how soon the first name of a full listing arrives, since pages are
+requested lazily.
+"""
+
+from benchmarks.bench_providers import cloud_factory
+from benchmarks.common import emit, parse_args, timer
+
+
+def main() -> None:
+    args = parse_args(__doc__.splitlines()[0])
+    per_namespace = 50 if args.quick else 200
+    latency = 0.0005 if args.quick else 0.002
+    # Azure names can't contain "/"
+    separator = {"aws": "/", "gcp": "_", "azure": "-"}
+
+    metrics = {"secrets_per_namespace": per_namespace, "namespaces": 5}
+    for provider_type, sep in separator.items():
+        namespaces = [f"app{i}{sep}prod{sep}" for i in range(5)]
+        secrets = {
+            f"{namespace}KEY_{i}": f"value-{i}"
+            for namespace in namespaces
+            for i in range(per_namespace)
+        }
+        build = cloud_factory(provider_type, secrets, latency)
+        prefix = namespaces[2]
+        names = sorted(name for name in secrets if name.startswith(prefix))
+
+        manager = build()
+        with timer() as one_by_one:
+            for name in names:
+                manager.get_secret(name)
+        calls = manager.provider.client.calls
+
+        manager = build()
+        with timer() as listed:
+            loaded = dict(manager.iter_secrets(prefix, include_values=True))
+        assert len(loaded) == len(names), len(loaded)
+
+        stream = build().iter_secrets()
+        with timer() as first:
+            next(stream)
+
+        metrics[f"{provider_type}_one_by_one_ms"] = one_by_one["seconds"] * 1000
+        metrics[f"{provider_type}_one_by_one_calls"] = calls
+        metrics[f"{provider_type}_iter_secrets_ms"] = listed["seconds"] * 1000
+        metrics[f"{provider_type}_iter_secrets_calls"] = manager.provider.client.calls
+        metrics[f"{provider_type}_first_name_ms"] = first["seconds"] * 1000
+    emit("listing", metrics, args)
+
+
+if __name__ == "__main__":
+    main()
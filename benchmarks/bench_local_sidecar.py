@@ -0,0 +1,54 @@
+"""Measure local provider read and write latency with a large sidecar.
+
+Run with ``python -m benchmarks.bench_local_sidecar``. A ``.secrets.json`` with
+many secrets is imported, then uncached reads and ``set_secret`` calls are
+timed; both should stay flat as the secret count grows.
+"""
+
+import json
+import tempfile
+from pathlib import Path
+
+from benchmarks.common import emit, parse_args, timer
+from cloud_secrets.providers.local_provider import LocalEnvProvider
+
+
+def main() -> None:
+    args = parse_args(__doc__.splitlines()[0])
+    secret_count = 1000 if args.quick else 10000
+    operations = 200 if args.quick else 1000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        env_path = Path(tmp) / ".env"
+        env_path.write_text("APP_NAME=bench\n")
+        secrets = {f"SECRET_{i}": f"value-{i}" for i in range(secret_count)}
+        (Path(tmp) / ".secrets.json").write_text(json.dumps(secrets, indent=2))
+
+        provider = LocalEnvProvider(env_path=str(env_path), export_env=False)
+        with timer() as first_read:
+            provider.get_secret("SECRET_0")
+        with timer() as reads:
+            for i in range(operations):
+                provider.get_secret(f"SECRET_{i % secret_count}")
+        with timer() as writes:
+            for i in range(operations):
+                provider.set_secret(f"SECRET_{i % secret_count}", f"updated-{i}")
+        with timer() as compaction:
+            provider.compact()
+
+    emit(
+        "local_sidecar",
+        {
+            "secrets": secret_count,
+            "operations": operations,
+            "initial_load_seconds": first_read["seconds"],
+            "read_mean_seconds": reads["seconds"] / operations,
+            "write_mean_seconds": writes["seconds"] / operations,
+            "compaction_seconds": compaction["seconds"],
+        },
+        args,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""Measure every provider through SecretManager against local stand-in backends.
+
+Run with ``python -m benchmarks.bench_providers``. AWS, GCP and Azure talk to
+the in-process fakes in ``benchmarks.backends`` with a fixed per-call latency;
+the local provider reads a large ``.env`` plus a large ``.secrets.json``. For
+each provider this reports single-read latency (uncached and cached), batch
+and concurrent throughput, and the memory held per cached secret. Import time
+is measured separately by ``bench_import_time``.
+"""
+
+import json
+import tempfile
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Callable, Dict, List
+from unittest.mock import patch
+
+from benchmarks.backends import FakeAWSClient, FakeAzureClient, FakeGCPClient
+from benchmarks.common import emit, parse_args, percentile, timer
+from cloud_secrets import SecretManager
+from cloud_secrets.providers.gcp_provider import GCPSecretsProvider
+
+THREADS = 8
+
+
+def cloud_factory(provider_type: str, secrets: Dict[str, str], latency: float):
+    """Return a callable building a manager wired to a fresh stand-in backend."""
+    fake_cls, options = {
+        "aws": (FakeAWSClient, {"region_name": "us-east-1"}),
+        "gcp": (FakeGCPClient, {"project_id": "bench"}),
+        "azure": (
+            FakeAzureClient,
+            {"vault_url": "https://bench.vault.azure.net/", "credentials": object()},
+        ),
+    }[provider_type]
+
+    def build(**kwargs) -> SecretManager:
+        backend = fake_cls(secrets, latency)
+        with ExitStack() as stack:
+            if provider_type == "gcp":
+                stack.enter_context(
+                    patch.object(
+                        GCPSecretsProvider, "_create_client", lambda *a: backend
+                    )
+                )
+            if provider_type == "azure":
+                stack.enter_context(
+                    patch(
+                        "cloud_secrets.providers.azure_provider.SecretClient",
+                        lambda **kw: backend,
+                    )
+                )
+            manager = SecretManager(
+                provider_type=provider_type,
+                export_env=False,
+                share_client=False,
+                **options,
+                **kwargs,
+            )
+        manager.provider.client = backend
+        return manager
+
+    return build
+
+
+def local_factory(tmp: Path, secrets: Dict[str, str], env_lines: int):
+    env_path = tmp / ".env"
+    env_path.write_text("".join(f"ENV_{i}=value-{i}\n" for i in range(env_lines)))
+    (tmp / ".secrets.json").write_text(json.dumps(secrets))
+
+    def build(**kwargs) -> SecretManager:
+        return SecretManager(
+            provider_type="local", env_path=str(env_path), export_env=False, **kwargs
+        )
+
+    return build
+
+
+def measure(build: Callable[..., SecretManager], names: List[str], reads: int):
+    # Single reads without a cache: every call reaches the backend
+    manager = build()
+    samples = []
+    for i in range(reads):
+        with timer() as elapsed:
+            manager.get_secret(names[i % len(names)])
+        samples.append(elapsed["seconds"])
+
+    cached = build(cache_ttl=3600, cache_max_size=len(names))
+    cached.get_secret(names[0])
+    cached_samples = []
+    for _ in range(reads):
+        with timer() as elapsed:
+            cached.get_secret(names[0])
+        cached_samples.append(elapsed["seconds"])
+
+    with timer() as batch:
+        _, errors = build().get_secrets(names)
+    assert not errors, errors
+
+    concurrent = build()
+    with timer() as threaded:
+        with ThreadPoolExecutor(max_workers=THREADS) as pool:
+            list(pool.map(concurrent.get_secret, (names * 2)[:reads]))
+
+    memory = build(cache_ttl=3600, cache_max_size=len(names))
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    for name in names:
+        memory.get_secret(name)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    held = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+
+    return {
+        "get_p50_ms": percentile(samples, 50) * 1000,
+        "get_p99_ms": percentile(samples, 99) * 1000,
+        "cached_get_p50_us": percentile(cached_samples, 50) * 1e6,
+        "batch_secrets_per_second": len(names) / batch["seconds"],
+        "concurrent_reads_per_second": reads / threaded["seconds"],
+        "bytes_per_cached_secret": held / len(names),
+    }
+
+
+def main() -> None:
+    args = parse_args(__doc__.splitlines()[0])
+    secret_count = 100 if args.quick else 500
+    reads = 200 if args.quick else 1000
+    latency = 0.0005 if args.quick else 0.002
+    names = [f"SECRET_{i}" for i in range(secret_count)]
+    secrets = {name: f"value-{name}-" + "x" * 64 for name in names}
+
+    metrics = {"secrets": secret_count, "backend_latency_ms": latency * 1000}
+    with tempfile.TemporaryDirectory() as tmp:
+        factories = {
+            "aws": cloud_factory("aws", secrets, latency),
+            "gcp": cloud_factory("gcp", secrets, latency),
+            "azure": cloud_factory("azure", secrets, latency),
+            "local": local_factory(Path(tmp), secrets, env_lines=secret_count * 10),
+        }
+        for provider_type, build in factories.items():
+            for key, value in measure(build, names, reads).items():
+                metrics[f"{provider_type}_{key}"] = value
+    emit("providers", metrics, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Compare a deploy-time burst against a quota with and without a rate limiter.
+
+Run with ``python -m benchmarks.bench_rate_limit``. Several workers, each with
+its own provider as separate processes would have, read every secret at once
+from a stand-in AWS backend that answers ``ThrottlingException`` beyond its
+per-second quota. Without a limiter the workers rely on retries; with one
+they share a process-wide token bucket whose rate plus burst stays under the
+quota.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.backends import FakeAWSClient
+from benchmarks.common import emit, parse_args, timer
+from cloud_secrets.common.exceptions import CloudSecretsError
+from cloud_secrets.common.rate_limit import rate_limiters
+from cloud_secrets.providers.aws_provider import AWSSecretsProvider
+
+WORKERS = 8
+
+
+def deploy(backend: FakeAWSClient, names, **kwargs) -> dict:
+    rate_limiters.clear()
+    providers = []
+    for _ in range(WORKERS):
+        provider = AWSSecretsProvider(
+            region_name="us-east-1", export_env=False, share_client=False, **kwargs
+        )
+        provider.client = backend
+        providers.append(provider)
+
+    def worker(provider: AWSSecretsProvider) -> int:
+        failures = 0
+        for name in names:
+            try:
+                provider.get_secret(name)
+            except CloudSecretsError:
+                failures += 1
+        return failures
+
+    with timer() as elapsed:
+        with ThreadPoolExecutor(max_workers=WORKERS) as pool:
+            failures = sum(pool.map(worker, providers))
+    return {
+        "seconds": elapsed["seconds"],
+        "backend_calls": backend.calls,
+        "throttled": backend.throttled,
+        "failed_reads": failures,
+        "retries": sum(p.backend_stats()["retries"] for p in providers),
+    }
+
+
+def main() -> None:
+    args = parse_args(__doc__.splitlines()[0])
+    quota = 50
+    secret_count = 20 if args.quick else 40
+    names = [f"SECRET_{i}" for i in range(secret_count)]
+
+    def backend() -> FakeAWSClient:
+        return FakeAWSClient({name: "value" for name in names}, quota=quota)
+
+    unlimited = deploy(backend(), names)
+    limited = deploy(
+        backend(),
+        names,
+        rate_limit=quota * 0.8,
+        rate_burst=quota // 10,
+        rate_limit_max_wait=30.0,
+        shared_rate_limit="aws-account",
+    )
+    emit(
+        "rate_limit",
+        {
+            "workers": WORKERS,
+            "reads": WORKERS * secret_count,
+            "quota_per_second": quota,
+            **{f"unlimited_{key}": value for key, value in unlimited.items()},
+            **{f"limited_{key}": value for key, value in limited.items()},
+        },
+        args,
+    )
+
+
+if __name__ == "__main__":
+    main()
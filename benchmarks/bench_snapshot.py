@@ -0,0 +1,62 @@
+"""Measure building settings from a namespace snapshot against one read per name.
+
+Run with ``python -m benchmarks.bench_snapshot``. Against the AWS stand-in,
+a settings module of typed values is built either with one ``get_secret`` per
+name or from ``load_namespace``, then read repeatedly from a cached provider
+and from the snapshot.
+"""
+
+from benchmarks.bench_providers import cloud_factory
+from benchmarks.common import emit, parse_args, percentile, timer
+
+PREFIX = "myapp/prod/"
+
+
+def main() -> None:
+    args = parse_args(__doc__.splitlines()[0])
+    count = 40 if args.quick else 100
+    reads = 2000 if args.quick else 20000
+    latency = 0.0005 if args.quick else 0.002
+    names = [f"{PREFIX}SETTING_{i}" for i in range(count)]
+    secrets = {name: str(i) for i, name in enumerate(names)}
+    secrets.update({f"otherapp/KEY_{i}": "x" for i in range(count)})
+    build = cloud_factory("aws", secrets, latency)
+
+    manager = build(cache_ttl=3600, cache_max_size=len(secrets))
+    with timer() as individual:
+        for name in names:
+            manager.get_secret(name, cast_type="int")
+    individual_calls = manager.provider.client.calls
+
+    snapshot_manager = build()
+    with timer() as bulk:
+        snapshot = snapshot_manager.load_namespace(PREFIX, strip_prefix=True)
+    assert len(snapshot) == count
+
+    keys = list(snapshot)
+    cached_samples, snapshot_samples = [], []
+    for i in range(reads):
+        with timer() as elapsed:
+            manager.get_secret(names[i % count], cast_type="int")
+        cached_samples.append(elapsed["seconds"])
+        with timer() as elapsed:
+            snapshot.get_int(keys[i % count])
+        snapshot_samples.append(elapsed["seconds"])
+
+    emit(
+        "snapshot",
+        {
+            "secrets": count,
+            "individual_load_ms": individual["seconds"] * 1000,
+            "individual_load_calls": individual_calls,
+            "namespace_load_ms": bulk["seconds"] * 1000,
+            "namespace_load_calls": snapshot_manager.provider.client.calls,
+            "cached_get_int_p50_us": percentile(cached_samples, 50) * 1e6,
+            "snapshot_get_int_p50_us": percentile(snapshot_samples, 50) * 1e6,
+        },
+        args,
+    )
+
+
+if __name__ == "__main__":
+    main()
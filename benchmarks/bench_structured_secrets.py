@@ -0,0 +1,74 @@
+"""Compare per-fetch CPU cost of JSON secrets: env flattening vs structured model.
+
+Run with ``python -m benchmarks.bench_structured_secrets``. Uncached fetches of
+one JSON secret against a zero-latency stand-in backend, measured in process
+CPU time. ``legacy`` re-creates the previous behaviour of rebuilding a
+``KEY=VAL`` blob and running it through ``read_env`` on every fetch.
+"""
+
+import io
+import json
+import time
+
+from benchmarks.backends import FakeAWSClient
+from benchmarks.common import emit, parse_args
+from cloud_secrets.providers.aws_provider import AWSSecretsProvider
+
+FIELDS = 40
+
+
+class LegacyAWSProvider(AWSSecretsProvider):
+    """Destructures every fetched JSON secret through read_env, as before."""
+
+    def _publish(self, secret_name: str, value: str) -> None:
+        try:
+            secret_data = json.loads(value)
+        except json.JSONDecodeError:
+            secret_data = None
+        with self.store.lock:
+            if isinstance(secret_data, dict):
+                content = "\n".join(f"{key}={val}" for key, val in secret_data.items())
+                self.env.read_env(io.StringIO(content))
+            self.store[secret_name] = value
+
+
+def fetch_cpu(provider: AWSSecretsProvider, fetches: int, **kwargs) -> float:
+    start = time.process_time()
+    for _ in range(fetches):
+        provider.get_secret("APP_CONFIG", **kwargs)
+    return (time.process_time() - start) / fetches
+
+
+def main() -> None:
+    args = parse_args(__doc__.splitlines()[0])
+    fetches = 500 if args.quick else 5000
+    secret = json.dumps({f"SETTING_{i}": f"value-{i}" for i in range(FIELDS)})
+    backend = FakeAWSClient({"APP_CONFIG": secret})
+
+    def make(cls=AWSSecretsProvider, **kwargs):
+        provider = cls(export_env=False, share_client=False, **kwargs)
+        provider.client = backend
+        return provider
+
+    legacy = fetch_cpu(make(LegacyAWSProvider), fetches)
+    structured = fetch_cpu(make(), fetches)
+    field = fetch_cpu(make(), fetches, field="SETTING_7")
+    flattened = fetch_cpu(make(flatten_env=True), fetches)
+
+    emit(
+        "structured_secrets",
+        {
+            "fields": FIELDS,
+            "fetches": fetches,
+            "legacy_cpu_seconds_per_fetch": legacy,
+            "structured_cpu_seconds_per_fetch": structured,
+            "field_access_cpu_seconds_per_fetch": field,
+            "flatten_env_cpu_seconds_per_fetch": flattened,
+            "speedup": legacy / structured,
+        },
+        args,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Stress LocalEnvProvider with many threads doing mixed get/set/delete.
+
+Run with ``python -m benchmarks.bench_thread_safety``. Each thread owns a set
+of keys, so after the run every surviving key must hold the last value its
+thread wrote; any mismatch is a lost update.
+"""
+
+import random
+import tempfile
+import threading
+from pathlib import Path
+
+from benchmarks.common import emit, parse_args, timer
+from cloud_secrets.providers.local_provider import LocalEnvProvider
+
+
+def run(threads: int, ops_per_thread: int, export_env: bool) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        env_path = Path(tmp) / ".env"
+        env_path.write_text("SEED=1\n")
+        provider = LocalEnvProvider(env_path=str(env_path), export_env=export_env)
+        expected = [{} for _ in range(threads)]
+        errors = []
+
+        def worker(index: int) -> None:
+            rng = random.Random(index)
+            keys = [f"STRESS_{index}_{k}" for k in range(5)]
+            try:
+                for op in range(ops_per_thread):
+                    key = rng.choice(keys)
+                    roll = rng.random()
+                    if roll < 0.5:
+                        value = f"{index}-{op}"
+                        provider.set_secret(key, value)
+                        expected[index][key] = value
+                    elif roll < 0.6:
+                        provider.delete_secret(key)
+                        expected[index].pop(key, None)
+                    elif key in expected[index]:
+                        provider.get_secret(key)
+            except Exception as e:  # pragma: no cover - reported below
+                errors.append(e)
+
+        pool = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+        with timer() as elapsed:
+            for thread in pool:
+                thread.start()
+            for thread in pool:
+                thread.join()
+
+        stored = provider._load_secrets_file()
+        lost = sum(
+            1
+            for owned in expected
+            for key, value in owned.items()
+            if stored.get(key) != value
+        )
+        total = threads * ops_per_thread
+        return {
+            "threads": threads,
+            "operations": total,
+            "seconds": elapsed["seconds"],
+            "ops_per_second": total / elapsed["seconds"],
+            "lost_updates": lost,
+            "errors": len(errors),
+        }
+
+
+def main() -> None:
+    args = parse_args(__doc__.splitlines()[0])
+    ops = 20 if args.quick else 200
+    metrics = {}
+    for export_env in (True, False):
+        label = "export_env" if export_env else "private_store"
+        for key, value in run(16, ops, export_env).items():
+            metrics[f"{label}.{key}"] = value
+    emit("thread_safety", metrics, args)
+
+
+if __name__ == "__main__":
+    main()
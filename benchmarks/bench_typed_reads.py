@@ -0,0 +1,60 @@
+"""Compare typed reads with and without the cast memo.
+
+Run with ``python -m benchmarks.bench_typed_reads``. Reads a large
+``key=value;...`` dict secret, a list and an int in a hot loop from a cached
+local provider, so the measured cost is the casting, not the fetch.
+"""
+
+import tempfile
+from pathlib import Path
+
+from benchmarks.common import emit, parse_args, timer
+from cloud_secrets.common.cast_memo import CastMemo
+from cloud_secrets.providers.local_provider import LocalEnvProvider
+
+FIELDS = 50
+
+
+def read_loop(env_path: str, reads: int, **kwargs) -> float:
+    provider = LocalEnvProvider(
+        env_path=env_path, export_env=False, cache_ttl=3600, **kwargs
+    )
+    field_types = {f"field{i}": int for i in range(FIELDS)}
+    with timer() as elapsed:
+        for _ in range(reads):
+            provider.get_dict("CONFIG", field_types=field_types)
+            provider.get_list("HOSTS")
+            provider.get_int("PORT")
+    return elapsed["seconds"] / reads
+
+
+def main() -> None:
+    args = parse_args(__doc__.splitlines()[0])
+    reads = 500 if args.quick else 5000
+    with tempfile.TemporaryDirectory() as tmp:
+        env_path = Path(tmp) / ".env"
+        config = ";".join(f"field{i}={i}" for i in range(FIELDS))
+        hosts = ",".join(f"host{i}.example.com" for i in range(20))
+        env_path.write_text(f"CONFIG={config}\nHOSTS={hosts}\nPORT=8080\n")
+
+        without = read_loop(str(env_path), reads, memoize_casts=False)
+        copied = read_loop(str(env_path), reads)
+        read_only = read_loop(str(env_path), reads, cast_memo=CastMemo(read_only=True))
+
+    emit(
+        "typed_reads",
+        {
+            "reads": reads,
+            "dict_fields": FIELDS,
+            "without_memo_seconds_per_read": without,
+            "memo_seconds_per_read": copied,
+            "read_only_memo_seconds_per_read": read_only,
+            "speedup": without / copied,
+            "read_only_speedup": without / read_only,
+        },
+        args,
+    )
+
+
+if __name__ == "__main__":
+    main()
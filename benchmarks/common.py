@@ -0,0 +1,45 @@
+"""Shared helpers for the benchmark scripts."""
+
+import argparse
+import json
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List
+
+
+def parse_args(description: str) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--json", metavar="PATH", help="Write results to PATH as JSON")
+    parser.add_argument("--quick", action="store_true", help="Run a smaller workload")
+    return parser.parse_args()
+
+
+@contextmanager
+def timer() -> Iterator[Dict[str, float]]:
+    """Measure wall time of the block into ``result["seconds"]``."""
+    result: Dict[str, float] = {}
+    start = time.perf_counter()
+    try:
+        yield result
+    finally:
+        result["seconds"] = time.perf_counter() - start
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def emit(name: str, metrics: Dict[str, Any], args: argparse.Namespace) -> None:
+    """Print metrics and optionally write them as JSON."""
+    print(f"== {name}")
+    for key, value in metrics.items():
+        if isinstance(value, float):
+            value = f"{value:.6f}"
+        print(f"  {key}: {value}")
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"benchmark": name, "metrics": metrics}, f, indent=2)
@@ -0,0 +1,62 @@
+"""Compare two ``benchmarks.run_all`` result files metric by metric.
+
+Run with ``python -m benchmarks.compare baseline.json candidate.json``. Prints
+the relative change of every numeric metric present in both files and exits
+non-zero if any changed for the worse by more than ``--threshold`` percent.
+Metrics named ``*_per_second`` or ``speedup`` are better when higher; all
+others (latencies, sizes, counts of failures) are better when lower.
+"""
+
+import argparse
+import json
+import sys
+from typing import Dict, Iterator, Tuple
+
+HIGHER_IS_BETTER = ("_per_second", "speedup")
+
+
+def numeric_metrics(report: dict) -> Iterator[Tuple[str, float]]:
+    for benchmark, metrics in report["results"].items():
+        for key, value in metrics.items():
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                yield f"{benchmark}.{key}", float(value)
+
+
+def regression(key: str, old: float, new: float) -> float:
+    """Return how much worse ``new`` is than ``old``, in percent (<0 = better)."""
+    if old == 0:
+        return 0.0
+    change = (new - old) / abs(old) * 100
+    return -change if key.endswith(HIGHER_IS_BETTER) else change
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("--threshold", type=float, default=10.0)
+    args = parser.parse_args()
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.candidate) as f:
+        candidate = json.load(f)
+    new: Dict[str, float] = dict(numeric_metrics(candidate))
+
+    print(f"{baseline['version']} -> {candidate['version']}")
+    regressions = 0
+    for key, old in numeric_metrics(baseline):
+        if key not in new:
+            continue
+        worse = regression(key, old, new[key])
+        flag = ""
+        if worse > args.threshold:
+            regressions += 1
+            flag = "  REGRESSION"
+        change = (new[key] - old) / abs(old) * 100 if old else 0.0
+        print(f"  {key}: {old:.6g} -> {new[key]:.6g} ({change:+.1f}%){flag}")
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Run every benchmark and save the results as one JSON file.
+
+Run with ``python -m benchmarks.run_all --json results.json``. Each script runs
+in a fresh interpreter. The file records the package and Python versions, so
+results from two versions can be compared with ``benchmarks.compare``.
+"""
+
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tomllib
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+
+from benchmarks.common import parse_args
+
+BENCHMARKS = (
+    "bench_providers",
+    "bench_import_time",
+    "bench_cold_start",
+    "bench_client_reuse",
+    "bench_typed_reads",
+    "bench_structured_secrets",
+    "bench_local_sidecar",
+    "bench_thread_safety",
+    "bench_rate_limit",
+    "bench_instrumentation",
+    "bench_conditional_refresh",
+    "bench_hedging",
+    "bench_listing",
+    "bench_snapshot",
+    "bench_lazy",
+)
+
+
+def package_version() -> str:
+    try:
+        return version("cloud-secrets")
+    except PackageNotFoundError:
+        # Running from a checkout that isn't installed
+        pyproject = Path(__file__).resolve().parent.parent / "pyproject.toml"
+        with open(pyproject, "rb") as f:
+            return tomllib.load(f)["tool"]["poetry"]["version"]
+
+
+def main() -> None:
+    args = parse_args(__doc__.splitlines()[0])
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in BENCHMARKS:
+            out = Path(tmp) / f"{name}.json"
+            command = [sys.executable, "-m", f"benchmarks.{name}", "--json", str(out)]
+            if args.quick:
+                command.append("--quick")
+            print(f"-- {name}", flush=True)
+            subprocess.run(command, check=True)
+            results[name] = json.loads(out.read_text())["metrics"]
+
+    report = {
+        "version": package_version(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "quick": args.quick,
+        "results": results,
+    }
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
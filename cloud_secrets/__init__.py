@@ -1,7 +1,21 @@
 """Cloud Secrets Manager library."""
 
+from typing import TYPE_CHECKING
+
 from cloud_secrets.secret_manager import SecretManager
 
+if TYPE_CHECKING:
+    from cloud_secrets.async_secret_manager import AsyncSecretManager
+
 __version__ = "1.3.0"
 
-__all__ = ["SecretManager"]
+__all__ = ["AsyncSecretManager", "SecretManager"]
+
+
+def __getattr__(name: str):
+    # Keep asyncio out of the import for processes that only use SecretManager
+    if name == "AsyncSecretManager":
+        from cloud_secrets.async_secret_manager import AsyncSecretManager
+
+        return AsyncSecretManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,91 @@
+"""Asyncio Secret Manager implementation."""
+
+from typing import Any, Dict, Iterable, Mapping, Union
+
+from environ import Env
+
+from cloud_secrets.providers.async_base import (
+    AsyncBaseSecretProvider,
+    ThreadedAsyncProvider,
+)
+from cloud_secrets.providers.base import BaseSecretProvider, SecretBatch
+from cloud_secrets.providers.registry import ProviderSpec, load_provider_class
+
+
+class AsyncSecretManager:
+    """Asyncio counterpart of SecretManager for use inside an event loop.
+
+    GCP and Azure use the SDKs' native asyncio clients. AWS and local providers
+    have no asyncio client and run their blocking calls on a thread pool.
+    Providers are imported lazily, as for SecretManager; the entry-point group
+    is ``cloud_secrets.async_providers``.
+    """
+
+    PROVIDERS: Dict[str, ProviderSpec] = {
+        "aws": "cloud_secrets.providers.aws_provider:AWSSecretsProvider",
+        "gcp": "cloud_secrets.providers.async_gcp_provider:AsyncGCPSecretsProvider",
+        "azure": (
+            "cloud_secrets.providers.async_azure_provider:AsyncAzureSecretsProvider"
+        ),
+        "local": "cloud_secrets.providers.local_provider:LocalEnvProvider",
+    }
+    ENTRY_POINT_GROUP = "cloud_secrets.async_providers"
+
+    def __init__(self, provider_type: str, **kwargs):
+        """Initialize the secret manager with specified provider.
+
+        Args:
+            provider_type: Type of provider ('aws', 'gcp', 'azure', or 'local')
+            **kwargs: Provider-specific configuration options, as for SecretManager
+
+        Raises:
+            ConfigurationError: If provider type is invalid or configuration is incomplete
+        """
+        provider_class = load_provider_class(
+            provider_type, self.PROVIDERS, self.ENTRY_POINT_GROUP
+        )
+        provider = provider_class(**kwargs)
+        if isinstance(provider, BaseSecretProvider):
+            provider = ThreadedAsyncProvider(provider)
+        self.provider: AsyncBaseSecretProvider = provider
+
+    async def get_secret(self, secret_name: str, **kwargs) -> Any:
+        """Get a secret by name. Concurrent calls for one name share a fetch."""
+        return await self.provider.get_secret(secret_name, **kwargs)
+
+    async def get_secrets(
+        self,
+        secret_names: Iterable[str],
+        cast: Union[str, Mapping[str, str]] = "str",
+    ) -> SecretBatch:
+        """Get several secrets concurrently. See SecretManager.get_secrets."""
+        return await self.provider.get_secrets(secret_names, cast=cast)
+
+    async def set_secret(self, secret_name: str, secret_value: str) -> None:
+        """Create or update a secret."""
+        await self.provider.set_secret(secret_name, secret_value)
+
+    async def delete_secret(self, secret_name: str) -> None:
+        """Delete a secret. No-op if it doesn't exist."""
+        await self.provider.delete_secret(secret_name)
+
+    def invalidate(self, secret_name: str) -> None:
+        """Drop a cached secret so the next read goes to the provider."""
+        self.provider.invalidate(secret_name)
+
+    def clear_cache(self) -> None:
+        """Drop every cached secret."""
+        self.provider.clear_cache()
+
+    def get_env(self) -> Env:
+        return self.provider.get_env()
+
+    async def close(self) -> None:
+        """Close the underlying client connections."""
+        await self.provider.close()
+
+    async def __aenter__(self) -> "AsyncSecretManager":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
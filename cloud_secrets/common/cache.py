@@ -0,0 +1,123 @@
+"""In-process secret cache."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from cloud_secrets.common.exceptions import ConfigurationError
+
+
+class SecretCache:
+    """Thread-safe LRU cache with a per-entry TTL.
+
+    Any object exposing ``get``, ``set``, ``invalidate`` and ``clear`` with the
+    same signatures can be passed to a provider in place of this class. With
+    ``keep_expired`` expired entries stay until evicted, so ``get_stale`` can
+    still return them.
+    """
+
+    def __init__(
+        self,
+        ttl: Optional[float] = 300.0,
+        max_size: int = 128,
+        clock: Callable[[], float] = time.monotonic,
+        keep_expired: bool = False,
+    ):
+        """Initialize the cache.
+
+        Args:
+            ttl: Default lifetime of an entry in seconds; ``None`` never expires
+            max_size: Maximum number of entries kept before evicting the LRU one
+            clock: Monotonic time source, overridable for tests
+            keep_expired: Leave expired entries in place for ``get_stale``
+        """
+        if max_size < 1:
+            raise ConfigurationError("Cache max_size must be at least 1")
+        self.ttl = ttl
+        self.max_size = max_size
+        self._clock = clock
+        self.keep_expired = keep_expired
+        self._entries: "OrderedDict[Hashable, Tuple[Any, Optional[float]]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return a fresh cached value, or ``default`` on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at is None or expires_at > self._clock():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                if not self.keep_expired:
+                    del self._entries[key]
+            self.misses += 1
+            return default
+
+    def get_stale(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value even if it has expired, or ``default``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return default if entry is None else entry[0]
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value, overriding the default TTL when ``ttl`` is given."""
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = None if ttl is None else self._clock() + ttl
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def ttl_remaining(self, key: Hashable) -> Optional[float]:
+        """Seconds until ``key`` expires; ``None`` if absent or never expiring."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] is None:
+                return None
+            return max(0.0, entry[1] - self._clock())
+
+    def invalidate(self, key: Hashable) -> bool:
+        """Drop a single entry. Returns whether it was present."""
+        with self._lock:
+            return self._entries.pop(key, None) is not None
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]) -> int:
+        """Drop every entry whose key matches ``predicate``. Returns the count."""
+        with self._lock:
+            keys = [key for key in self._entries if predicate(key)]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def clear(self) -> None:
+        """Drop every entry. Counters are kept."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss/eviction counters and the current size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+            }
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and (entry[1] is None or entry[1] > self._clock())
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,110 @@
+"""Memo of parsed secret values so typed reads don't re-parse unchanged strings."""
+
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from cloud_secrets.common.exceptions import ConfigurationError
+
+_MISSING = object()
+
+
+class CastMemo:
+    """LRU of cast results keyed by secret name, raw value and cast spec.
+
+    An entry is reused only while the secret's raw string is unchanged, so a
+    rotated value is re-parsed on its next read. Dicts and lists, including
+    nested ones, are returned as copies, or with ``read_only`` as read-only
+    mappings and tuples, so callers can't modify the memoized value.
+    """
+
+    def __init__(self, max_size: int = 256, read_only: bool = False):
+        if max_size < 1:
+            raise ConfigurationError("CastMemo max_size must be at least 1")
+        self.max_size = max_size
+        self.read_only = read_only
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[str, Hashable], Tuple[str, Any]]" = (
+            OrderedDict()
+        )
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_cast(
+        self, secret_name: str, raw: str, spec: Hashable, cast: Callable[[], Any]
+    ) -> Any:
+        """Return the memoized result of ``cast()`` for ``raw`` under ``spec``."""
+        key = (secret_name, spec)
+        with self._lock:
+            entry = self._entries.get(key)
+            # ``==`` short-circuits on identity, the usual case for a hit
+            if entry is not None and entry[0] == raw:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._view(entry[1])
+            self.misses += 1
+
+        value = cast()
+        value = freeze(value) if self.read_only else copy_nested(value)
+        with self._lock:
+            self._entries[key] = (raw, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return self._view(value)
+
+    def _view(self, value: Any) -> Any:
+        return value if self.read_only else copy_nested(value)
+
+    def discard(self, secret_name: str) -> None:
+        """Forget every cast of ``secret_name``."""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == secret_name]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+            }
+
+
+def freeze(value: Any) -> Any:
+    """Return ``value`` with dicts made read-only and lists made tuples, recursively."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+def copy_nested(value: Any) -> Any:
+    """Return a copy of ``value`` that shares no dict or list with it."""
+    if isinstance(value, dict):
+        return {k: copy_nested(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [copy_nested(v) for v in value]
+    return value
+
+
+def cast_spec(
+    cast_type: str, dict_fields: Optional[Any], kwargs: Dict[str, Any]
+) -> Optional[Hashable]:
+    """Return a hashable key for a cast, or None if it can't be memoized."""
+    spec = (
+        cast_type,
+        tuple(sorted(dict_fields.items())) if dict_fields else None,
+        tuple(sorted(kwargs.items())),
+    )
+    try:
+        hash(spec)
+    except TypeError:
+        return None
+    return spec
@@ -0,0 +1,76 @@
+"""Process-wide registry of SDK clients shared between providers."""
+
+import logging
+import threading
+from collections import Counter
+from contextlib import suppress
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+from cloud_secrets.common.singleflight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+
+class ClientRegistry:
+    """Reuses SDK clients, and so their credentials and connection pools.
+
+    Clients are keyed by a tuple starting with the provider name followed by
+    whatever distinguishes one client from another (region, project, vault,
+    credentials, pool options). Concurrent requests for a missing client share
+    one construction.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._clients: Dict[Tuple[Hashable, ...], Any] = {}
+        self._single_flight = SingleFlight()
+        self._requests: Counter = Counter()
+        self._created: Counter = Counter()
+
+    def get(self, key: Tuple[Hashable, ...], factory: Callable[[], Any]) -> Any:
+        """Return the client for ``key``, calling ``factory()`` if there is none."""
+        with self._lock:
+            self._requests[key[0]] += 1
+            if key in self._clients:
+                return self._clients[key]
+        return self._single_flight.do(key, self._create, key, factory)
+
+    def _create(self, key: Tuple[Hashable, ...], factory: Callable[[], Any]) -> Any:
+        with self._lock:
+            # Another thread may have finished creating it since get() looked
+            if key in self._clients:
+                return self._clients[key]
+        client = factory()
+        with self._lock:
+            self._clients[key] = client
+            self._created[key[0]] += 1
+        return client
+
+    def clear(self) -> None:
+        """Close and forget every client and reset the counters."""
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+            self._requests.clear()
+            self._created.clear()
+        for client in clients:
+            close = getattr(client, "close", None)
+            if callable(close):
+                with suppress(Exception):
+                    close()
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Return created/reused counts and live clients per provider."""
+        with self._lock:
+            live = Counter(key[0] for key in self._clients)
+            return {
+                provider: {
+                    "created": self._created[provider],
+                    "reused": requests - self._created[provider],
+                    "clients": live[provider],
+                }
+                for provider, requests in self._requests.items()
+            }
+
+
+client_registry = ClientRegistry()
@@ -0,0 +1,175 @@
+"""Encrypted on-disk secret cache for fast cold starts."""
+
+import atexit
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from contextlib import suppress
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple, Union
+
+from cloud_secrets.common.exceptions import ConfigurationError
+
+logger = logging.getLogger(__name__)
+
+KeySource = Union[str, bytes, Callable[[], Union[str, bytes]]]
+
+
+class EncryptedDiskCache:
+    """Single Fernet-encrypted file of secrets keyed by provider and name.
+
+    The key is a Fernet key (32 url-safe base64-encoded bytes) given directly,
+    returned by a callable (e.g. one that decrypts a data key with KMS), or read
+    from the ``CLOUD_SECRETS_CACHE_KEY`` environment variable. Writes are
+    batched: ``put`` marks the file dirty and it is rewritten atomically after
+    ``flush_delay`` seconds, on ``flush()`` or at interpreter exit.
+
+    Requires the ``cryptography`` package.
+    """
+
+    KEY_ENV_VAR = "CLOUD_SECRETS_CACHE_KEY"
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        key: Optional[KeySource] = None,
+        max_age: Optional[float] = 86400.0,
+        flush_delay: float = 1.0,
+    ):
+        """Initialize the cache and load the file if it exists.
+
+        Args:
+            path: Location of the cache file
+            key: Fernet key or a callable returning one; defaults to the
+                ``CLOUD_SECRETS_CACHE_KEY`` environment variable
+            max_age: Entries older than this many seconds are ignored;
+                ``None`` keeps them forever
+            flush_delay: Seconds to wait before writing batched updates
+        """
+        try:
+            from cryptography.fernet import Fernet
+        except ImportError:
+            raise ConfigurationError(
+                "EncryptedDiskCache requires the 'cryptography' package"
+            )
+        if callable(key):
+            key = key()
+        if key is None:
+            key = os.environ.get(self.KEY_ENV_VAR)
+        if not key:
+            raise ConfigurationError(
+                f"No disk cache key given and {self.KEY_ENV_VAR} is not set"
+            )
+        try:
+            self._fernet = Fernet(key)
+        except Exception as e:
+            raise ConfigurationError(f"Invalid disk cache key: {str(e)}")
+
+        self.path = Path(path)
+        self.max_age = max_age
+        self.flush_delay = flush_delay
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Tuple[str, float]]] = {}
+        self._dirty = False
+        self._timer: Optional[threading.Timer] = None
+        self._load()
+        atexit.register(self.flush)
+
+    @staticmethod
+    def generate_key() -> str:
+        """Return a new random key suitable for ``key=``."""
+        from cryptography.fernet import Fernet
+
+        return Fernet.generate_key().decode()
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            payload = self._fernet.decrypt(self.path.read_bytes())
+            data = json.loads(payload)
+        except Exception:
+            # Wrong key or damaged file: start empty, it will be rewritten
+            logger.warning("Ignoring unreadable secret cache %s", self.path)
+            return
+        self._entries = {
+            namespace: {name: (entry[0], entry[1]) for name, entry in names.items()}
+            for namespace, names in data.items()
+        }
+
+    def get(self, namespace: str, secret_name: str) -> Optional[str]:
+        """Return a cached value that is not older than ``max_age``."""
+        with self._lock:
+            entry = self._entries.get(namespace, {}).get(secret_name)
+        if entry is None:
+            return None
+        value, stored_at = entry
+        if self.max_age is not None and time.time() - stored_at > self.max_age:
+            return None
+        return value
+
+    def put(self, namespace: str, secret_name: str, value: str) -> None:
+        """Record a value and schedule a write."""
+        with self._lock:
+            current = self._entries.get(namespace, {}).get(secret_name)
+            # Skip rewriting an unchanged value unless its age needs refreshing
+            if (
+                current is not None
+                and current[0] == value
+                and (
+                    self.max_age is None or time.time() - current[1] < self.max_age / 2
+                )
+            ):
+                return
+            self._entries.setdefault(namespace, {})[secret_name] = (value, time.time())
+            self._schedule_flush()
+
+    def remove(self, namespace: str, secret_name: str) -> None:
+        """Forget a value and schedule a write."""
+        with self._lock:
+            if self._entries.get(namespace, {}).pop(secret_name, None) is not None:
+                self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        self._dirty = True
+        if self._timer is None:
+            self._timer = threading.Timer(self.flush_delay, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self) -> None:
+        """Write pending changes to disk now."""
+        with self._write_lock:
+            self._flush()
+
+    def _flush(self) -> None:
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._dirty:
+                return
+            data = {
+                namespace: {name: list(entry) for name, entry in names.items()}
+                for namespace, names in self._entries.items()
+            }
+            self._dirty = False
+        token = self._fernet.encrypt(json.dumps(data).encode("UTF-8"))
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(
+            dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp"
+        )
+        try:
+            # mkstemp creates the file readable by the owner only
+            with os.fdopen(fd, "wb") as f:
+                f.write(token)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            with suppress(FileNotFoundError):
+                os.unlink(tmp_path)
+            raise
@@ -10,5 +10,27 @@ class SecretNotFoundError(CloudSecretsError):
     """Raised when a secret is not found."""
 
 
+class BackendUnavailableError(ConfigurationError):
+    """Raised without calling the backend while its circuit breaker is open."""
+
+
+class RateLimitExceededError(ConfigurationError):
+    """Raised when a call would wait longer than the rate limiter allows."""
+
+
 class ProviderNotFoundError(CloudSecretsError):
     """Raised when specified provider is not supported."""
+
+
+class PreloadError(ConfigurationError):
+    """Raised when preloading finds missing or invalid secrets.
+
+    ``errors`` maps each failing secret name to its exception.
+    """
+
+    def __init__(self, errors):
+        self.errors = dict(errors)
+        lines = [f"  {name}: {error}" for name, error in sorted(self.errors.items())]
+        super().__init__(
+            f"{len(self.errors)} secret(s) failed to preload:\n" + "\n".join(lines)
+        )
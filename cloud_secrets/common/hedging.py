@@ -0,0 +1,134 @@
+"""Run a read against several sources, hedging to the next when one is slow."""
+
+import time
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+
+class HedgeOutcome(NamedTuple):
+    """Result of ``hedged_call``.
+
+    ``index`` is the call that succeeded, or None if every call failed.
+    ``hedged`` holds the calls started while an earlier one was still running,
+    ``launched`` how many calls were started at all, and ``raced`` whether
+    slower calls were still running when the winner returned. ``failures``
+    lists ``(index, error)`` in the order seen; ``error`` is None for a call
+    that timed out.
+    """
+
+    index: Optional[int]
+    value: Any
+    hedged: FrozenSet[int]
+    launched: int
+    raced: bool
+    failures: List[Tuple[int, Optional[BaseException]]]
+
+
+def hedged_call(
+    pool: Executor,
+    calls: Sequence[Callable[[], Any]],
+    hedge_delay: Callable[[int], Optional[float]],
+    timeouts: Optional[Sequence[Optional[float]]] = None,
+    is_final: Optional[Callable[[int, BaseException], bool]] = None,
+) -> HedgeOutcome:
+    """Return the first of ``calls`` to succeed, starting them in order on ``pool``.
+
+    The next call starts when the latest one fails or exceeds its timeout, or
+    once it has run ``hedge_delay(index)`` seconds without finishing. Delays
+    and timeouts count from when a call starts running, so a call still queued
+    behind busy workers is never hedged or timed out. Timed-out calls are left
+    running and their results ignored. An error for which ``is_final`` returns
+    True is raised at once.
+    """
+    started: Dict[int, float] = {}
+    pending: Dict[Future, int] = {}
+    hedged: Set[int] = set()
+    failures: List[Tuple[int, Optional[BaseException]]] = []
+    next_index = 0
+    # The most recently started call; it is hedged or replaced when it is
+    # slow or fails
+    latest: Optional[int] = None
+
+    def run(index: int) -> Any:
+        started[index] = time.monotonic()
+        return calls[index]()
+
+    def launch(hedge: bool) -> None:
+        nonlocal next_index, latest
+        latest = next_index
+        next_index += 1
+        pending[pool.submit(run, latest)] = latest
+        if hedge:
+            hedged.add(latest)
+
+    def timeout_of(index: int) -> Optional[float]:
+        return timeouts[index] if timeouts is not None else None
+
+    def outcome(index: Optional[int], value: Any, raced: bool) -> HedgeOutcome:
+        return HedgeOutcome(
+            index, value, frozenset(hedged), next_index, raced, failures
+        )
+
+    launch(hedge=False)
+    while pending:
+        now = time.monotonic()
+        deadlines = [
+            started[index] + timeout_of(index)
+            for index in pending.values()
+            if index in started and timeout_of(index) is not None
+        ]
+        delay = None
+        if latest is not None and next_index < len(calls):
+            delay = hedge_delay(latest)
+            if delay is not None:
+                # Not started yet: look again once it could have been slow
+                deadlines.append(started.get(latest, now) + delay)
+        timeout = max(0.0, min(deadlines) - now) if deadlines else None
+        done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+
+        for future in done:
+            index = pending.pop(future)
+            if index == latest:
+                latest = None
+            error = future.exception()
+            if error is None:
+                raced = bool(pending)
+                for loser in pending:
+                    loser.cancel()
+                return outcome(index, future.result(), raced)
+            if is_final is not None and is_final(index, error):
+                for loser in pending:
+                    loser.cancel()
+                raise error
+            failures.append((index, error))
+
+        now = time.monotonic()
+        for future, index in list(pending.items()):
+            timeout = timeout_of(index)
+            if timeout is not None and index in started:
+                if now >= started[index] + timeout:
+                    del pending[future]
+                    failures.append((index, None))
+                    if index == latest:
+                        latest = None
+        if next_index < len(calls):
+            if latest is None:
+                launch(hedge=False)
+            elif (
+                delay is not None
+                and latest in started
+                and now >= started[latest] + delay
+            ):
+                launch(hedge=True)
+    return outcome(None, None, False)
@@ -0,0 +1,251 @@
+"""Per-operation events for metrics, with OpenTelemetry and Prometheus adapters."""
+
+import bisect
+import threading
+from collections import Counter, defaultdict
+from typing import Any, Callable, Dict, NamedTuple, Optional, Sequence, Tuple
+
+from cloud_secrets.common.exceptions import ConfigurationError
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+SIZE_BUCKETS = (64, 256, 1024, 4096, 16384, 65536)
+
+
+class OperationEvent(NamedTuple):
+    """One ``get_secret``, ``get_dict``, ``set_secret`` or ``delete_secret`` call,
+    or one name of a ``get_secrets`` batch.
+
+    ``error`` is the exception class name if the call raised. ``cache`` is
+    ``"hit"`` or ``"miss"`` for reads and ``None`` for writes. ``size`` is the
+    value's length in bytes when known. ``saved_bytes`` is set when
+    ``refresh_if_changed`` skipped downloading an unchanged value.
+    """
+
+    provider: str
+    operation: str
+    secret_name: str
+    seconds: float
+    error: Optional[str] = None
+    cache: Optional[str] = None
+    size: Optional[int] = None
+    saved_bytes: Optional[int] = None
+
+
+Hook = Callable[[OperationEvent], None]
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus style."""
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def snapshot(self) -> Dict[str, Any]:
+        cumulative, total = {}, 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            total += count
+            cumulative[bound] = total
+        return {"count": self.count, "sum": self.sum, "buckets": cumulative}
+
+
+class MetricsRecorder:
+    """In-memory hook keeping histograms and counters per provider and operation."""
+
+    def __init__(
+        self,
+        latency_buckets: Sequence[float] = LATENCY_BUCKETS,
+        size_buckets: Sequence[float] = SIZE_BUCKETS,
+    ):
+        self._lock = threading.Lock()
+        self._latency: Dict[Tuple[str, str], Histogram] = defaultdict(
+            lambda: Histogram(latency_buckets)
+        )
+        self._size: Dict[Tuple[str, str], Histogram] = defaultdict(
+            lambda: Histogram(size_buckets)
+        )
+        self._calls: Counter = Counter()
+        self._errors: Counter = Counter()
+        self._cache: Counter = Counter()
+        self._skipped: Counter = Counter()
+        self._saved: Counter = Counter()
+
+    def __call__(self, event: OperationEvent) -> None:
+        key = (event.provider, event.operation)
+        with self._lock:
+            self._calls[key] += 1
+            self._latency[key].observe(event.seconds)
+            if event.error is not None:
+                self._errors[key + (event.error,)] += 1
+            if event.cache is not None:
+                self._cache[key + (event.cache,)] += 1
+            if event.size is not None:
+                self._size[key].observe(event.size)
+            if event.saved_bytes is not None:
+                self._skipped[key] += 1
+                self._saved[key] += event.saved_bytes
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Return metrics keyed by ``"provider.operation"``."""
+        with self._lock:
+            result: Dict[str, Dict[str, Any]] = {}
+            for key, calls in self._calls.items():
+                result[".".join(key)] = {
+                    "calls": calls,
+                    "latency": self._latency[key].snapshot(),
+                    "errors": {
+                        error: count
+                        for (*k, error), count in self._errors.items()
+                        if tuple(k) == key
+                    },
+                    "cache": {
+                        outcome: count
+                        for (*k, outcome), count in self._cache.items()
+                        if tuple(k) == key
+                    },
+                    "size": self._size[key].snapshot() if key in self._size else None,
+                    "payloads_skipped": self._skipped[key],
+                    "bytes_saved": self._saved[key],
+                }
+            return result
+
+    def reset(self) -> None:
+        with self._lock:
+            self._latency.clear()
+            self._size.clear()
+            self._calls.clear()
+            self._errors.clear()
+            self._cache.clear()
+            self._skipped.clear()
+            self._saved.clear()
+
+
+class OpenTelemetryHook:
+    """Hook recording events as OpenTelemetry metrics.
+
+    Requires the ``opentelemetry-api`` package. Uses the global meter provider
+    unless a ``meter`` is given.
+    """
+
+    def __init__(self, meter: Any = None):
+        if meter is None:
+            try:
+                from opentelemetry import metrics
+            except ImportError:
+                raise ConfigurationError(
+                    "OpenTelemetryHook requires the 'opentelemetry-api' package"
+                )
+            meter = metrics.get_meter("cloud_secrets")
+        self._duration = meter.create_histogram(
+            "cloud_secrets.operation.duration",
+            unit="s",
+            description="Duration of secret operations",
+        )
+        self._errors = meter.create_counter(
+            "cloud_secrets.operation.errors",
+            description="Secret operations that raised, by exception class",
+        )
+        self._cache = meter.create_counter(
+            "cloud_secrets.cache.lookups", description="Reads by cache outcome"
+        )
+        self._size = meter.create_histogram(
+            "cloud_secrets.payload.size", unit="By", description="Secret value sizes"
+        )
+        self._skipped = meter.create_counter(
+            "cloud_secrets.payload.skipped",
+            description="Downloads skipped because the version was unchanged",
+        )
+        self._saved = meter.create_counter(
+            "cloud_secrets.payload.saved",
+            unit="By",
+            description="Bytes not downloaded because the version was unchanged",
+        )
+
+    def __call__(self, event: OperationEvent) -> None:
+        attributes = {"provider": event.provider, "operation": event.operation}
+        # Histogram counts double as call counts
+        self._duration.record(event.seconds, attributes)
+        if event.error is not None:
+            self._errors.add(1, {**attributes, "error.type": event.error})
+        if event.cache is not None:
+            self._cache.add(1, {**attributes, "result": event.cache})
+        if event.size is not None:
+            self._size.record(event.size, attributes)
+        if event.saved_bytes is not None:
+            self._skipped.add(1, attributes)
+            self._saved.add(event.saved_bytes, attributes)
+
+
+class PrometheusHook:
+    """Hook recording events with ``prometheus_client`` metrics.
+
+    Requires the ``prometheus-client`` package. Metrics are registered in the
+    default registry unless ``registry`` is given.
+    """
+
+    def __init__(self, registry: Any = None, namespace: str = "cloud_secrets"):
+        try:
+            import prometheus_client
+        except ImportError:
+            raise ConfigurationError(
+                "PrometheusHook requires the 'prometheus-client' package"
+            )
+        kwargs = {"namespace": namespace}
+        if registry is not None:
+            kwargs["registry"] = registry
+        labels = ("provider", "operation")
+        self._duration = prometheus_client.Histogram(
+            "operation_seconds",
+            "Duration of secret operations",
+            labels,
+            buckets=LATENCY_BUCKETS,
+            **kwargs,
+        )
+        self._errors = prometheus_client.Counter(
+            "operation_errors",
+            "Secret operations that raised, by exception class",
+            labels + ("error",),
+            **kwargs,
+        )
+        self._cache = prometheus_client.Counter(
+            "cache_lookups", "Reads by cache outcome", labels + ("result",), **kwargs
+        )
+        self._size = prometheus_client.Histogram(
+            "payload_bytes",
+            "Secret value sizes",
+            labels,
+            buckets=SIZE_BUCKETS,
+            **kwargs,
+        )
+        self._skipped = prometheus_client.Counter(
+            "payload_skipped",
+            "Downloads skipped because the version was unchanged",
+            labels,
+            **kwargs,
+        )
+        self._saved = prometheus_client.Counter(
+            "payload_saved_bytes",
+            "Bytes not downloaded because the version was unchanged",
+            labels,
+            **kwargs,
+        )
+
+    def __call__(self, event: OperationEvent) -> None:
+        labels = (event.provider, event.operation)
+        self._duration.labels(*labels).observe(event.seconds)
+        if event.error is not None:
+            self._errors.labels(*labels, event.error).inc()
+        if event.cache is not None:
+            self._cache.labels(*labels, event.cache).inc()
+        if event.size is not None:
+            self._size.labels(*labels).observe(event.size)
+        if event.saved_bytes is not None:
+            self._skipped.labels(*labels).inc()
+            self._saved.labels(*labels).inc(event.saved_bytes)
@@ -0,0 +1,130 @@
+"""Proxies for secrets fetched on first use, e.g. from Django settings."""
+
+import copy
+import threading
+from typing import Any, Callable, Iterator
+
+_MISSING = object()
+
+
+class LazySecret:
+    """Proxy for a secret that is fetched the first time it is used.
+
+    Converting, comparing, formatting, indexing, iterating or reading an
+    attribute resolves the secret once; later uses reuse the value. Code that
+    checks types (``isinstance(value, str)``) sees the proxy, so pass
+    ``secret.value`` or ``str(secret)`` to such code.
+    """
+
+    __slots__ = ("name", "_resolve", "_value", "_lock")
+
+    def __init__(self, name: str, resolve: Callable[[], Any]):
+        self.name = name
+        self._resolve = resolve
+        self._value = _MISSING
+        self._lock = threading.Lock()
+
+    @property
+    def value(self) -> Any:
+        """The secret's value, fetched on first access."""
+        value = self._value
+        if value is _MISSING:
+            with self._lock:
+                if self._value is _MISSING:
+                    self._value = self._resolve()
+                value = self._value
+        return value
+
+    @property
+    def resolved(self) -> bool:
+        return self._value is not _MISSING
+
+    def __repr__(self) -> str:
+        # Never show the value
+        state = "resolved" if self.resolved else "pending"
+        return f"<LazySecret {self.name} ({state})>"
+
+    def __getattr__(self, name: str) -> Any:
+        # Private and protocol lookups (copy, pickle) must not resolve, and
+        # must not recurse while the slots are still unset
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.value, name)
+
+    def __copy__(self) -> Any:
+        return copy.copy(self.value)
+
+    def __deepcopy__(self, memo: dict) -> Any:
+        return copy.deepcopy(self.value, memo)
+
+    def __reduce__(self) -> tuple:
+        # Pickles as the resolved value; the lock and resolver can't be pickled
+        return _identity, (self.value,)
+
+    def __str__(self) -> str:
+        return str(self.value)
+
+    def __format__(self, format_spec: str) -> str:
+        return format(self.value, format_spec)
+
+    def __bool__(self) -> bool:
+        return bool(self.value)
+
+    def __int__(self) -> int:
+        return int(self.value)
+
+    def __float__(self) -> float:
+        return float(self.value)
+
+    def __index__(self) -> int:
+        return self.value.__index__()
+
+    def __len__(self) -> int:
+        return len(self.value)
+
+    def __iter__(self) -> Iterator:
+        return iter(self.value)
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self.value
+
+    def __getitem__(self, key: Any) -> Any:
+        return self.value[key]
+
+    def __hash__(self) -> int:
+        return hash(self.value)
+
+    def __eq__(self, other: Any) -> bool:
+        return self.value == _unwrap(other)
+
+    def __ne__(self, other: Any) -> bool:
+        return self.value != _unwrap(other)
+
+    def __lt__(self, other: Any) -> bool:
+        return self.value < _unwrap(other)
+
+    def __le__(self, other: Any) -> bool:
+        return self.value <= _unwrap(other)
+
+    def __gt__(self, other: Any) -> bool:
+        return self.value > _unwrap(other)
+
+    def __ge__(self, other: Any) -> bool:
+        return self.value >= _unwrap(other)
+
+    def __add__(self, other: Any) -> Any:
+        return self.value + _unwrap(other)
+
+    def __radd__(self, other: Any) -> Any:
+        return _unwrap(other) + self.value
+
+    def __mod__(self, other: Any) -> Any:
+        return self.value % other
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _unwrap(value: Any) -> Any:
+    return value.value if isinstance(value, LazySecret) else value
@@ -0,0 +1,111 @@
+"""Manifests listing the secrets an application needs at startup."""
+
+import json
+import shlex
+from collections import Counter
+from pathlib import Path
+from typing import Any, Iterable, List, Mapping, NamedTuple, Optional, Union
+
+from cloud_secrets.common.exceptions import ConfigurationError
+
+CAST_TYPES = {"str", "bool", "int", "float", "list", "tuple", "dict", "json", "url"}
+
+
+class SecretSpec(NamedTuple):
+    """One manifest entry.
+
+    A secret with a ``default`` is optional; otherwise ``required`` decides
+    whether its absence is an error.
+    """
+
+    name: str
+    cast: str = "str"
+    default: Optional[Any] = None
+    required: bool = True
+
+
+Manifest = Union[str, Path, Mapping[str, Union[str, Mapping[str, Any]]], Iterable[str]]
+
+
+def load_manifest(manifest: Manifest) -> List[SecretSpec]:
+    """Build specs from a mapping, a list of names or a manifest file.
+
+    A mapping maps each name to a cast type or to a dict with ``cast``,
+    ``default`` and ``required`` keys. Files ending in ``.json`` hold such a
+    mapping; any other file has one secret per line::
+
+        # name  [cast]  [required|optional]  [default=VALUE]
+        DATABASE_URL
+        PORT int default=8080
+        SENTRY_DSN optional
+
+    Raises ConfigurationError listing every invalid entry.
+    """
+    if isinstance(manifest, (str, Path)):
+        path = Path(manifest)
+        try:
+            text = path.read_text()
+        except OSError as e:
+            raise ConfigurationError(f"Cannot read manifest {path}: {str(e)}")
+        if path.suffix == ".json":
+            try:
+                manifest = json.loads(text)
+            except json.JSONDecodeError as e:
+                raise ConfigurationError(f"Invalid manifest {path}: {str(e)}")
+        else:
+            return _validate(_parse_lines(text, path))
+
+    if isinstance(manifest, Mapping):
+        specs = []
+        for name, entry in manifest.items():
+            if isinstance(entry, str):
+                entry = {"cast": entry}
+            elif entry is None:
+                entry = {}
+            unknown = set(entry) - {"cast", "default", "required"}
+            if unknown:
+                raise ConfigurationError(
+                    f"Unknown manifest keys for {name}: {', '.join(sorted(unknown))}"
+                )
+            specs.append(SecretSpec(name, **entry))
+        return _validate(specs)
+    return _validate([SecretSpec(name) for name in manifest])
+
+
+def _parse_lines(text: str, path: Path) -> List[SecretSpec]:
+    specs = []
+    for number, line in enumerate(text.splitlines(), start=1):
+        tokens = shlex.split(line, comments=True)
+        if not tokens:
+            continue
+        name, options = tokens[0], {}
+        for token in tokens[1:]:
+            if token in CAST_TYPES:
+                options["cast"] = token
+            elif token in ("required", "optional"):
+                options["required"] = token == "required"
+            elif token.startswith("default="):
+                options["default"] = token[len("default=") :]
+            else:
+                raise ConfigurationError(
+                    f"{path}:{number}: unexpected {token!r} for secret {name}"
+                )
+        specs.append(SecretSpec(name, **options))
+    return specs
+
+
+def _validate(specs: List[SecretSpec]) -> List[SecretSpec]:
+    problems = [
+        f"{spec.name}: unknown cast type {spec.cast!r}"
+        for spec in specs
+        if spec.cast not in CAST_TYPES
+    ]
+    counts = Counter(spec.name for spec in specs)
+    problems += [
+        f"{name}: listed more than once"
+        for name, count in sorted(counts.items())
+        if count > 1
+    ]
+    if problems:
+        raise ConfigurationError("Invalid secret manifest:\n  " + "\n  ".join(problems))
+    return specs
@@ -0,0 +1,137 @@
+"""Client-side token bucket limiting outgoing backend calls."""
+
+import asyncio
+import threading
+import time
+from typing import Callable, Dict, Hashable, Optional, Union
+
+from cloud_secrets.common.exceptions import ConfigurationError, RateLimitExceededError
+
+
+class TokenBucket:
+    """Allows ``rate`` calls per second on average and bursts of ``burst``.
+
+    A caller that finds the bucket empty reserves the next token and sleeps
+    until it is due, so waiting callers are served in arrival order. If that
+    wait would exceed ``max_wait`` seconds, ``RateLimitExceededError`` is raised
+    instead and no token is taken. Sync and asyncio callers can share a
+    bucket: ``acquire_async`` waits with ``asyncio.sleep``.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[int] = None,
+        max_wait: Optional[float] = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if rate <= 0:
+            raise ConfigurationError("TokenBucket rate must be positive")
+        self.rate = float(rate)
+        self.burst = max(1, int(burst if burst is not None else rate))
+        self.max_wait = max_wait
+        self.clock = clock
+        self.sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self.acquired = 0
+        self.waited = 0
+        self.wait_seconds = 0.0
+        self.rejected = 0
+
+    def acquire(self) -> float:
+        """Take a token, sleeping if needed; return the seconds waited."""
+        wait = self._reserve()
+        if wait:
+            self.sleep(wait)
+        return wait
+
+    async def acquire_async(self) -> float:
+        """Take a token without blocking the event loop; return the seconds waited."""
+        wait = self._reserve()
+        if wait:
+            await asyncio.sleep(wait)
+        return wait
+
+    def _reserve(self) -> float:
+        """Reserve the next token and return how long until it is due."""
+        with self._lock:
+            now = self.clock()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            wait = max(0.0, (1 - self._tokens) / self.rate)
+            if self.max_wait is not None and wait > self.max_wait:
+                self.rejected += 1
+                raise RateLimitExceededError(
+                    f"Rate limit of {self.rate:g}/s exceeded: next call in "
+                    f"{wait:.3f}s, max wait is {self.max_wait:g}s"
+                )
+            # Reserve the token now; it may go negative while callers queue
+            self._tokens -= 1
+            self.acquired += 1
+            if wait:
+                self.waited += 1
+                self.wait_seconds += wait
+        return wait
+
+    def stats(self) -> Dict[str, Union[int, float]]:
+        with self._lock:
+            return {
+                "rate": self.rate,
+                "burst": self.burst,
+                "acquired": self.acquired,
+                "waited": self.waited,
+                "wait_seconds": self.wait_seconds,
+                "rejected": self.rejected,
+            }
+
+
+class RateLimiterRegistry:
+    """Process-wide token buckets shared by key, e.g. one per cloud account."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets: Dict[Hashable, TokenBucket] = {}
+
+    def get(self, key: Hashable, factory: Callable[[], TokenBucket]) -> TokenBucket:
+        """Return the bucket for ``key``, creating it with ``factory`` once."""
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = factory()
+            return bucket
+
+    def clear(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+
+    def stats(self) -> Dict[Hashable, Dict[str, Union[int, float]]]:
+        with self._lock:
+            buckets = dict(self._buckets)
+        return {key: bucket.stats() for key, bucket in buckets.items()}
+
+
+rate_limiters = RateLimiterRegistry()
+
+
+def build_rate_limiter(
+    owner: str,
+    rate_limit: Optional[float],
+    rate_burst: Optional[int] = None,
+    max_wait: Optional[float] = 5.0,
+    shared: Union[bool, Hashable] = False,
+) -> Optional[TokenBucket]:
+    """Return a provider's bucket: its own, shared by ``owner`` or by ``shared``."""
+    if rate_limit is None:
+        return None
+
+    def make_bucket() -> TokenBucket:
+        return TokenBucket(rate_limit, rate_burst, max_wait)
+
+    if shared:
+        return rate_limiters.get(owner if shared is True else shared, make_bucket)
+    return make_bucket()
@@ -0,0 +1,226 @@
+"""Retry with backoff and a circuit breaker for backend calls."""
+
+import logging
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Union
+
+from cloud_secrets.common.exceptions import BackendUnavailableError, ConfigurationError
+from cloud_secrets.common.rate_limit import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+
+class RetryPolicy:
+    """Capped exponential backoff with full jitter and an overall deadline.
+
+    Attempt ``n`` (0-based) is followed by a sleep of a random duration in
+    ``[0, min(max_delay, base_delay * 2**n)]``. No retry is made once it would
+    end after ``deadline`` seconds from the first attempt.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        base_delay: float = 0.1,
+        max_delay: float = 2.0,
+        deadline: Optional[float] = 10.0,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_attempts < 1:
+            raise ConfigurationError("RetryPolicy max_attempts must be at least 1")
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self.sleep = sleep
+        self.clock = clock
+
+    def backoff(self, attempt: int) -> float:
+        """Return the jittered delay after failed attempt ``attempt``."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+
+class CircuitBreaker:
+    """Stops calling an unhealthy backend for a while.
+
+    After ``failure_threshold`` consecutive failed calls the breaker opens and
+    calls fail fast. After ``reset_timeout`` seconds one probe call is let
+    through (half-open); its success closes the breaker, its failure reopens it.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self.opens = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if (
+                self._state == self.OPEN
+                and self.clock() - self._opened_at >= self.reset_timeout
+            ):
+                return self.HALF_OPEN
+            return self._state
+
+    def allow(self) -> bool:
+        """Return whether a call may go to the backend now."""
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            if self.clock() - self._opened_at < self.reset_timeout or self._probing:
+                return False
+            self._state = self.HALF_OPEN
+            self._probing = True
+            return True
+
+    def release(self) -> None:
+        """Give back a call allowed by ``allow()`` that never reached the backend."""
+        with self._lock:
+            self._probing = False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or (
+                self._failures >= self.failure_threshold and self._state == self.CLOSED
+            ):
+                self._state = self.OPEN
+                self._opened_at = self.clock()
+                self.opens += 1
+            self._probing = False
+
+    def stats(self) -> Dict[str, Union[str, int]]:
+        state = self.state
+        with self._lock:
+            return {
+                "state": state,
+                "consecutive_failures": self._failures,
+                "opens": self.opens,
+            }
+
+
+class BackendGuard:
+    """Retry, circuit breaker and rate limit bookkeeping for one backend.
+
+    Providers run the attempt loop themselves, sleeping or awaiting between
+    attempts, and ask the guard what to do at each step. The guard keeps the
+    counters reported by ``backend_stats()``.
+    """
+
+    def __init__(
+        self,
+        owner: str,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+    ):
+        self.owner = owner
+        self.retry_policy = retry_policy
+        self.circuit_breaker = circuit_breaker
+        self.rate_limiter = rate_limiter
+        self.retries = 0
+        self.gave_up = 0
+        self.short_circuited = 0
+        self.served_stale = 0
+
+    def admit(self) -> float:
+        """Check the breaker before a call; return the start of its deadline."""
+        breaker = self.circuit_breaker
+        if breaker is not None and not breaker.allow():
+            self.short_circuited += 1
+            raise BackendUnavailableError(
+                f"{self.owner} backend unavailable: circuit breaker open"
+            )
+        return self.retry_policy.clock() if self.retry_policy is not None else 0.0
+
+    def rate_limited(self) -> None:
+        """Give back the breaker's probe after a call was refused a token."""
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.release()
+
+    def succeeded(self) -> None:
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record_success()
+
+    def failed(self, retryable: bool, attempt: int, start: float) -> Optional[float]:
+        """Record failed ``attempt``; return the delay before a retry, or None.
+
+        An error that isn't retryable (e.g. not found) counts as a healthy
+        backend. A retryable one counts as a breaker failure once the retry
+        policy gives up.
+        """
+        if not retryable:
+            self.succeeded()
+            return None
+        policy = self.retry_policy
+        delay = policy.backoff(attempt) if policy is not None else 0.0
+        if (
+            policy is None
+            or attempt + 1 >= policy.max_attempts
+            or (
+                policy.deadline is not None
+                and policy.clock() - start + delay > policy.deadline
+            )
+        ):
+            self.gave_up += 1
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.record_failure()
+            return None
+        self.retries += 1
+        return delay
+
+    def last_known_good(self, cache: Any, secret_name: str) -> Optional[str]:
+        """Return the cached value, even expired, while the breaker isn't closed."""
+        get_stale = getattr(cache, "get_stale", None)
+        if (
+            get_stale is None
+            or self.circuit_breaker is None
+            or self.circuit_breaker.state == CircuitBreaker.CLOSED
+        ):
+            return None
+        value = get_stale(secret_name)
+        if value is not None:
+            self.served_stale += 1
+            logger.warning("Backend unhealthy; serving last known %s", secret_name)
+        return value
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "retries": self.retries,
+            "gave_up": self.gave_up,
+            "short_circuited": self.short_circuited,
+            "served_stale": self.served_stale,
+            "rate_limiter": (
+                self.rate_limiter.stats() if self.rate_limiter is not None else None
+            ),
+            "breaker": (
+                self.circuit_breaker.stats()
+                if self.circuit_breaker is not None
+                else None
+            ),
+        }
@@ -0,0 +1,88 @@
+"""Lock-protected secret storage backing a provider's environ.Env."""
+
+import os
+import threading
+from typing import Any, Callable, Iterator, MutableMapping, Optional
+
+import environ
+
+
+class SecretStore(MutableMapping):
+    """Mapping whose reads and writes are serialized by a re-entrant lock.
+
+    Single operations are atomic. Hold ``lock`` to make a sequence of writes
+    (e.g. destructuring a JSON secret into several keys) atomic for readers.
+    """
+
+    def __init__(self, backing: Optional[MutableMapping] = None):
+        """Wrap ``backing`` (e.g. ``os.environ``) or a private dict."""
+        self._data: MutableMapping = {} if backing is None else backing
+        self.lock = threading.RLock()
+
+    def __getitem__(self, key: str) -> Any:
+        with self.lock:
+            return self._data[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        with self.lock:
+            self._data[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        with self.lock:
+            del self._data[key]
+
+    def __contains__(self, key: object) -> bool:
+        with self.lock:
+            return key in self._data
+
+    def __iter__(self) -> Iterator[str]:
+        # Iterate over a snapshot so concurrent writers can't break iteration
+        with self.lock:
+            return iter(list(self._data))
+
+    def __len__(self) -> int:
+        with self.lock:
+            return len(self._data)
+
+    def items(self):
+        with self.lock:
+            return list(self._data.items())
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self.lock:
+            return self._data.get(key, default)
+
+    def pop(self, key: str, *default: Any) -> Any:
+        with self.lock:
+            return self._data.pop(key, *default)
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        with self.lock:
+            return self._data.setdefault(key, default)
+
+    def update(self, *args, **kwargs) -> None:
+        with self.lock:
+            self._data.update(*args, **kwargs)
+
+    def copy(self) -> dict:
+        with self.lock:
+            return dict(self._data)
+
+
+def make_env(
+    export_env: bool = True, lazy: Optional[Callable[..., Any]] = None
+) -> environ.Env:
+    """Build an ``environ.Env`` backed by its own ``SecretStore``.
+
+    With ``export_env`` the store writes through to ``os.environ``; otherwise it
+    starts from a snapshot of ``os.environ`` and never modifies the process
+    environment. A per-instance subclass is used because ``Env.read_env`` is a
+    classmethod that writes to the class-level ``ENVIRON``. ``lazy`` becomes
+    the env's ``lazy`` method, e.g. ``env.lazy("NAME", cast="int")``.
+    """
+    store = SecretStore(os.environ if export_env else dict(os.environ))
+    attrs: dict = {"ENVIRON": store}
+    if lazy is not None:
+        attrs["lazy"] = staticmethod(lazy)
+    env_cls = type("ProviderEnv", (environ.Env,), attrs)
+    return env_cls()
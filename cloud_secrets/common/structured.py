@@ -0,0 +1,133 @@
+"""Parsed (structured) form of secrets holding several values."""
+
+import copy
+import io
+import json
+import threading
+from typing import Any, Dict, Mapping, MutableMapping, Optional, Tuple, Union
+
+import environ
+
+from cloud_secrets.common.exceptions import SecretNotFoundError
+
+_CAST_TYPES = {
+    "str": str,
+    "int": int,
+    "float": float,
+    "bool": bool,
+    "list": list,
+    "tuple": tuple,
+    "dict": dict,
+}
+
+
+class _ParseEnv(environ.Env):
+    # read_env is a classmethod writing to ENVIRON; parse_env_text swaps it
+    ENVIRON: Dict[str, str] = {}
+
+
+_parse_lock = threading.Lock()
+
+
+def parse_env_text(text: str) -> Dict[str, str]:
+    """Parse ``KEY=VALUE`` lines with django-environ's rules, without side effects."""
+    with _parse_lock:
+        _ParseEnv.ENVIRON = {}
+        _ParseEnv.read_env(io.StringIO(text), overwrite=True)
+        return _ParseEnv.ENVIRON
+
+
+def parse_structured(raw: str) -> Optional[Dict[str, Any]]:
+    """Parse a JSON object or multi-line ``KEY=VALUE`` secret.
+
+    Returns None for anything else (plain strings, JSON arrays or scalars,
+    single-line values), which are not structured secrets.
+    """
+    text = raw.strip()
+    if text.startswith("{"):
+        try:
+            data = json.loads(text)
+        except json.JSONDecodeError:
+            return None
+        return data if isinstance(data, dict) else None
+    if "\n" in text and "=" in text:
+        return parse_env_text(text) or None
+    return None
+
+
+def cast_field(value: Any, cast: Union[str, type]) -> Any:
+    """Cast a structured field; strings are parsed like environment values."""
+    cast = _CAST_TYPES.get(cast, cast) if isinstance(cast, str) else cast
+    if isinstance(value, str):
+        return value if cast is str else environ.Env.parse_value(value, cast)
+    if cast is str:
+        return json.dumps(value) if isinstance(value, (dict, list)) else str(value)
+    if isinstance(value, cast):
+        return copy.deepcopy(value) if isinstance(value, (dict, list)) else value
+    return cast(value)
+
+
+def get_field(
+    parsed: Optional[Dict[str, Any]],
+    secret_name: str,
+    field: str,
+    cast_type: Union[str, type] = "str",
+) -> Any:
+    """Return one cast field of a parsed secret."""
+    if parsed is None or field not in parsed:
+        raise SecretNotFoundError(f"Field {field} not found in secret {secret_name}")
+    return cast_field(parsed[field], cast_type)
+
+
+def cast_fields(
+    parsed: Dict[str, Any], field_types: Optional[Mapping[str, Any]] = None
+) -> Dict[str, Any]:
+    """Return a copy of a parsed secret with ``field_types`` applied."""
+    field_types = field_types or {}
+    return {
+        key: cast_field(value, field_types.get(key, type(value)))
+        for key, value in parsed.items()
+    }
+
+
+def flat_value(value: Any) -> str:
+    """Render a field for the environment; nested values stay JSON."""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (dict, list, bool)) or value is None:
+        return json.dumps(value)
+    return str(value)
+
+
+class StructuredSecrets:
+    """Parsed form of each secret, re-parsed only when its raw value changes.
+
+    Also remembers which raw value was last flattened into the environment so
+    opting into flattening costs one pass per distinct value, not per fetch.
+    """
+
+    def __init__(self):
+        self._parsed: Dict[str, Tuple[str, Optional[Dict[str, Any]]]] = {}
+        self._flattened: Dict[str, str] = {}
+
+    def get(self, secret_name: str, raw: str) -> Optional[Dict[str, Any]]:
+        """Return the parsed secret, or None if ``raw`` isn't structured."""
+        entry = self._parsed.get(secret_name)
+        if entry is not None and entry[0] == raw:
+            return entry[1]
+        parsed = parse_structured(raw)
+        self._parsed[secret_name] = (raw, parsed)
+        return parsed
+
+    def flatten(self, store: MutableMapping, secret_name: str, raw: str) -> None:
+        """Copy the fields of a structured secret into ``store`` once per value."""
+        if self._flattened.get(secret_name) == raw:
+            return
+        parsed = self.get(secret_name, raw)
+        if parsed:
+            store.update({key: flat_value(value) for key, value in parsed.items()})
+        self._flattened[secret_name] = raw
+
+    def discard(self, secret_name: str) -> None:
+        self._parsed.pop(secret_name, None)
+        self._flattened.pop(secret_name, None)
@@ -0,0 +1,69 @@
+# cloud_secrets/providers/async_azure_provider.py
+
+from azure.core.exceptions import ResourceNotFoundError
+from azure.keyvault.secrets.aio import SecretClient
+from azure.identity.aio import DefaultAzureCredential
+from .async_base import AsyncBaseSecretProvider
+from .azure_provider import is_retryable_error
+from cloud_secrets.common.exceptions import (
+    CloudSecretsError,
+    SecretNotFoundError,
+    ConfigurationError,
+)
+
+
+class AsyncAzureSecretsProvider(AsyncBaseSecretProvider):
+    """Azure Key Vault provider using the native asyncio client.
+
+    The aio transport requires ``aiohttp`` to be installed.
+    """
+
+    def __init__(self, **kwargs):
+        """Initialize Azure Key Vault async client."""
+        super().__init__(**kwargs)
+        try:
+            vault_url = kwargs.get("vault_url")
+            if not vault_url:
+                raise ConfigurationError("Azure vault_url is required")
+            self.credential = DefaultAzureCredential()
+            self.client = SecretClient(vault_url=vault_url, credential=self.credential)
+        except Exception as e:
+            raise ConfigurationError(f"Failed to initialize Azure Key Vault: {str(e)}")
+
+    def _is_retryable(self, error: Exception) -> bool:
+        return is_retryable_error(error)
+
+    async def _fetch_raw_secret(self, secret_name: str) -> str:
+        """Fetch raw secret from Azure Key Vault."""
+        try:
+            response = await self._call_backend(self.client.get_secret, secret_name)
+            self._publish(secret_name, response.value)
+            return response.value
+        except ResourceNotFoundError:
+            raise SecretNotFoundError(f"Secret {secret_name} not found")
+        except CloudSecretsError:
+            raise
+        except Exception as e:
+            raise ConfigurationError(f"Error retrieving secret: {str(e)}")
+
+    async def _store_raw_secret(self, secret_name: str, secret_value: str) -> None:
+        try:
+            await self._call_backend(self.client.set_secret, secret_name, secret_value)
+        except CloudSecretsError:
+            raise
+        except Exception as e:
+            raise ConfigurationError(f"Failed to store secret '{secret_name}': {e}")
+
+    async def _delete_raw_secret(self, secret_name: str) -> None:
+        try:
+            await self._call_backend(self.client.delete_secret, secret_name)
+        except ResourceNotFoundError:
+            pass
+        except CloudSecretsError:
+            raise
+        except Exception as e:
+            raise ConfigurationError(f"Failed to delete secret '{secret_name}': {e}")
+
+    async def close(self) -> None:
+        await self.client.close()
+        await self.credential.close()
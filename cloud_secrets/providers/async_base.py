@@ -0,0 +1,443 @@
+"""Asyncio provider implementations."""
+
+import asyncio
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from environ import Env
+
+from cloud_secrets.common.cache import SecretCache
+from cloud_secrets.common.cast_memo import CastMemo
+from cloud_secrets.common.exceptions import (
+    CloudSecretsError,
+    ConfigurationError,
+    SecretNotFoundError,
+)
+from cloud_secrets.common.rate_limit import TokenBucket, build_rate_limiter
+from cloud_secrets.common.resilience import BackendGuard, CircuitBreaker, RetryPolicy
+from cloud_secrets.common.store import SecretStore, make_env
+from cloud_secrets.common.structured import (
+    StructuredSecrets,
+    cast_fields,
+    get_field,
+)
+from cloud_secrets.providers.base import (
+    BaseSecretProvider,
+    SecretBatch,
+    cast_env_value,
+)
+
+_MISSING = object()
+
+
+class AsyncBaseSecretProvider(ABC):
+    """Base class for asyncio secret providers with environ support.
+
+    Concurrent ``get_secret`` calls for the same name share one in-flight
+    backend fetch. A provider instance should be used from a single event loop.
+    """
+
+    def __init__(
+        self,
+        cache: Optional[SecretCache] = None,
+        cache_ttl: Optional[float] = None,
+        cache_max_size: int = 128,
+        cache_ttls: Optional[Mapping[str, float]] = None,
+        batch_max_workers: int = 8,
+        export_env: bool = True,
+        cast_memo: Optional[CastMemo] = None,
+        memoize_casts: bool = True,
+        flatten_env: bool = False,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        resilient: bool = False,
+        rate_limit: Optional[float] = None,
+        rate_burst: Optional[int] = None,
+        rate_limit_max_wait: Optional[float] = 5.0,
+        rate_limiter: Optional[TokenBucket] = None,
+        shared_rate_limit: Union[bool, Hashable] = False,
+        **kwargs,
+    ):
+        """Initialize the base provider with environ and optional caching.
+
+        Retry, circuit breaker and rate limit options work as for
+        ``BaseSecretProvider``; retries and rate-limited calls wait with
+        ``asyncio.sleep``. Hooks are not supported and raise ConfigurationError.
+        """
+        if kwargs.get("hooks"):
+            raise ConfigurationError(
+                f"{type(self).__name__} does not support hooks; "
+                "use a synchronous provider to instrument calls"
+            )
+        self.env = make_env(export_env)
+        self.store: SecretStore = self.env.ENVIRON
+        if resilient:
+            retry_policy = retry_policy or RetryPolicy()
+            circuit_breaker = circuit_breaker or CircuitBreaker()
+        if rate_limiter is None:
+            rate_limiter = build_rate_limiter(
+                type(self).__name__,
+                rate_limit,
+                rate_burst,
+                rate_limit_max_wait,
+                shared_rate_limit,
+            )
+        self.backend_guard = BackendGuard(
+            type(self).__name__, retry_policy, circuit_breaker, rate_limiter
+        )
+        if cache is None and cache_ttl is not None:
+            cache = SecretCache(
+                ttl=cache_ttl,
+                max_size=cache_max_size,
+                keep_expired=circuit_breaker is not None,
+            )
+        self.cache = cache
+        self.cache_ttls: Dict[str, float] = dict(cache_ttls or {})
+        self.batch_max_workers = batch_max_workers
+        if cast_memo is None and memoize_casts:
+            cast_memo = CastMemo()
+        self.cast_memo = cast_memo
+        self.flatten_env = flatten_env
+        self.structured = StructuredSecrets()
+        self._inflight: Dict[str, "asyncio.Future[str]"] = {}
+        self.coalesced = 0
+
+    def _publish(self, secret_name: str, value: str) -> None:
+        """Expose a fetched value through ``self.env``."""
+        with self.store.lock:
+            self.store[secret_name] = value
+            if self.flatten_env:
+                self.structured.flatten(self.store, secret_name, value)
+
+    def _is_retryable(self, error: Exception) -> bool:
+        """Return whether ``error`` is transient (throttling, 5xx, network)."""
+        return False
+
+    @property
+    def retry_policy(self) -> Optional[RetryPolicy]:
+        return self.backend_guard.retry_policy
+
+    @property
+    def circuit_breaker(self) -> Optional[CircuitBreaker]:
+        return self.backend_guard.circuit_breaker
+
+    @property
+    def rate_limiter(self) -> Optional[TokenBucket]:
+        return self.backend_guard.rate_limiter
+
+    async def _call_backend(
+        self, func: Callable[..., Awaitable[Any]], *args, **kwargs
+    ) -> Any:
+        """Await a backend SDK call with retries and the circuit breaker.
+
+        Every attempt, retries included, takes a token from ``rate_limiter``.
+        """
+        guard = self.backend_guard
+        start = guard.admit()
+        attempt = 0
+        while True:
+            if guard.rate_limiter is not None:
+                try:
+                    await guard.rate_limiter.acquire_async()
+                except CloudSecretsError:
+                    guard.rate_limited()
+                    raise
+            try:
+                result = await func(*args, **kwargs)
+            except Exception as e:
+                delay = guard.failed(self._is_retryable(e), attempt, start)
+                if delay is None:
+                    raise
+                attempt += 1
+                await asyncio.sleep(delay)
+                continue
+            guard.succeeded()
+            return result
+
+    def _last_known_good(self, secret_name: str) -> Optional[str]:
+        """Return the cached value, even expired, while the breaker isn't closed."""
+        return self.backend_guard.last_known_good(self.cache, secret_name)
+
+    def backend_stats(self) -> Dict[str, Any]:
+        """Return retry counters and the circuit breaker state."""
+        return self.backend_guard.stats()
+
+    @abstractmethod
+    async def _fetch_raw_secret(self, secret_name: str) -> str:
+        """Fetch raw secret value from provider."""
+
+    @abstractmethod
+    async def _store_raw_secret(self, secret_name: str, secret_value: str) -> None:
+        """Store or update a secret value in the provider backend."""
+
+    @abstractmethod
+    async def _delete_raw_secret(self, secret_name: str) -> None:
+        """Delete a secret from the provider backend. No-op if not found."""
+
+    async def _fetch_raw_secrets(
+        self, secret_names: Sequence[str]
+    ) -> Tuple[Dict[str, str], Dict[str, Exception]]:
+        """Fetch several raw secrets concurrently with bounded parallelism."""
+        semaphore = asyncio.Semaphore(max(1, self.batch_max_workers))
+
+        async def fetch(secret_name: str) -> str:
+            async with semaphore:
+                return await self._get_raw_secret(secret_name)
+
+        results = await asyncio.gather(
+            *(fetch(secret_name) for secret_name in secret_names),
+            return_exceptions=True,
+        )
+        values: Dict[str, str] = {}
+        errors: Dict[str, Exception] = {}
+        for secret_name, result in zip(secret_names, results):
+            if isinstance(result, Exception):
+                errors[secret_name] = result
+            else:
+                values[secret_name] = result
+        return values, errors
+
+    async def _get_raw_secret(self, secret_name: str) -> str:
+        """Return the raw secret from cache or a shared in-flight fetch."""
+        if self.cache is not None:
+            value = self.cache.get(secret_name, _MISSING)
+            if value is not _MISSING:
+                return value
+
+        future = self._inflight.get(secret_name)
+        if future is None:
+            future = asyncio.ensure_future(self._fetch_and_cache(secret_name))
+            self._inflight[secret_name] = future
+            future.add_done_callback(lambda _: self._inflight.pop(secret_name, None))
+        else:
+            self.coalesced += 1
+        # Shield so one cancelled caller doesn't cancel the shared fetch
+        try:
+            return await asyncio.shield(future)
+        except CloudSecretsError:
+            stale = self._last_known_good(secret_name)
+            if stale is None:
+                raise
+            return stale
+
+    async def _fetch_and_cache(self, secret_name: str) -> str:
+        value = await self._fetch_raw_secret(secret_name)
+        if self.cache is not None:
+            self.cache.set(secret_name, value, ttl=self.cache_ttls.get(secret_name))
+        return value
+
+    def invalidate(self, secret_name: str) -> None:
+        """Drop a secret from the cache so the next read hits the backend."""
+        if self.cache is not None:
+            self.cache.invalidate(secret_name)
+        if self.cast_memo is not None:
+            self.cast_memo.discard(secret_name)
+        self.structured.discard(secret_name)
+
+    def clear_cache(self) -> None:
+        """Drop every cached secret."""
+        if self.cache is not None:
+            self.cache.clear()
+
+    async def set_secret(self, secret_name: str, secret_value: str) -> None:
+        """Create or update a secret."""
+        await self._store_raw_secret(secret_name, secret_value)
+        self.invalidate(secret_name)
+
+    async def delete_secret(self, secret_name: str) -> None:
+        """Delete a secret. No-op if it doesn't exist."""
+        await self._delete_raw_secret(secret_name)
+        self.invalidate(secret_name)
+        self.store.pop(secret_name, None)
+
+    async def close(self) -> None:
+        """Release network resources held by the provider."""
+
+    def get_env(self) -> Env:
+        return self.env
+
+    async def get_secret(
+        self,
+        secret_name: str,
+        cast_type: str = "str",
+        dict_fields: Optional[Mapping[str, Any]] = None,
+        field: Optional[str] = None,
+        **kwargs,
+    ) -> Any:
+        """Get secret with environ casting support, or one ``field`` of it."""
+        try:
+            raw = await self._get_raw_secret(secret_name)
+            if field is not None:
+                parsed = self.structured.get(secret_name, raw)
+                return get_field(parsed, secret_name, field, cast_type)
+            return cast_env_value(
+                self.env, secret_name, cast_type, dict_fields, self.cast_memo, **kwargs
+            )
+        except CloudSecretsError:
+            raise
+        except Exception as e:
+            raise SecretNotFoundError(
+                f"Error retrieving secret {secret_name}: {str(e)}"
+            )
+
+    async def get_secrets(
+        self,
+        secret_names: Iterable[str],
+        cast: Union[str, Mapping[str, str]] = "str",
+    ) -> SecretBatch:
+        """Get several secrets concurrently, reporting failures per name."""
+        names = list(dict.fromkeys(secret_names))
+        fetched, errors = await self._fetch_raw_secrets(names)
+
+        results: Dict[str, Any] = {}
+        for secret_name in names:
+            if secret_name not in fetched:
+                continue
+            cast_type = cast if isinstance(cast, str) else cast.get(secret_name, "str")
+            try:
+                results[secret_name] = cast_env_value(
+                    self.env, secret_name, cast_type, memo=self.cast_memo
+                )
+            except Exception as e:
+                errors[secret_name] = e
+
+        for secret_name, error in list(errors.items()):
+            if not isinstance(error, CloudSecretsError):
+                errors[secret_name] = SecretNotFoundError(
+                    f"Error retrieving secret {secret_name}: {str(error)}"
+                )
+        return SecretBatch(results, errors)
+
+    async def get_dict(
+        self, secret_name: str, field_types: Optional[Mapping[str, Any]] = None
+    ) -> Dict:
+        """Get secret as dictionary; structured secrets return their fields."""
+        try:
+            raw = await self._get_raw_secret(secret_name)
+            parsed = self.structured.get(secret_name, raw)
+            if parsed is None:
+                return cast_env_value(
+                    self.env, secret_name, "dict", field_types, self.cast_memo
+                )
+            return cast_fields(parsed, field_types)
+        except CloudSecretsError:
+            raise
+        except Exception as e:
+            raise SecretNotFoundError(
+                f"Error retrieving secret {secret_name}: {str(e)}"
+            )
+
+    async def get_list(self, secret_name: str) -> List:
+        """Get secret as list."""
+        return await self.get_secret(secret_name, cast_type="list")
+
+    async def get_bool(self, secret_name: str) -> bool:
+        """Get secret as boolean."""
+        return await self.get_secret(secret_name, cast_type="bool")
+
+    async def get_int(self, secret_name: str) -> int:
+        """Get secret as integer."""
+        return await self.get_secret(secret_name, cast_type="int")
+
+    async def get_float(self, secret_name: str) -> float:
+        """Get secret as float."""
+        return await self.get_secret(secret_name, cast_type="float")
+
+
+class ThreadedAsyncProvider(AsyncBaseSecretProvider):
+    """Runs a blocking provider's backend calls on a thread pool.
+
+    Used for SDKs without a native asyncio client (boto3, the local files).
+    """
+
+    def __init__(
+        self,
+        provider: BaseSecretProvider,
+        executor: Optional[ThreadPoolExecutor] = None,
+    ):
+        """Wrap ``provider``, sharing its environment and cache settings.
+
+        Raises ConfigurationError if ``provider`` has hooks, since calls made
+        through the wrapper bypass its instrumentation.
+        """
+        super().__init__(
+            hooks=provider.hooks,
+            cache=provider.cache,
+            cache_ttls=provider.cache_ttls,
+            batch_max_workers=provider.batch_max_workers,
+            cast_memo=provider.cast_memo,
+            memoize_casts=False,
+        )
+        self.provider = provider
+        # One breaker, retry policy and set of counters for both views
+        self.backend_guard = provider.backend_guard
+        self.env = provider.env
+        self.store = provider.store
+        self.structured = provider.structured
+        self._own_executor = executor is None
+        self.executor = executor or ThreadPoolExecutor(
+            max_workers=self.batch_max_workers,
+            thread_name_prefix="cloud-secrets",
+        )
+
+    async def _run(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, func, *args)
+
+    async def _fetch_raw_secret(self, secret_name: str) -> str:
+        return await self._run(self.provider._fetch_raw_secret, secret_name)
+
+    async def _fetch_raw_secrets(
+        self, secret_names: Sequence[str]
+    ) -> Tuple[Dict[str, str], Dict[str, Exception]]:
+        """Use the wrapped provider's bulk hook (e.g. AWS BatchGetSecretValue)."""
+        values: Dict[str, str] = {}
+        missing: List[str] = []
+        for secret_name in secret_names:
+            value = (
+                _MISSING
+                if self.cache is None
+                else self.cache.get(secret_name, _MISSING)
+            )
+            if value is _MISSING:
+                missing.append(secret_name)
+            else:
+                values[secret_name] = value
+        if not missing:
+            return values, {}
+
+        fetched, errors = await self._run(self.provider._fetch_raw_secrets, missing)
+        for secret_name, value in fetched.items():
+            values[secret_name] = value
+            if self.cache is not None:
+                self.cache.set(secret_name, value, ttl=self.cache_ttls.get(secret_name))
+        return values, dict(errors)
+
+    async def _store_raw_secret(self, secret_name: str, secret_value: str) -> None:
+        await self._run(self.provider._store_raw_secret, secret_name, secret_value)
+
+    async def _delete_raw_secret(self, secret_name: str) -> None:
+        await self._run(self.provider._delete_raw_secret, secret_name)
+
+    def backend_stats(self) -> Dict[str, Any]:
+        return self.provider.backend_stats()
+
+    async def close(self) -> None:
+        """Close the wrapped provider, then the thread pool if it was ours."""
+        await self._run(self.provider.close)
+        if self._own_executor:
+            self.executor.shutdown(wait=False)
@@ -0,0 +1,108 @@
+# cloud_secrets/providers/async_gcp_provider.py
+from google.cloud import secretmanager
+from google.api_core import exceptions
+from .async_base import AsyncBaseSecretProvider
+from .gcp_provider import RETRYABLE_ERRORS
+from cloud_secrets.common.exceptions import (
+    CloudSecretsError,
+    SecretNotFoundError,
+    ConfigurationError,
+)
+
+
+class AsyncGCPSecretsProvider(AsyncBaseSecretProvider):
+    """Google Cloud Secret Manager provider using the native asyncio client."""
+
+    def __init__(self, **kwargs):
+        """Initialize Google Cloud Secret Manager async client."""
+        super().__init__(**kwargs)
+        try:
+            self.project_id = kwargs.get("project_id")
+            if not self.project_id:
+                raise ConfigurationError("GCP project_id is required")
+            self.client = secretmanager.SecretManagerServiceAsyncClient()
+        except Exception as e:
+            raise ConfigurationError(
+                f"Failed to initialize GCP Secret Manager: {str(e)}"
+            )
+
+    def _is_retryable(self, error: Exception) -> bool:
+        return isinstance(error, RETRYABLE_ERRORS)
+
+    async def _fetch_raw_secret(self, secret_name: str) -> str:
+        """Fetch raw secret from Google Cloud Secret Manager."""
+        try:
+            name = f"projects/{self.project_id}/secrets/{secret_name}/versions/latest"
+            response = await self._call_backend(
+                self.client.access_secret_version, request={"name": name}
+            )
+            value = response.payload.data.decode("UTF-8")
+
+            self._publish(secret_name, value)
+
+            return value
+
+        except exceptions.NotFound:
+            raise SecretNotFoundError(f"Secret {secret_name} not found")
+        except CloudSecretsError:
+            raise
+        except Exception as e:
+            raise ConfigurationError(f"Error retrieving secret: {str(e)}")
+
+    async def _store_raw_secret(self, secret_name: str, secret_value: str) -> None:
+        parent = f"projects/{self.project_id}"
+        secret_path = f"{parent}/secrets/{secret_name}"
+        try:
+            await self._call_backend(
+                self.client.get_secret, request={"name": secret_path}
+            )
+        except exceptions.NotFound:
+            try:
+                await self._call_backend(
+                    self.client.create_secret,
+                    request={
+                        "parent": parent,
+                        "secret_id": secret_name,
+                        "secret": {"replication": {"automatic": {}}},
+                    },
+                )
+            except exceptions.AlreadyExists:
+                pass  # Another process created it; proceed to add_secret_version
+            except CloudSecretsError:
+                raise
+            except Exception as e:
+                raise ConfigurationError(
+                    f"Failed to create secret '{secret_name}': {e}"
+                )
+        except CloudSecretsError:
+            raise
+        except Exception as e:
+            raise ConfigurationError(f"Failed to store secret '{secret_name}': {e}")
+        try:
+            await self._call_backend(
+                self.client.add_secret_version,
+                request={
+                    "parent": secret_path,
+                    "payload": {"data": secret_value.encode("UTF-8")},
+                },
+            )
+        except CloudSecretsError:
+            raise
+        except Exception as e:
+            raise ConfigurationError(f"Failed to store secret '{secret_name}': {e}")
+
+    async def _delete_raw_secret(self, secret_name: str) -> None:
+        secret_path = f"projects/{self.project_id}/secrets/{secret_name}"
+        try:
+            await self._call_backend(
+                self.client.delete_secret, request={"name": secret_path}
+            )
+        except exceptions.NotFound:
+            pass
+        except CloudSecretsError:
+            raise
+        except Exception as e:
+            raise ConfigurationError(f"Failed to delete secret '{secret_name}': {e}")
+
+    async def close(self) -> None:
+        await self.client.transport.close()
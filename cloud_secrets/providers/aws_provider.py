@@ -1,69 +1,333 @@
-import io
-import json
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, Iterator, Mapping, Optional, Sequence, Tuple
 
 import boto3
-from botocore.exceptions import ClientError
+from botocore.config import Config
+from botocore.exceptions import ClientError, HTTPClientError
+from botocore.exceptions import ConnectionError as BotoConnectionError
 
 from cloud_secrets.common.exceptions import (
+    BackendUnavailableError,
     ConfigurationError,
     SecretNotFoundError,
 )
+from cloud_secrets.common.hedging import hedged_call
 from cloud_secrets.providers.base import BaseSecretProvider
 
 
+RETRYABLE_ERROR_CODES = {
+    "ThrottlingException",
+    "TooManyRequestsException",
+    "RequestLimitExceeded",
+    "InternalServiceError",
+    "InternalFailure",
+    "ServiceUnavailable",
+}
+
+
+def is_version_id(version: str) -> bool:
+    """Return whether ``version`` is a VersionId (a UUID) rather than a staging label.
+
+    Labels such as AWSCURRENT or a custom ``blue`` move between versions;
+    VersionIds never change.
+    """
+    try:
+        uuid.UUID(version)
+    except ValueError:
+        return False
+    return True
+
+
 class AWSSecretsProvider(BaseSecretProvider):
-    """AWS Secrets Manager provider."""
+    """AWS Secrets Manager provider.
+
+    Optional kwargs: ``credentials`` (mapping of ``aws_access_key_id``,
+    ``aws_secret_access_key``, ``aws_session_token``), ``max_pool_connections``
+    and ``keepalive`` (enables TCP keepalive on pooled connections).
+
+    Hedged reads are opt-in: with ``hedge_regions`` (regions the secrets are
+    replicated to), a ``get_secret_value`` that hasn't returned within
+    ``hedge_delay`` seconds is also sent to the first replica, then to the next
+    one after each further delay. The delay counts from when the primary call
+    starts, not from when it was queued. The first response wins; slower ones
+    are ignored. ``replica_clients`` maps regions to ready-made clients
+    instead. Replica calls take rate limit tokens, but only the primary region
+    is retried and counts for the circuit breaker. ``close()`` stops the
+    hedging threads.
+    """
 
-    def __init__(self, **kwargs):
+    # BatchGetSecretValue accepts at most 20 ids per call
+    BATCH_SIZE = 20
+
+    def __init__(
+        self,
+        hedge_regions: Sequence[str] = (),
+        hedge_delay: float = 0.1,
+        replica_clients: Optional[Mapping[str, Any]] = None,
+        **kwargs,
+    ):
         """Initialize AWS Secrets Manager client."""
         super().__init__(**kwargs)
         try:
             self.region_name = kwargs.get("region_name", "us-east-1")
-            self.client = boto3.client(
-                service_name="secretsmanager",
-                region_name=self.region_name,
-            )
+            self.cache_namespace = f"aws:{self.region_name}"
+            credentials = dict(kwargs.get("credentials") or {})
+            config = {}
+            if kwargs.get("max_pool_connections"):
+                config["max_pool_connections"] = kwargs["max_pool_connections"]
+            if kwargs.get("keepalive"):
+                config["tcp_keepalive"] = True
+
+            def client_for(region_name: str) -> Any:
+                return self._shared_client(
+                    (
+                        "aws",
+                        region_name,
+                        tuple(sorted(credentials.items())),
+                        tuple(sorted(config.items())),
+                    ),
+                    lambda: boto3.client(
+                        service_name="secretsmanager",
+                        region_name=region_name,
+                        **({"config": Config(**config)} if config else {}),
+                        **credentials,
+                    ),
+                )
+
+            self.client = client_for(self.region_name)
+            self.replica_clients: Dict[str, Any] = dict(replica_clients or {})
+            for region_name in hedge_regions:
+                if region_name not in self.replica_clients:
+                    self.replica_clients[region_name] = client_for(region_name)
         except Exception as e:
             raise ConfigurationError(
                 f"Failed to initialize AWS Secrets Manager: {str(e)}"
             )
+        self.hedge_delay = hedge_delay
+        self.hedges_issued = 0
+        self.hedges_won = 0
+        self._stats_lock = threading.Lock()
+        self._hedge_pool: Optional[ThreadPoolExecutor] = None
+        if self.replica_clients:
+            self._hedge_pool = ThreadPoolExecutor(
+                max_workers=self.batch_max_workers * (1 + len(self.replica_clients)),
+                thread_name_prefix="secret-hedge",
+            )
+
+    def _is_retryable(self, error: Exception) -> bool:
+        if isinstance(error, ClientError):
+            return error.response["Error"]["Code"] in RETRYABLE_ERROR_CODES
+        return isinstance(error, (BotoConnectionError, HTTPClientError))
+
+    def backend_stats(self) -> Dict[str, Any]:
+        stats = super().backend_stats()
+        stats["hedges_issued"] = self.hedges_issued
+        stats["hedges_won"] = self.hedges_won
+        return stats
+
+    def _get_secret_value(self, secret_name: str) -> dict:
+        """Call GetSecretValue, hedging across replica regions if configured."""
+        if self._hedge_pool is None:
+            return self._call_backend(
+                self.client.get_secret_value, SecretId=secret_name
+            )
+
+        calls = [
+            partial(
+                self._call_backend, self.client.get_secret_value, SecretId=secret_name
+            )
+        ] + [
+            partial(self._call_replica, client.get_secret_value, SecretId=secret_name)
+            for client in self.replica_clients.values()
+        ]
+        result = hedged_call(
+            self._hedge_pool,
+            calls,
+            lambda index: self.hedge_delay,
+            # The primary's answer is final (e.g. a secret not yet replicated)
+            # unless the region itself is unavailable
+            is_final=lambda index, error: (
+                index == 0 and not self._is_unavailable(error)
+            ),
+        )
+        with self._stats_lock:
+            self.hedges_issued += result.launched - 1
+            if result.index not in (None, 0):
+                self.hedges_won += 1
+        if result.index is None:
+            # Report the primary's error first
+            raise min(result.failures, key=lambda failure: failure[0])[1]
+        return result.value
+
+    def _call_replica(self, func: Callable[..., Any], **kwargs) -> Any:
+        """Call a replica region, taking a rate limit token first.
+
+        Retries and the circuit breaker track the primary region only.
+        """
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        return func(**kwargs)
+
+    def close(self) -> None:
+        """Stop the hedging thread pool; in-flight hedges are left to finish."""
+        if self._hedge_pool is not None:
+            self._hedge_pool.shutdown(wait=False)
+
+    def _is_unavailable(self, error: Exception) -> bool:
+        return isinstance(error, BackendUnavailableError) or self._is_retryable(error)
 
     def _fetch_raw_secret(self, secret_name: str) -> str:
         """Fetch raw secret from AWS Secrets Manager."""
         try:
-            response = self.client.get_secret_value(SecretId=secret_name)
+            response = self._get_secret_value(secret_name)
 
             if "SecretString" not in response:
                 raise SecretNotFoundError(f"Secret {secret_name} not found")
 
-            secret = response["SecretString"]
-            try:
-                secret_data = json.loads(secret)
-                if isinstance(secret_data, dict):
-                    # Destructure flat dicts into individual env vars
-                    content = "\n".join(
-                        [f"{key}={val}" for key, val in secret_data.items()]
-                    )
-                    self.env.read_env(io.StringIO(content))
-            except json.JSONDecodeError:
-                pass
-
-            # Always store and return the raw value
-            self.env.ENVIRON[secret_name] = secret
-            return secret
+            self._record_version(secret_name, response.get("VersionId"))
+            self._publish(secret_name, response["SecretString"])
+            return response["SecretString"]
         except ClientError as e:
             if e.response["Error"]["Code"] == "ResourceNotFoundException":
                 raise SecretNotFoundError(f"Secret {secret_name} not found")
             raise ConfigurationError(f"Error retrieving secret: {str(e)}")
 
+    def _is_pinned_version(self, version: str) -> bool:
+        return is_version_id(version)
+
+    def _fetch_raw_secret_version(self, secret_name: str, version: str) -> str:
+        """Fetch a version by VersionId, or by staging label (e.g. AWSPREVIOUS)."""
+        key = "VersionId" if is_version_id(version) else "VersionStage"
+        try:
+            response = self._call_backend(
+                self.client.get_secret_value, SecretId=secret_name, **{key: version}
+            )
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "ResourceNotFoundException":
+                raise SecretNotFoundError(
+                    f"Version {version} of secret {secret_name} not found"
+                )
+            raise ConfigurationError(f"Error retrieving secret: {str(e)}")
+        if "SecretString" not in response:
+            raise SecretNotFoundError(
+                f"Version {version} of secret {secret_name} not found"
+            )
+        return response["SecretString"]
+
+    def _fetch_current_version(self, secret_name: str) -> Optional[str]:
+        """Read the AWSCURRENT VersionId with DescribeSecret."""
+        try:
+            response = self._call_backend(
+                self.client.describe_secret, SecretId=secret_name
+            )
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "ResourceNotFoundException":
+                raise SecretNotFoundError(f"Secret {secret_name} not found")
+            raise ConfigurationError(f"Error describing secret: {str(e)}")
+        for version_id, stages in response.get("VersionIdsToStages", {}).items():
+            if "AWSCURRENT" in stages:
+                return version_id
+        return None
+
+    def _iter_secret_names(self, prefix: str) -> Iterator[str]:
+        """Page through ListSecrets, filtered server-side by name prefix."""
+        kwargs: Dict[str, Any] = {"MaxResults": 100}
+        if prefix:
+            kwargs["Filters"] = [{"Key": "name", "Values": [prefix]}]
+        while True:
+            try:
+                response = self._call_backend(self.client.list_secrets, **kwargs)
+            except ClientError as e:
+                raise ConfigurationError(f"Error listing secrets: {str(e)}")
+            for entry in response.get("SecretList", []):
+                # The name filter ignores case; prefixes here don't
+                if entry["Name"].startswith(prefix):
+                    yield entry["Name"]
+            if not response.get("NextToken"):
+                return
+            kwargs["NextToken"] = response["NextToken"]
+
+    def _fetch_raw_secrets(
+        self, secret_names: Sequence[str]
+    ) -> Tuple[Dict[str, str], Dict[str, Exception]]:
+        """Fetch secrets in chunks through BatchGetSecretValue."""
+        values: Dict[str, str] = {}
+        errors: Dict[str, Exception] = {}
+        for start in range(0, len(secret_names), self.BATCH_SIZE):
+            chunk = list(secret_names[start : start + self.BATCH_SIZE])
+            try:
+                chunk_values, chunk_errors = self._batch_get_chunk(chunk)
+            except ClientError as e:
+                if self._is_retryable(e):
+                    raise ConfigurationError(f"Error retrieving secrets: {str(e)}")
+                # e.g. no secretsmanager:BatchGetSecretValue permission
+                chunk_values, chunk_errors = super()._fetch_raw_secrets(chunk)
+            values.update(chunk_values)
+            errors.update(chunk_errors)
+        return values, errors
+
+    def _batch_get_chunk(
+        self, secret_names: Sequence[str]
+    ) -> Tuple[Dict[str, str], Dict[str, Exception]]:
+        values: Dict[str, str] = {}
+        errors: Dict[str, Exception] = {}
+        requested = set(secret_names)
+        kwargs = {"SecretIdList": list(secret_names)}
+        while True:
+            response = self._call_backend(self.client.batch_get_secret_value, **kwargs)
+            for entry in response.get("SecretValues", []):
+                # Callers may pass either the name or the ARN
+                secret_name = (
+                    entry.get("Name")
+                    if entry.get("Name") in requested
+                    else entry.get("ARN")
+                )
+                if secret_name not in requested:
+                    continue
+                if "SecretString" not in entry:
+                    errors[secret_name] = SecretNotFoundError(
+                        f"Secret {secret_name} not found"
+                    )
+                    continue
+                self._record_version(secret_name, entry.get("VersionId"))
+                self._publish(secret_name, entry["SecretString"])
+                values[secret_name] = entry["SecretString"]
+            for error in response.get("Errors", []):
+                secret_name = error.get("SecretId")
+                if error.get("ErrorCode") == "ResourceNotFoundException":
+                    errors[secret_name] = SecretNotFoundError(
+                        f"Secret {secret_name} not found"
+                    )
+                else:
+                    errors[secret_name] = ConfigurationError(
+                        f"Error retrieving secret {secret_name}: "
+                        f"{error.get('ErrorCode')}: {error.get('Message')}"
+                    )
+            if not response.get("NextToken"):
+                break
+            kwargs["NextToken"] = response["NextToken"]
+
+        for secret_name in requested - values.keys() - errors.keys():
+            errors[secret_name] = SecretNotFoundError(f"Secret {secret_name} not found")
+        return values, errors
+
     def _store_raw_secret(self, secret_name: str, secret_value: str) -> None:
         try:
-            self.client.put_secret_value(
-                SecretId=secret_name, SecretString=secret_value
+            self._call_backend(
+                self.client.put_secret_value,
+                SecretId=secret_name,
+                SecretString=secret_value,
             )
         except self.client.exceptions.ResourceNotFoundException:
             try:
-                self.client.create_secret(Name=secret_name, SecretString=secret_value)
+                self._call_backend(
+                    self.client.create_secret,
+                    Name=secret_name,
+                    SecretString=secret_value,
+                )
             except ClientError as e:
                 raise ConfigurationError(f"Failed to store secret '{secret_name}': {e}")
         except ClientError as e:
@@ -71,8 +335,10 @@ class AWSSecretsProvider(BaseSecretProvider):
 
     def _delete_raw_secret(self, secret_name: str) -> None:
         try:
-            self.client.delete_secret(
-                SecretId=secret_name, ForceDeleteWithoutRecovery=True
+            self._call_backend(
+                self.client.delete_secret,
+                SecretId=secret_name,
+                ForceDeleteWithoutRecovery=True,
             )
         except self.client.exceptions.ResourceNotFoundException:
             pass
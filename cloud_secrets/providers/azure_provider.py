@@ -1,52 +1,171 @@
 # cloud_secrets/providers/azure_provider.py
-import io
+from typing import Any, Iterator, List, Optional, Tuple
 
-from azure.core.exceptions import ResourceNotFoundError
+from azure.core.exceptions import (
+    HttpResponseError,
+    ResourceNotFoundError,
+    ServiceRequestError,
+    ServiceResponseError,
+)
 from azure.keyvault.secrets import SecretClient
 from azure.identity import DefaultAzureCredential
 from .base import BaseSecretProvider
 from cloud_secrets.common.exceptions import (
+    CloudSecretsError,
     SecretNotFoundError,
     ConfigurationError,
 )
 
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+def is_retryable_error(error: Exception) -> bool:
+    """Return whether an Azure SDK error is throttling, a 5xx or a network error."""
+    if isinstance(error, (ServiceRequestError, ServiceResponseError)):
+        return True
+    return (
+        isinstance(error, HttpResponseError)
+        and error.status_code in RETRYABLE_STATUS_CODES
+    )
+
 
 class AzureSecretsProvider(BaseSecretProvider):
-    """Azure Key Vault provider."""
+    """Azure Key Vault provider.
+
+    Optional kwargs: ``credentials`` (an azure-identity credential; by default
+    one DefaultAzureCredential is shared by every vault) and
+    ``max_pool_connections``. HTTP keep-alive is always on.
+    """
+
+    # Reading the current version downloads the value too
+    METADATA_VERSION_CHECK = False
 
     def __init__(self, **kwargs):
         """Initialize Azure Key Vault client."""
-        super().__init__()
+        super().__init__(**kwargs)
         try:
             vault_url = kwargs.get("vault_url")
             if not vault_url:
                 raise ConfigurationError("Azure vault_url is required")
-            credential = DefaultAzureCredential()
-            self.client = SecretClient(vault_url=vault_url, credential=credential)
+            self.cache_namespace = f"azure:{vault_url}"
+            credential = kwargs.get("credentials") or self._shared_client(
+                ("azure_credential",), DefaultAzureCredential
+            )
+            pool_size = kwargs.get("max_pool_connections")
+            self.client = self._shared_client(
+                ("azure", vault_url, credential, pool_size),
+                lambda: SecretClient(
+                    vault_url=vault_url,
+                    credential=credential,
+                    **self._transport_kwargs(pool_size),
+                ),
+            )
         except Exception as e:
             raise ConfigurationError(f"Failed to initialize Azure Key Vault: {str(e)}")
 
+    @staticmethod
+    def _transport_kwargs(pool_size):
+        if not pool_size:
+            return {}
+        import requests
+        from azure.core.pipeline.transport import RequestsTransport
+        from urllib3.util.retry import Retry
+
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            # The Azure pipeline retries; the adapter must not retry as well
+            max_retries=Retry(total=False, redirect=False, raise_on_status=False),
+        )
+        session.mount("https://", adapter)
+        return {"transport": RequestsTransport(session=session)}
+
+    def _is_retryable(self, error: Exception) -> bool:
+        return is_retryable_error(error)
+
     def _fetch_raw_secret(self, secret_name: str) -> str:
         """Fetch raw secret from Azure Key Vault."""
         try:
-            response = self.client.get_secret(secret_name)
-            # Create an env file format that environ can parse
-            self.env.read_env(io.StringIO(f"{secret_name}={response.value}"))
+            response = self._call_backend(self.client.get_secret, secret_name)
+            self._record_version(secret_name, response.properties.version)
+            self._publish(secret_name, response.value)
             return response.value
         except ResourceNotFoundError:
             raise SecretNotFoundError(f"Secret {secret_name} not found")
+        except CloudSecretsError:
+            raise
         except Exception as e:
             raise ConfigurationError(f"Error retrieving secret: {str(e)}")
 
+    def _iter_secret_names(self, prefix: str) -> Iterator[str]:
+        """Iterate the vault's secret properties, skipping disabled secrets.
+
+        Key Vault has no server-side name filter. Pages are requested on
+        demand, each through ``_call_backend``.
+        """
+        token: Optional[str] = None
+        while True:
+            try:
+                page, token = self._call_backend(self._list_page, token)
+            except CloudSecretsError:
+                raise
+            except Exception as e:
+                raise ConfigurationError(f"Error listing secrets: {str(e)}")
+            for properties in page:
+                if properties.enabled is False:
+                    continue
+                if properties.name.startswith(prefix):
+                    yield properties.name
+            if not token:
+                return
+
+    def _list_page(self, token: Optional[str]) -> Tuple[List[Any], Optional[str]]:
+        """Fetch the page of secret properties at ``token``, and the next token."""
+        pages = self.client.list_properties_of_secrets().by_page(
+            continuation_token=token
+        )
+        page = list(next(pages, []))
+        return page, pages.continuation_token
+
+    def _fetch_raw_secret_version(self, secret_name: str, version: str) -> str:
+        try:
+            response = self._call_backend(self.client.get_secret, secret_name, version)
+        except ResourceNotFoundError:
+            raise SecretNotFoundError(
+                f"Version {version} of secret {secret_name} not found"
+            )
+        except CloudSecretsError:
+            raise
+        except Exception as e:
+            raise ConfigurationError(f"Error retrieving secret: {str(e)}")
+        return response.value
+
+    def _fetch_current_version(self, secret_name: str) -> Optional[str]:
+        """Return the current version id.
+
+        Key Vault has no metadata-only read of the current version, so this is
+        a ``get_secret`` call; the value it returns is discarded.
+        """
+        try:
+            response = self._call_backend(self.client.get_secret, secret_name)
+        except ResourceNotFoundError:
+            raise SecretNotFoundError(f"Secret {secret_name} not found")
+        except CloudSecretsError:
+            raise
+        except Exception as e:
+            raise ConfigurationError(f"Error describing secret: {str(e)}")
+        return response.properties.version
+
     def _store_raw_secret(self, secret_name: str, secret_value: str) -> None:
         try:
-            self.client.set_secret(secret_name, secret_value)
+            self._call_backend(self.client.set_secret, secret_name, secret_value)
         except Exception as e:
             raise ConfigurationError(f"Failed to store secret '{secret_name}': {e}")
 
     def _delete_raw_secret(self, secret_name: str) -> None:
         try:
-            self.client.begin_delete_secret(secret_name)
+            self._call_backend(self.client.begin_delete_secret, secret_name)
         except ResourceNotFoundError:
             pass
         except Exception as e:
@@ -1,21 +1,361 @@
 """Base provider implementation."""
 
-import environ
+import logging
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from itertools import islice
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 from environ import Env
 
-from cloud_secrets.common.exceptions import CloudSecretsError, SecretNotFoundError
+from cloud_secrets.common.cache import SecretCache
+from cloud_secrets.common.cast_memo import CastMemo, cast_spec
+from cloud_secrets.common.clients import client_registry
+from cloud_secrets.common.disk_cache import EncryptedDiskCache
+from cloud_secrets.common.exceptions import (
+    CloudSecretsError,
+    ConfigurationError,
+    PreloadError,
+    SecretNotFoundError,
+)
+from cloud_secrets.common.instrumentation import Hook, OperationEvent
+from cloud_secrets.common.lazy import LazySecret
+from cloud_secrets.common.manifest import SecretSpec
+from cloud_secrets.common.rate_limit import TokenBucket, build_rate_limiter
+from cloud_secrets.common.resilience import BackendGuard, CircuitBreaker, RetryPolicy
+from cloud_secrets.common.singleflight import SingleFlight
+from cloud_secrets.common.store import SecretStore, make_env
+from cloud_secrets.common.structured import (
+    StructuredSecrets,
+    cast_fields,
+    get_field,
+    parse_structured,
+)
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class SecretBatch(NamedTuple):
+    """Result of a batch read: cast values plus per-name errors."""
+
+    values: Dict[str, Any]
+    errors: Dict[str, Exception]
+
+
+class WriteBatch(NamedTuple):
+    """Result of a batch write or delete: names done plus per-name errors."""
+
+    succeeded: List[str]
+    errors: Dict[str, Exception]
+
+
+def cast_env_value(
+    env: Env,
+    secret_name: str,
+    cast_type: str = "str",
+    dict_fields: Optional[Mapping[str, Any]] = None,
+    memo: Optional[CastMemo] = None,
+    **kwargs,
+) -> Any:
+    """Read a secret from ``env`` and cast it with the named environ method.
+
+    With ``memo`` the parsed result is reused until the raw value changes.
+    """
+
+    def cast() -> Any:
+        if cast_type == "dict" and dict_fields:
+            return env(secret_name, dict(value=str, cast=dict_fields))
+        return getattr(env, cast_type)(secret_name, **kwargs)
+
+    if memo is None:
+        return cast()
+    raw = env.ENVIRON.get(secret_name)
+    spec = cast_spec(cast_type, dict_fields, kwargs)
+    # "$OTHER" values are proxies whose result depends on another variable
+    if raw is None or spec is None or raw.startswith("$"):
+        return cast()
+    return memo.get_or_cast(secret_name, raw, spec, cast)
+
+
+def cast_raw_value(
+    secret_name: str,
+    raw: str,
+    cast_type: str = "str",
+    dict_fields: Optional[Mapping[str, Any]] = None,
+    **kwargs,
+) -> Any:
+    """Cast a value that is not in the provider's environment, e.g. an old version."""
+    env = Env()
+    # Env methods read self.ENVIRON, so an instance mapping isolates this value
+    env.ENVIRON = {secret_name: raw}
+    return cast_env_value(env, secret_name, cast_type, dict_fields, **kwargs)
 
 
 class BaseSecretProvider(ABC):
-    """Base class for secret providers with environ support."""
+    """Base class for secret providers with environ support.
 
-    def __init__(self, env_path: Optional[str] = None, **kwargs):
-        """Initialize the base provider with environ."""
-        self.env = environ.Env()
+    Thread-safety: a provider instance may be shared between threads. Fetched
+    values live in ``self.store`` (the ``ENVIRON`` of ``self.env``), a
+    lock-protected mapping; providers hold ``self.store.lock`` while writing
+    several keys for one secret so readers never see a partial update. The
+    cache and request coalescing are internally locked. Backend clients are
+    expected to be thread-safe, as boto3 clients, the GCP client and the Azure
+    ``SecretClient`` are.
+    """
+
+    # Whether _fetch_current_version is cheaper than fetching the value
+    METADATA_VERSION_CHECK = True
+
+    def __init__(
+        self,
+        env_path: Optional[str] = None,
+        cache: Optional[SecretCache] = None,
+        cache_ttl: Optional[float] = None,
+        cache_max_size: int = 128,
+        cache_ttls: Optional[Mapping[str, float]] = None,
+        batch_max_workers: int = 8,
+        coalesce_requests: bool = True,
+        export_env: bool = True,
+        disk_cache: Optional[EncryptedDiskCache] = None,
+        share_client: bool = True,
+        cast_memo: Optional[CastMemo] = None,
+        memoize_casts: bool = True,
+        flatten_env: bool = False,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        resilient: bool = False,
+        rate_limit: Optional[float] = None,
+        rate_burst: Optional[int] = None,
+        rate_limit_max_wait: Optional[float] = 5.0,
+        rate_limiter: Optional[TokenBucket] = None,
+        shared_rate_limit: Union[bool, Hashable] = False,
+        hooks: Optional[Sequence[Hook]] = None,
+        version_cache_size: int = 256,
+        **kwargs,
+    ):
+        """Initialize the base provider with environ.
+
+        Caching is off unless ``cache`` or ``cache_ttl`` is given. ``cache_ttls``
+        overrides the TTL for individual secret names. ``batch_max_workers``
+        bounds the thread pool used by the default ``_fetch_raw_secrets``.
+        With ``coalesce_requests`` concurrent reads of the same uncached name
+        share a single backend call. With ``export_env=False`` fetched secrets
+        are kept in a private store and never written to ``os.environ``.
+        ``disk_cache`` serves values persisted by an earlier process until the
+        backend has been consulted (stale-while-revalidate).
+        With ``share_client`` SDK clients come from the process-wide
+        ``client_registry`` so providers with the same settings reuse them.
+        With ``memoize_casts`` typed reads reuse parsed results until the raw
+        value changes; pass ``cast_memo=CastMemo(read_only=True)`` to get
+        read-only dicts and lists without copying.
+        JSON and multi-line ``KEY=VALUE`` secrets are parsed on demand for
+        ``get_secret(name, field=...)`` and ``get_dict``; with ``flatten_env``
+        their fields are also copied into the environment, once per value.
+        Backend calls failing with a retryable error (e.g. throttling) are
+        retried per ``retry_policy``, and ``circuit_breaker`` fails calls fast
+        while the backend keeps failing. Both are off unless given; with
+        ``resilient`` defaults are used for whichever is missing. While the
+        breaker is open, reads are served from ``cache`` entries, expired ones
+        included, so nothing is kept outside the configured cache.
+        ``rate_limit`` caps backend calls per second (bursts of ``rate_burst``);
+        a call that would queue longer than ``rate_limit_max_wait`` seconds
+        raises ``RateLimitExceededError``. With ``shared_rate_limit`` the bucket
+        is shared process-wide by every provider of the same class, or by
+        every provider given the same key; ``rate_limiter`` passes a bucket in.
+        ``hooks`` are called with an ``OperationEvent`` after each
+        ``get_secret``, ``get_dict``, ``set_secret`` and ``delete_secret``, and
+        for each name read by ``get_secrets``.
+        Values read with ``get_secret(name, version=...)`` for an immutable
+        version are kept in ``version_cache`` (up to ``version_cache_size``)
+        without expiry.
+        """
+        self.env = make_env(export_env, lazy=self.lazy)
+        self.store: SecretStore = self.env.ENVIRON
         self.env_path = env_path
+        if resilient:
+            retry_policy = retry_policy or RetryPolicy()
+            circuit_breaker = circuit_breaker or CircuitBreaker()
+        if cache is None and cache_ttl is not None:
+            cache = SecretCache(
+                ttl=cache_ttl,
+                max_size=cache_max_size,
+                # Expired values are served while the breaker is open
+                keep_expired=circuit_breaker is not None,
+            )
+        self.cache = cache
+        self.cache_ttls: Dict[str, float] = dict(cache_ttls or {})
+        self.batch_max_workers = batch_max_workers
+        self.single_flight = SingleFlight() if coalesce_requests else None
+        self.refresher = None
+        self._seen_versions: Dict[str, str] = {}
+        self.version_cache = SecretCache(ttl=None, max_size=version_cache_size)
+        self.disk_cache = disk_cache
+        self.cache_namespace = type(self).__name__
+        self.share_client = share_client
+        if cast_memo is None and memoize_casts:
+            cast_memo = CastMemo()
+        self.cast_memo = cast_memo
+        self.flatten_env = flatten_env
+        self.structured = StructuredSecrets()
+        self._preloaded: Dict[str, str] = {}
+        if rate_limiter is None:
+            rate_limiter = build_rate_limiter(
+                type(self).__name__,
+                rate_limit,
+                rate_burst,
+                rate_limit_max_wait,
+                shared_rate_limit,
+            )
+        self.backend_guard = BackendGuard(
+            type(self).__name__, retry_policy, circuit_breaker, rate_limiter
+        )
+        self.hooks: List[Hook] = list(hooks or ())
+        self._trace = threading.local()
+        self.payloads_skipped = 0
+        self.bytes_saved = 0
+        self._fetched: Set[str] = set()
+        self._revalidating: Set[str] = set()
+        self._revalidations: Set[Future] = set()
+        self._background_lock = threading.Lock()
+        self._background: Optional[ThreadPoolExecutor] = None
+
+    def _publish(self, secret_name: str, value: str) -> None:
+        """Expose a fetched value through ``self.env``."""
+        with self.store.lock:
+            self.store[secret_name] = value
+            if self.flatten_env:
+                self.structured.flatten(self.store, secret_name, value)
+
+    def add_hook(self, hook: Hook) -> None:
+        """Call ``hook`` with an ``OperationEvent`` after every operation."""
+        self.hooks.append(hook)
+
+    def remove_hook(self, hook: Hook) -> None:
+        self.hooks.remove(hook)
+
+    def _instrumented(
+        self,
+        operation: str,
+        secret_name: str,
+        func: Callable[..., Any],
+        *args,
+        size: Optional[int] = None,
+        **kwargs,
+    ) -> Any:
+        """Run ``func`` and report its duration, outcome and size to the hooks."""
+        trace = self._trace
+        trace.cache = trace.size = trace.saved_bytes = None
+        error = None
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            error = type(e).__name__
+            raise
+        finally:
+            event = OperationEvent(
+                type(self).__name__,
+                operation,
+                secret_name,
+                time.perf_counter() - start,
+                error,
+                trace.cache,
+                trace.size if size is None else size,
+                trace.saved_bytes,
+            )
+            self._emit(event)
+
+    def _emit(self, event: OperationEvent) -> None:
+        for hook in list(self.hooks):
+            try:
+                hook(event)
+            except Exception:
+                logger.exception("Instrumentation hook %r failed", hook)
+
+    def _is_retryable(self, error: Exception) -> bool:
+        """Return whether ``error`` is transient (throttling, 5xx, network)."""
+        return False
+
+    @property
+    def retry_policy(self) -> Optional[RetryPolicy]:
+        return self.backend_guard.retry_policy
+
+    @property
+    def circuit_breaker(self) -> Optional[CircuitBreaker]:
+        return self.backend_guard.circuit_breaker
+
+    @property
+    def rate_limiter(self) -> Optional[TokenBucket]:
+        return self.backend_guard.rate_limiter
+
+    def _call_backend(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Call the backend SDK with retries and the circuit breaker.
+
+        Errors that aren't retryable (e.g. not found) are raised at once and
+        count as a healthy backend. A retryable error is raised after the retry
+        policy gives up and counts as a failure for the breaker. Every attempt,
+        retries included, takes a token from ``rate_limiter``.
+        """
+        guard = self.backend_guard
+        start = guard.admit()
+        attempt = 0
+        while True:
+            if guard.rate_limiter is not None:
+                try:
+                    guard.rate_limiter.acquire()
+                except CloudSecretsError:
+                    guard.rate_limited()
+                    raise
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                delay = guard.failed(self._is_retryable(e), attempt, start)
+                if delay is None:
+                    raise
+                attempt += 1
+                guard.retry_policy.sleep(delay)
+                continue
+            guard.succeeded()
+            return result
+
+    def _last_known_good(self, secret_name: str) -> Optional[str]:
+        """Return the cached value, even expired, while the breaker isn't closed."""
+        return self.backend_guard.last_known_good(self.cache, secret_name)
+
+    def backend_stats(self) -> Dict[str, Any]:
+        """Return retry counters and the circuit breaker state."""
+        return {
+            **self.backend_guard.stats(),
+            "payloads_skipped": self.payloads_skipped,
+            "bytes_saved": self.bytes_saved,
+        }
+
+    def _shared_client(
+        self, key: Tuple[Hashable, ...], factory: Callable[[], Any]
+    ) -> Any:
+        """Return a registry client for ``key``, or a private one if not sharing."""
+        if not self.share_client:
+            return factory()
+        return client_registry.get(key, factory)
 
     @abstractmethod
     def _fetch_raw_secret(self, secret_name: str) -> str:
@@ -29,14 +369,392 @@ class BaseSecretProvider(ABC):
     def _delete_raw_secret(self, secret_name: str) -> None:
         """Delete a secret from the provider backend. No-op if not found."""
 
+    def _fetch_raw_secrets(
+        self, secret_names: Sequence[str]
+    ) -> Tuple[Dict[str, str], Dict[str, Exception]]:
+        """Fetch several raw secrets, returning values and per-name errors.
+
+        The default issues concurrent ``_fetch_raw_secret`` calls; providers with
+        a bulk endpoint override this.
+        """
+        values: Dict[str, str] = {}
+        errors: Dict[str, Exception] = {}
+        if not secret_names:
+            return values, errors
+
+        def fetch(secret_name: str) -> None:
+            try:
+                values[secret_name] = self._coalesced_fetch(secret_name)
+            except Exception as e:
+                errors[secret_name] = e
+
+        workers = max(1, min(self.batch_max_workers, len(secret_names)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(fetch, secret_names))
+        return values, errors
+
+    def _run_concurrently(
+        self, func: Callable[..., None], items: Sequence[Tuple]
+    ) -> Dict[str, Exception]:
+        """Call ``func(*item)`` for each item on the bounded pool.
+
+        Returns the errors keyed by each item's first element, the secret name.
+        """
+        errors: Dict[str, Exception] = {}
+        if not items:
+            return errors
+
+        def run(item: Tuple) -> None:
+            try:
+                func(*item)
+            except Exception as e:
+                errors[item[0]] = e
+
+        workers = max(1, min(self.batch_max_workers, len(items)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(run, items))
+        return errors
+
+    def _store_raw_secrets(self, secrets: Mapping[str, str]) -> Dict[str, Exception]:
+        """Store several secrets, returning per-name errors.
+
+        The default issues concurrent ``_store_raw_secret`` calls; providers
+        that can write a batch at once override this.
+        """
+        return self._run_concurrently(self._store_raw_secret, list(secrets.items()))
+
+    def _delete_raw_secrets(self, secret_names: Sequence[str]) -> Dict[str, Exception]:
+        """Delete several secrets concurrently, returning per-name errors."""
+        return self._run_concurrently(
+            self._delete_raw_secret, [(name,) for name in secret_names]
+        )
+
+    def _iter_secret_names(self, prefix: str) -> Iterator[str]:
+        """Yield the names starting with ``prefix``, a backend page at a time."""
+        raise ConfigurationError(
+            f"{type(self).__name__} does not support listing secrets"
+        )
+
+    def iter_secrets(
+        self,
+        prefix: str = "",
+        include_values: bool = False,
+        chunk_size: Optional[int] = None,
+    ) -> Iterator[Union[str, Tuple[str, str]]]:
+        """Lazily yield the names of secrets starting with ``prefix``.
+
+        Pages are requested from the backend as iteration reaches them. With
+        ``include_values`` ``(name, value)`` pairs are yielded instead; values
+        are read ``chunk_size`` names at a time (default four per batch worker)
+        through ``get_secrets``, so at most ``batch_max_workers`` requests run
+        at once. Secrets deleted between listing and reading are skipped.
+        """
+        names = self._iter_secret_names(prefix)
+        if not include_values:
+            yield from names
+            return
+        size = chunk_size or self.batch_max_workers * 4
+        while True:
+            chunk = list(islice(names, size))
+            if not chunk:
+                return
+            values, errors = self.get_secrets(chunk)
+            for error in errors.values():
+                if not isinstance(error, SecretNotFoundError):
+                    raise error
+            for secret_name in chunk:
+                if secret_name in values:
+                    yield secret_name, values[secret_name]
+
+    def _fetch_raw_secret_version(self, secret_name: str, version: str) -> str:
+        """Fetch one version of a secret. Providers with versions override this."""
+        raise ConfigurationError(
+            f"{type(self).__name__} does not support secret versions"
+        )
+
+    def _is_pinned_version(self, version: str) -> bool:
+        """Return whether ``version`` names one immutable version, not an alias."""
+        return True
+
+    def _fetch_current_version(self, secret_name: str) -> Optional[str]:
+        """Return the current version id without the value, if the backend has one."""
+        return None
+
+    def _get_raw_secret_version(self, secret_name: str, version: str) -> str:
+        """Return one version of a secret; pinned versions are cached forever."""
+        pinned = self._is_pinned_version(version)
+        key = (secret_name, version)
+        value = self.version_cache.get(key, _MISSING) if pinned else _MISSING
+        if self.hooks:
+            self._trace.cache = "miss" if value is _MISSING else "hit"
+        if value is not _MISSING:
+            return value
+        if self.single_flight is None:
+            value = self._fetch_raw_secret_version(secret_name, version)
+        else:
+            value = self.single_flight.do(
+                key, self._fetch_raw_secret_version, secret_name, version
+            )
+        if pinned:
+            self.version_cache.set(key, value)
+        return value
+
+    def _conditional_fetch(self, secret_name: str) -> Tuple[str, bool]:
+        """Return the latest raw value and whether it changed since last fetched.
+
+        If the backend reports the current version cheaply and it is the one
+        last fetched, the payload is not downloaded again.
+        """
+        old_value = self.store.get(secret_name)
+        old_version = self.seen_version(secret_name)
+        if (
+            self.METADATA_VERSION_CHECK
+            and old_value is not None
+            and old_version is not None
+            and self._fetch_current_version(secret_name) == old_version
+        ):
+            saved = len(old_value.encode("UTF-8"))
+            self.payloads_skipped += 1
+            self.bytes_saved += saved
+            if self.hooks:
+                self._trace.cache = "hit"
+                self._trace.saved_bytes = saved
+            return old_value, False
+        value = self._coalesced_fetch(secret_name)
+        if self.hooks:
+            self._trace.cache = "miss"
+            self._trace.size = len(value.encode("UTF-8"))
+        new_version = self.seen_version(secret_name)
+        if old_version is not None and new_version is not None:
+            return value, old_version != new_version
+        return value, old_value != value
+
+    def refresh_if_changed(self, secret_name: str) -> bool:
+        """Re-read a secret, downloading it only if its version changed.
+
+        The cache entry is renewed either way. Returns whether the value changed.
+        """
+        if self.hooks:
+            return self._instrumented(
+                "refresh_if_changed",
+                secret_name,
+                self._refresh_if_changed,
+                secret_name,
+            )
+        return self._refresh_if_changed(secret_name)
+
+    def _refresh_if_changed(self, secret_name: str) -> bool:
+        value, changed = self._conditional_fetch(secret_name)
+        self._cache_set(secret_name, value)
+        return changed
+
+    def get_secret_version(self, secret_name: str) -> Optional[str]:
+        """Return the id of the secret's current version.
+
+        Backends that can, read it without the value; Azure downloads the value.
+        Returns None for backends without versions (the local provider).
+        """
+        return self._fetch_current_version(secret_name)
+
+    def _cached_raw(self, secret_name: str) -> Any:
+        """Return a preloaded or fresh cached value, else ``_MISSING``."""
+        value = self._preloaded.get(secret_name, _MISSING)
+        if value is _MISSING and self.cache is not None:
+            value = self.cache.get(secret_name, _MISSING)
+        return value
+
+    def _local_raw(self, secret_name: str) -> Any:
+        """Return a value held in memory or the disk cache, else ``_MISSING``."""
+        value = self._cached_raw(secret_name)
+        if value is _MISSING:
+            value = self._disk_cache_get(secret_name)
+            if value is None:
+                return _MISSING
+            self._revalidate([secret_name])
+        return value
+
+    def _get_raw_secret(self, secret_name: str) -> str:
+        """Return the raw secret, serving it from the cache when fresh."""
+        value = self._local_raw(secret_name)
+        hit = value is not _MISSING
+        if self.hooks:
+            self._trace.cache = "hit" if hit else "miss"
+        if hit:
+            return value
+        return self._fetch_and_cache(secret_name)
+
+    def _fetch_and_cache(self, secret_name: str) -> str:
+        """Fetch from the backend and cache the value, or serve it stale."""
+        try:
+            value = self._coalesced_fetch(secret_name)
+        except CloudSecretsError:
+            stale = self._last_known_good(secret_name)
+            if stale is None:
+                raise
+            return stale
+        self._cache_set(secret_name, value)
+        return value
+
+    def _coalesced_fetch(self, secret_name: str) -> str:
+        """Fetch from the backend, sharing the call with concurrent readers."""
+        if self.single_flight is None:
+            return self._fetch_raw_secret(secret_name)
+        return self.single_flight.do(secret_name, self._fetch_raw_secret, secret_name)
+
+    def _cache_set(self, secret_name: str, value: str) -> None:
+        """Record a value just fetched from the backend."""
+        if secret_name in self._preloaded:
+            self._preloaded[secret_name] = value
+        if self.cache is not None:
+            self.cache.set(secret_name, value, ttl=self.cache_ttls.get(secret_name))
+        if self.disk_cache is not None:
+            self._fetched.add(secret_name)
+            self.disk_cache.put(self.cache_namespace, secret_name, value)
+        # Without a cache every read already goes to the backend
+        if self.refresher is not None and self.cache is not None:
+            self.refresher.schedule(secret_name)
+
+    def _disk_cache_get(self, secret_name: str) -> Optional[str]:
+        """Serve a persisted value for a secret not yet fetched by this process."""
+        if self.disk_cache is None or secret_name in self._fetched:
+            return None
+        value = self.disk_cache.get(self.cache_namespace, secret_name)
+        if value is None:
+            return None
+        self._publish(secret_name, value)
+        if self.cache is not None:
+            self.cache.set(secret_name, value, ttl=self.cache_ttls.get(secret_name))
+        return value
+
+    def _revalidate(self, secret_names: Sequence[str]) -> None:
+        """Re-fetch disk-served secrets from the backend in the background."""
+        with self._background_lock:
+            names = [n for n in secret_names if n not in self._revalidating]
+            if not names:
+                return
+            self._revalidating.update(names)
+            if self._background is None:
+                self._background = ThreadPoolExecutor(
+                    max_workers=2, thread_name_prefix="secret-revalidate"
+                )
+            future = self._background.submit(self._run_revalidation, names)
+            self._revalidations.add(future)
+        future.add_done_callback(self._revalidations.discard)
+
+    def _run_revalidation(self, secret_names: List[str]) -> None:
+        try:
+            values, errors = self._fetch_raw_secrets(secret_names)
+            for secret_name, value in values.items():
+                self._cache_set(secret_name, value)
+            for secret_name, error in errors.items():
+                if isinstance(error, SecretNotFoundError):
+                    self.invalidate(secret_name)
+                else:
+                    logger.warning(
+                        "Revalidating secret %s failed: %s", secret_name, error
+                    )
+        except Exception:
+            logger.exception("Revalidating secrets %s failed", secret_names)
+        finally:
+            with self._background_lock:
+                self._revalidating.difference_update(secret_names)
+
+    def wait_revalidated(self, timeout: Optional[float] = None) -> bool:
+        """Block until background revalidations finish. Returns False on timeout."""
+        with self._background_lock:
+            pending = set(self._revalidations)
+        if not pending:
+            return True
+        _, not_done = wait(pending, timeout=timeout)
+        return not not_done
+
+    def _record_version(self, secret_name: str, version: Any) -> None:
+        """Remember the backend version id of the value just fetched."""
+        if isinstance(version, str) and version:
+            self._seen_versions[secret_name] = version
+
+    def seen_version(self, secret_name: str) -> Optional[str]:
+        """Return the version id of the last fetched value, if the backend has one."""
+        return self._seen_versions.get(secret_name)
+
+    def invalidate(self, secret_name: str) -> None:
+        """Drop a secret from the cache so the next read hits the backend."""
+        if self.cache is not None:
+            self.cache.invalidate(secret_name)
+        if self.disk_cache is not None:
+            self.disk_cache.remove(self.cache_namespace, secret_name)
+        if self.cast_memo is not None:
+            self.cast_memo.discard(secret_name)
+        self.structured.discard(secret_name)
+        self._preloaded.pop(secret_name, None)
+
+    def clear_cache(self) -> None:
+        """Drop every cached and preloaded secret from memory."""
+        if self.cache is not None:
+            self.cache.clear()
+        self._preloaded.clear()
+
+    def close(self) -> None:
+        """Release threads the provider started, e.g. for hedged reads."""
+
     def set_secret(self, secret_name: str, secret_value: str) -> None:
         """Create or update a secret."""
+        if self.hooks:
+            return self._instrumented(
+                "set_secret",
+                secret_name,
+                self._set_secret,
+                secret_name,
+                secret_value,
+                size=len(secret_value.encode("UTF-8")),
+            )
+        self._set_secret(secret_name, secret_value)
+
+    def _set_secret(self, secret_name: str, secret_value: str) -> None:
         self._store_raw_secret(secret_name, secret_value)
+        self.invalidate(secret_name)
 
     def delete_secret(self, secret_name: str) -> None:
         """Delete a secret. No-op if it doesn't exist."""
+        if self.hooks:
+            return self._instrumented(
+                "delete_secret", secret_name, self._delete_secret, secret_name
+            )
+        self._delete_secret(secret_name)
+
+    def _delete_secret(self, secret_name: str) -> None:
         self._delete_raw_secret(secret_name)
-        self.env.ENVIRON.pop(secret_name, None)
+        self._forget(secret_name)
+
+    def _forget(self, secret_name: str) -> None:
+        """Drop every local trace of a deleted secret."""
+        self.invalidate(secret_name)
+        self._seen_versions.pop(secret_name, None)
+        self.version_cache.invalidate_where(lambda key: key[0] == secret_name)
+        if self.refresher is not None:
+            self.refresher.unwatch(secret_name)
+        self.store.pop(secret_name, None)
+
+    def set_secrets(self, secrets: Mapping[str, str]) -> WriteBatch:
+        """Create or update several secrets concurrently.
+
+        One failing secret does not stop the others; see ``WriteBatch.errors``.
+        """
+        secrets = dict(secrets)
+        errors = self._store_raw_secrets(secrets)
+        succeeded = [name for name in secrets if name not in errors]
+        for secret_name in succeeded:
+            self.invalidate(secret_name)
+        return WriteBatch(succeeded, errors)
+
+    def delete_secrets(self, secret_names: Iterable[str]) -> WriteBatch:
+        """Delete several secrets concurrently. Missing secrets count as deleted."""
+        names = list(dict.fromkeys(secret_names))
+        errors = self._delete_raw_secrets(names)
+        succeeded = [name for name in names if name not in errors]
+        for secret_name in succeeded:
+            self._forget(secret_name)
+        return WriteBatch(succeeded, errors)
 
     def get_env(self) -> Env:
         return self.env
@@ -46,17 +764,64 @@ class BaseSecretProvider(ABC):
         secret_name: str,
         cast_type: str = "str",
         dict_fields: Optional[Mapping[str, Any]] = None,
+        field: Optional[str] = None,
+        version: Optional[str] = None,
+        **kwargs,
+    ) -> Any:
+        """Get secret with environ casting support.
+
+        With ``field`` the secret must be structured (a JSON object or
+        ``KEY=VALUE`` lines) and that field is returned, cast to ``cast_type``.
+        With ``version`` that version is read instead of the current one; it
+        is not written to the environment.
+        """
+        if self.hooks:
+            return self._instrumented(
+                "get_secret",
+                secret_name,
+                self._get_secret,
+                secret_name,
+                cast_type,
+                dict_fields,
+                field,
+                version,
+                **kwargs,
+            )
+        return self._get_secret(
+            secret_name, cast_type, dict_fields, field, version, **kwargs
+        )
+
+    def _get_secret(
+        self,
+        secret_name: str,
+        cast_type: str = "str",
+        dict_fields: Optional[Mapping[str, Any]] = None,
+        field: Optional[str] = None,
+        version: Optional[str] = None,
         **kwargs,
     ) -> Any:
-        """Get secret with environ casting support."""
         try:
+            if version is not None:
+                raw = self._get_raw_secret_version(secret_name, version)
+                if self.hooks:
+                    self._trace.size = len(raw.encode("UTF-8"))
+                if field is not None:
+                    parsed = parse_structured(raw)
+                    return get_field(parsed, secret_name, field, cast_type)
+                return cast_raw_value(
+                    secret_name, raw, cast_type, dict_fields, **kwargs
+                )
+
             # First fetch the raw secret to populate the environment
-            self._fetch_raw_secret(secret_name)
+            raw = self._get_raw_secret(secret_name)
+            if self.hooks:
+                self._trace.size = len(raw.encode("UTF-8"))
+            if field is not None:
+                parsed = self.structured.get(secret_name, raw)
+                return get_field(parsed, secret_name, field, cast_type)
 
             # Then get it from the environment with proper casting
-            if cast_type == "dict" and dict_fields:
-                return self.env(secret_name, dict(value=str, cast=dict_fields))
-            return getattr(self.env, cast_type)(secret_name, **kwargs)
+            return self._cast_secret(secret_name, cast_type, dict_fields, **kwargs)
         except CloudSecretsError:
             raise
         except Exception as e:
@@ -64,11 +829,220 @@ class BaseSecretProvider(ABC):
                 f"Error retrieving secret {secret_name}: {str(e)}"
             )
 
+    def _cast_secret(
+        self,
+        secret_name: str,
+        cast_type: str = "str",
+        dict_fields: Optional[Mapping[str, Any]] = None,
+        **kwargs,
+    ) -> Any:
+        """Read an already-fetched secret from the environment and cast it."""
+        return cast_env_value(
+            self.env, secret_name, cast_type, dict_fields, self.cast_memo, **kwargs
+        )
+
+    def _get_raw_secrets(
+        self, secret_names: Sequence[str], hits: Optional[Set[str]] = None
+    ) -> Tuple[Dict[str, str], Dict[str, Exception]]:
+        """Return raw values from memory, the disk cache or one batched fetch.
+
+        Names served without a backend call are added to ``hits`` if given.
+        """
+        fetched: Dict[str, str] = {}
+        errors: Dict[str, Exception] = {}
+
+        missing = []
+        from_disk = []
+        for secret_name in secret_names:
+            value = self._cached_raw(secret_name)
+            if value is _MISSING:
+                value = self._disk_cache_get(secret_name)
+                if value is None:
+                    missing.append(secret_name)
+                    continue
+                from_disk.append(secret_name)
+            fetched[secret_name] = value
+            if hits is not None:
+                hits.add(secret_name)
+        if from_disk:
+            self._revalidate(from_disk)
+
+        if missing:
+            try:
+                values, fetch_errors = self._fetch_raw_secrets(missing)
+            except CloudSecretsError as e:
+                values, fetch_errors = {}, {name: e for name in missing}
+            for secret_name, value in values.items():
+                fetched[secret_name] = value
+                self._cache_set(secret_name, value)
+            for secret_name, error in fetch_errors.items():
+                stale = self._last_known_good(secret_name)
+                if stale is None:
+                    errors[secret_name] = error
+                else:
+                    fetched[secret_name] = stale
+        return fetched, errors
+
+    def get_secrets(
+        self,
+        secret_names: Iterable[str],
+        cast: Union[str, Mapping[str, str]] = "str",
+    ) -> SecretBatch:
+        """Get several secrets at once.
+
+        ``cast`` is either one cast type for every name or a mapping of name to
+        cast type (names missing from the mapping are read as strings). A
+        failure for one name is reported in ``errors`` instead of raising.
+        Hooks get one ``get_secrets`` event per name, each carrying the
+        duration of the whole batch.
+        """
+        if not self.hooks:
+            return self._get_secrets(secret_names, cast)
+        hits: Set[str] = set()
+        raw: Dict[str, str] = {}
+        start = time.perf_counter()
+        batch = self._get_secrets(secret_names, cast, hits, raw)
+        seconds = time.perf_counter() - start
+        for secret_name in list(batch.values) + list(batch.errors):
+            error = batch.errors.get(secret_name)
+            value = raw.get(secret_name)
+            self._emit(
+                OperationEvent(
+                    type(self).__name__,
+                    "get_secrets",
+                    secret_name,
+                    seconds,
+                    type(error).__name__ if error is not None else None,
+                    "hit" if secret_name in hits else "miss",
+                    len(value.encode("UTF-8")) if value is not None else None,
+                )
+            )
+        return batch
+
+    def _get_secrets(
+        self,
+        secret_names: Iterable[str],
+        cast: Union[str, Mapping[str, str]] = "str",
+        hits: Optional[Set[str]] = None,
+        raw: Optional[Dict[str, str]] = None,
+    ) -> SecretBatch:
+        names = list(dict.fromkeys(secret_names))
+        fetched, errors = self._get_raw_secrets(names, hits)
+        if raw is not None:
+            raw.update(fetched)
+
+        results: Dict[str, Any] = {}
+        for secret_name in names:
+            if secret_name not in fetched:
+                continue
+            cast_type = cast if isinstance(cast, str) else cast.get(secret_name, "str")
+            try:
+                results[secret_name] = self._cast_secret(secret_name, cast_type)
+            except Exception as e:
+                errors[secret_name] = SecretNotFoundError(
+                    f"Error retrieving secret {secret_name}: {str(e)}"
+                )
+
+        for secret_name, error in list(errors.items()):
+            if not isinstance(error, CloudSecretsError):
+                errors[secret_name] = SecretNotFoundError(
+                    f"Error retrieving secret {secret_name}: {str(error)}"
+                )
+        return SecretBatch(results, errors)
+
+    def preload(self, specs: Sequence[SecretSpec]) -> Dict[str, Any]:
+        """Fetch every secret in ``specs`` in one batch and keep it in memory.
+
+        Later reads of these names are served from memory, never from the
+        backend, until they are invalidated. Optional secrets that don't exist
+        take their default, which is returned but not stored or exported.
+        Raises PreloadError naming every required secret that is missing,
+        every secret whose read failed for another reason and every value
+        that doesn't cast.
+        """
+        fetched, fetch_errors = self._get_raw_secrets([spec.name for spec in specs])
+        values: Dict[str, Any] = {}
+        errors: Dict[str, Exception] = {}
+        for spec in specs:
+            error = fetch_errors.get(spec.name)
+            if spec.name not in fetched and error is not None:
+                if not isinstance(error, SecretNotFoundError):
+                    # A default stands in for a missing secret, not an outage
+                    errors[spec.name] = error
+                    continue
+            try:
+                if spec.name in fetched:
+                    values[spec.name] = self._cast_secret(spec.name, spec.cast)
+                elif spec.default is not None:
+                    values[spec.name] = cast_raw_value(
+                        spec.name, str(spec.default), spec.cast
+                    )
+                elif spec.required:
+                    errors[spec.name] = error or SecretNotFoundError(
+                        f"Secret {spec.name} not found"
+                    )
+            except Exception as e:
+                errors[spec.name] = ConfigurationError(
+                    f"Secret {spec.name} is not a valid {spec.cast}: {str(e)}"
+                )
+        if errors:
+            raise PreloadError(errors)
+        self._preloaded.update(
+            (name, fetched[name]) for name in values if name in fetched
+        )
+        return values
+
+    def lazy(
+        self,
+        secret_name: str,
+        cast: Union[str, Callable[[str], Any]] = "str",
+        **kwargs,
+    ) -> LazySecret:
+        """Return a proxy that fetches the secret the first time it is used.
+
+        ``cast`` is a cast type as for ``get_secret`` (e.g. ``"int"``) or a
+        callable applied to the string value. Other kwargs go to ``get_secret``.
+        """
+        if callable(cast):
+            return LazySecret(
+                secret_name, lambda: cast(self.get_secret(secret_name, **kwargs))
+            )
+        return LazySecret(
+            secret_name,
+            lambda: self.get_secret(secret_name, cast_type=cast, **kwargs),
+        )
+
     def get_dict(
         self, secret_name: str, field_types: Optional[Mapping[str, Any]] = None
     ) -> Dict:
-        """Get secret as dictionary with optional field type casting."""
-        return self.get_secret(secret_name, cast_type="dict", dict_fields=field_types)
+        """Get secret as dictionary with optional field type casting.
+
+        Structured secrets return their parsed fields; other values are parsed
+        as ``key=value,...`` by environ.
+        """
+        if self.hooks:
+            return self._instrumented(
+                "get_dict", secret_name, self._get_dict, secret_name, field_types
+            )
+        return self._get_dict(secret_name, field_types)
+
+    def _get_dict(
+        self, secret_name: str, field_types: Optional[Mapping[str, Any]] = None
+    ) -> Dict:
+        try:
+            raw = self._get_raw_secret(secret_name)
+            if self.hooks:
+                self._trace.size = len(raw.encode("UTF-8"))
+            parsed = self.structured.get(secret_name, raw)
+            if parsed is None:
+                return self._cast_secret(secret_name, "dict", field_types)
+            return cast_fields(parsed, field_types)
+        except CloudSecretsError:
+            raise
+        except Exception as e:
+            raise SecretNotFoundError(
+                f"Error retrieving secret {secret_name}: {str(e)}"
+            )
 
     def get_list(self, secret_name: str) -> List:
         """Get secret as list."""
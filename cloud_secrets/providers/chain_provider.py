@@ -0,0 +1,270 @@
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Set, Union
+
+from .base import _MISSING, BaseSecretProvider
+from cloud_secrets.common.hedging import hedged_call
+from cloud_secrets.common.exceptions import ConfigurationError, SecretNotFoundError
+
+logger = logging.getLogger(__name__)
+
+LayerSpec = Union[BaseSecretProvider, Mapping[str, Any]]
+
+
+class _Layer:
+    """One provider in a chain, with its timeout and recent latencies."""
+
+    def __init__(
+        self, name: str, provider: BaseSecretProvider, timeout: Optional[float]
+    ):
+        self.name = name
+        self.provider = provider
+        self.timeout = timeout
+        self.latencies: deque = deque(maxlen=100)
+        self.served = 0
+        self.not_found = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.hedges = 0
+        self.hedges_won = 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "served": self.served,
+            "not_found": self.not_found,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "hedges": self.hedges,
+            "hedges_won": self.hedges_won,
+            "p50": _percentile(self.latencies, 50),
+            "p99": _percentile(self.latencies, 99),
+        }
+
+
+def _percentile(samples: Sequence[float], percent: float) -> Optional[float]:
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(len(ordered) * percent / 100))
+    return ordered[index]
+
+
+class ChainProvider(BaseSecretProvider):
+    """Reads each secret from the first of several providers that has it.
+
+    ``layers`` are provider instances or dicts of ``SecretManager`` arguments,
+    e.g. ``{"provider_type": "aws", "region_name": "us-west-2"}``, optionally
+    with a ``name`` and a ``timeout`` in seconds (default ``layer_timeout``).
+    Layers built from dicts keep their values out of ``os.environ``; the chain
+    exports what it serves as any provider does.
+
+    Layers are tried in order. A layer that doesn't have the secret, fails or
+    exceeds its timeout passes the read on to the next one. With ``hedge_after``
+    (seconds) or ``hedge_percentile`` (e.g. 95, over the layer's last 100
+    successful reads, once it has ``hedge_min_samples``), a layer that is slow
+    but hasn't failed yet gets the next layer queried alongside it, and the
+    first success wins. ``serving_layer(name)`` and ``layer_stats()`` show which
+    layer served what. Writes and deletes go to the ``write_layer`` only.
+    """
+
+    def __init__(
+        self,
+        layers: Sequence[LayerSpec] = (),
+        layer_timeout: Optional[float] = None,
+        hedge_after: Optional[float] = None,
+        hedge_percentile: Optional[float] = None,
+        hedge_min_samples: int = 20,
+        write_layer: int = 0,
+        **kwargs,
+    ):
+        """Initialize the chain, building layers given as dicts."""
+        super().__init__(**kwargs)
+        if not layers:
+            raise ConfigurationError("ChainProvider requires at least one layer")
+        if not 0 <= write_layer < len(layers):
+            raise ConfigurationError(
+                f"write_layer {write_layer} is not one of the {len(layers)} layers"
+            )
+        self.layers: List[_Layer] = [
+            self._build_layer(index, spec, layer_timeout)
+            for index, spec in enumerate(layers)
+        ]
+        self.hedge_after = hedge_after
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_samples = hedge_min_samples
+        self.write_layer = write_layer
+        self._served_by: Dict[str, _Layer] = {}
+        self._stats_lock = threading.Lock()
+        # Abandoned (timed-out) layer calls keep a worker until they return
+        self._pool = ThreadPoolExecutor(
+            max_workers=max(4, self.batch_max_workers * len(self.layers)),
+            thread_name_prefix="secret-chain",
+        )
+
+    @staticmethod
+    def _build_layer(
+        index: int, spec: LayerSpec, default_timeout: Optional[float]
+    ) -> _Layer:
+        if isinstance(spec, BaseSecretProvider):
+            return _Layer(f"{index}:{type(spec).__name__}", spec, default_timeout)
+        options = dict(spec)
+        provider_type = options.pop("provider_type", None)
+        if provider_type is None:
+            raise ConfigurationError(f"Chain layer {index} has no provider_type")
+        name = options.pop("name", f"{index}:{provider_type}")
+        timeout = options.pop("timeout", default_timeout)
+        options.setdefault("export_env", False)
+
+        # Imported here: the manager module imports the provider registry
+        from cloud_secrets.secret_manager import SecretManager
+
+        return _Layer(name, SecretManager(provider_type, **options).provider, timeout)
+
+    def _hedge_delay(self, layer: _Layer) -> Optional[float]:
+        """Return how long to wait on ``layer`` before also asking the next one."""
+        if self.hedge_percentile is not None:
+            with self._stats_lock:
+                samples = list(layer.latencies)
+            if len(samples) >= self.hedge_min_samples:
+                return _percentile(samples, self.hedge_percentile)
+        return self.hedge_after
+
+    def _read_layer(self, layer: _Layer, secret_name: str) -> str:
+        provider = layer.provider
+        value = provider._local_raw(secret_name)
+        if value is not _MISSING:
+            # Served from the layer's memory; not a backend latency
+            return value
+        start = time.perf_counter()
+        value = provider._fetch_and_cache(secret_name)
+        with self._stats_lock:
+            layer.latencies.append(time.perf_counter() - start)
+        return value
+
+    def _fetch_raw_secret(self, secret_name: str) -> str:
+        """Return the value from the first layer to succeed."""
+        result = hedged_call(
+            self._pool,
+            [partial(self._read_layer, layer, secret_name) for layer in self.layers],
+            lambda index: self._hedge_delay(self.layers[index]),
+            timeouts=[layer.timeout for layer in self.layers],
+        )
+        failures: List[str] = []
+        with self._stats_lock:
+            for index in result.hedged:
+                self.layers[index].hedges += 1
+            for index, error in result.failures:
+                layer = self.layers[index]
+                if error is None:
+                    layer.timeouts += 1
+                    failures.append(f"{layer.name}: timed out")
+                elif isinstance(error, SecretNotFoundError):
+                    layer.not_found += 1
+                    failures.append(f"{layer.name}: not found")
+                else:
+                    layer.errors += 1
+                    failures.append(f"{layer.name}: {str(error)}")
+            if result.index in result.hedged and result.raced:
+                self.layers[result.index].hedges_won += 1
+        for index, error in result.failures:
+            if error is not None and not isinstance(error, SecretNotFoundError):
+                logger.warning(
+                    "Chain layer %s failed: %s", self.layers[index].name, error
+                )
+        if result.index is not None:
+            return self._served(secret_name, self.layers[result.index], result.value)
+
+        if all(failure.endswith(": not found") for failure in failures):
+            raise SecretNotFoundError(f"Secret {secret_name} not found")
+        raise ConfigurationError(
+            f"Error retrieving secret {secret_name} from every layer: "
+            + "; ".join(failures)
+        )
+
+    def _served(self, secret_name: str, layer: _Layer, value: str) -> str:
+        """Record which layer served ``secret_name`` and publish its value."""
+        with self._stats_lock:
+            layer.served += 1
+        self._served_by[secret_name] = layer
+        version = layer.provider.seen_version(secret_name)
+        if version is None:
+            self._seen_versions.pop(secret_name, None)
+        else:
+            self._record_version(secret_name, version)
+        self._publish(secret_name, value)
+        return value
+
+    def _iter_secret_names(self, prefix: str) -> Iterator[str]:
+        """Yield each name once, from every layer that can list secrets."""
+        listable = [
+            layer
+            for layer in self.layers
+            if type(layer.provider)._iter_secret_names
+            is not BaseSecretProvider._iter_secret_names
+        ]
+        if not listable:
+            raise ConfigurationError("No layer of this chain can list secrets")
+        seen: Set[str] = set()
+        for layer in listable:
+            for secret_name in layer.provider._iter_secret_names(prefix):
+                if secret_name not in seen:
+                    seen.add(secret_name)
+                    yield secret_name
+
+    def serving_layer(self, secret_name: str) -> Optional[str]:
+        """Return the name of the layer that last served ``secret_name``."""
+        layer = self._served_by.get(secret_name)
+        return layer.name if layer is not None else None
+
+    def layer_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Return per-layer counters and recent latency percentiles."""
+        with self._stats_lock:
+            return {layer.name: layer.stats() for layer in self.layers}
+
+    def backend_stats(self) -> Dict[str, Any]:
+        stats = super().backend_stats()
+        stats["layers"] = self.layer_stats()
+        return stats
+
+    def _version_layer(self, secret_name: str) -> _Layer:
+        return self._served_by.get(secret_name, self.layers[self.write_layer])
+
+    def _fetch_raw_secret_version(self, secret_name: str, version: str) -> str:
+        layer = self._version_layer(secret_name)
+        return layer.provider._get_raw_secret_version(secret_name, version)
+
+    def _is_pinned_version(self, version: str) -> bool:
+        # Each layer caches its own pinned versions
+        return False
+
+    def _fetch_current_version(self, secret_name: str) -> Optional[str]:
+        provider = self._version_layer(secret_name).provider
+        if not provider.METADATA_VERSION_CHECK:
+            return None
+        return provider._fetch_current_version(secret_name)
+
+    def _store_raw_secret(self, secret_name: str, secret_value: str) -> None:
+        self.layers[self.write_layer].provider.set_secret(secret_name, secret_value)
+
+    def _delete_raw_secret(self, secret_name: str) -> None:
+        self.layers[self.write_layer].provider.delete_secret(secret_name)
+        self._served_by.pop(secret_name, None)
+
+    def invalidate(self, secret_name: str) -> None:
+        super().invalidate(secret_name)
+        for layer in self.layers:
+            layer.provider.invalidate(secret_name)
+
+    def clear_cache(self) -> None:
+        super().clear_cache()
+        for layer in self.layers:
+            layer.provider.clear_cache()
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=False)
+        for layer in self.layers:
+            layer.provider.close()
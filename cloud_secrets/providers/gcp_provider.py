@@ -1,64 +1,207 @@
 # cloud_secrets/providers/gcp_provider.py
-import io
+from typing import Iterator, Optional, Set
+
 from google.cloud import secretmanager
 from google.api_core import exceptions
 from .base import BaseSecretProvider
 from cloud_secrets.common.exceptions import (
+    CloudSecretsError,
     SecretNotFoundError,
     ConfigurationError,
 )
 
+RETRYABLE_ERRORS = (
+    exceptions.ResourceExhausted,
+    exceptions.ServiceUnavailable,
+    exceptions.DeadlineExceeded,
+    exceptions.InternalServerError,
+    exceptions.TooManyRequests,
+)
+
 
 class GCPSecretsProvider(BaseSecretProvider):
-    """Google Cloud Secret Manager provider."""
+    """Google Cloud Secret Manager provider.
+
+    Optional kwargs: ``credentials`` (google.auth credentials) and
+    ``keepalive`` (seconds between gRPC keepalive pings). gRPC multiplexes
+    requests over one channel, so there is no connection pool to size.
+    """
 
     def __init__(self, **kwargs):
         """Initialize Google Cloud Secret Manager client."""
-        super().__init__()
+        super().__init__(**kwargs)
         try:
             self.project_id = kwargs.get("project_id")
             if not self.project_id:
                 raise ConfigurationError("GCP project_id is required")
-            self.client = secretmanager.SecretManagerServiceClient()
-            self._fetched_secrets = set()  # Just track names, not values
+            self.cache_namespace = f"gcp:{self.project_id}"
+            credentials = kwargs.get("credentials")
+            keepalive = kwargs.get("keepalive")
+            # Clients aren't bound to a project, so projects share them too
+            self.client = self._shared_client(
+                ("gcp", credentials, keepalive),
+                lambda: self._create_client(credentials, keepalive),
+            )
+            # Names known to exist, so writes can skip the existence probe
+            self._known_secrets: Set[str] = set()
         except Exception as e:
             raise ConfigurationError(
                 f"Failed to initialize GCP Secret Manager: {str(e)}"
             )
 
+    @staticmethod
+    def _create_client(credentials, keepalive):
+        if not keepalive:
+            if credentials is None:
+                return secretmanager.SecretManagerServiceClient()
+            return secretmanager.SecretManagerServiceClient(credentials=credentials)
+        transport_cls = secretmanager.SecretManagerServiceClient.get_transport_class(
+            "grpc"
+        )
+        channel = transport_cls.create_channel(
+            credentials=credentials,
+            options=[
+                ("grpc.keepalive_time_ms", int(keepalive * 1000)),
+                ("grpc.keepalive_permit_without_calls", 1),
+            ],
+        )
+        return secretmanager.SecretManagerServiceClient(
+            transport=transport_cls(channel=channel)
+        )
+
+    def _is_retryable(self, error: Exception) -> bool:
+        return isinstance(error, RETRYABLE_ERRORS)
+
     def _fetch_raw_secret(self, secret_name: str) -> str:
         """Fetch raw secret from Google Cloud Secret Manager."""
         try:
-            name = f"projects/{self.project_id}/secrets/{secret_name}/versions/latest"
-            response = self.client.access_secret_version(request={"name": name})
+            response = self._call_backend(
+                self.client.access_secret_version,
+                request={"name": self._version_path(secret_name, "latest")},
+            )
             value = response.payload.data.decode("UTF-8")
+            # response.name is the resolved version, e.g. .../versions/7
+            self._record_version(secret_name, _version_id(response.name))
 
-            # Track that we've fetched this secret
-            self._fetched_secrets.add(secret_name)
+            self._known_secrets.add(secret_name)
 
-            self.env.read_env(io.StringIO(value), overwrite=True)
-            self.env.ENVIRON[secret_name] = value
+            self._publish(secret_name, value)
 
             return value
 
         except exceptions.NotFound:
             raise SecretNotFoundError(f"Secret {secret_name} not found")
+        except CloudSecretsError:
+            raise
+        except Exception as e:
+            raise ConfigurationError(f"Error retrieving secret: {str(e)}")
+
+    def _iter_secret_names(self, prefix: str) -> Iterator[str]:
+        """Page through ListSecrets, requesting each page through the backend.
+
+        Every page is its own rate-limited, retried call; the pager's own
+        iteration would fetch later pages outside ``_call_backend``.
+        """
+        request = {"parent": f"projects/{self.project_id}"}
+        if prefix:
+            # A substring match; the prefix is checked below
+            request["filter"] = f"name:{prefix}"
+        while True:
+            try:
+                # Only the first response of the returned pager is read
+                page = self._call_backend(self.client.list_secrets, request=request)
+            except CloudSecretsError:
+                raise
+            except Exception as e:
+                raise ConfigurationError(f"Error listing secrets: {str(e)}")
+            for secret in page.secrets:
+                secret_id = secret.name.rsplit("/", 1)[-1]
+                if secret_id.startswith(prefix):
+                    self._known_secrets.add(secret_id)
+                    yield secret_id
+            if not page.next_page_token:
+                return
+            request = {**request, "page_token": page.next_page_token}
+
+    def _version_path(self, secret_name: str, version: str) -> str:
+        return f"projects/{self.project_id}/secrets/{secret_name}/versions/{version}"
+
+    def _is_pinned_version(self, version: str) -> bool:
+        # Version numbers are immutable; "latest" and custom aliases move
+        return version.isdigit()
+
+    def _fetch_raw_secret_version(self, secret_name: str, version: str) -> str:
+        try:
+            response = self._call_backend(
+                self.client.access_secret_version,
+                request={"name": self._version_path(secret_name, version)},
+            )
+        except exceptions.NotFound:
+            raise SecretNotFoundError(
+                f"Version {version} of secret {secret_name} not found"
+            )
+        except CloudSecretsError:
+            raise
         except Exception as e:
             raise ConfigurationError(f"Error retrieving secret: {str(e)}")
+        return response.payload.data.decode("UTF-8")
+
+    def _fetch_current_version(self, secret_name: str) -> Optional[str]:
+        """Resolve the ``latest`` alias with GetSecretVersion (no payload)."""
+        try:
+            response = self._call_backend(
+                self.client.get_secret_version,
+                request={"name": self._version_path(secret_name, "latest")},
+            )
+        except exceptions.NotFound:
+            raise SecretNotFoundError(f"Secret {secret_name} not found")
+        except CloudSecretsError:
+            raise
+        except Exception as e:
+            raise ConfigurationError(f"Error describing secret: {str(e)}")
+        return _version_id(response.name)
 
     def _store_raw_secret(self, secret_name: str, secret_value: str) -> None:
+        if secret_name in self._known_secrets:
+            try:
+                self._add_version(secret_name, secret_value)
+                return
+            except exceptions.NotFound:
+                # Deleted elsewhere since we saw it; create it again below
+                self._known_secrets.discard(secret_name)
+            except Exception as e:
+                raise ConfigurationError(f"Failed to store secret '{secret_name}': {e}")
+        self._ensure_secret(secret_name)
+        try:
+            self._add_version(secret_name, secret_value)
+        except Exception as e:
+            raise ConfigurationError(f"Failed to store secret '{secret_name}': {e}")
+        self._known_secrets.add(secret_name)
+
+    def _add_version(self, secret_name: str, secret_value: str) -> None:
+        self._call_backend(
+            self.client.add_secret_version,
+            request={
+                "parent": f"projects/{self.project_id}/secrets/{secret_name}",
+                "payload": {"data": secret_value.encode("UTF-8")},
+            },
+        )
+
+    def _ensure_secret(self, secret_name: str) -> None:
+        """Create the secret unless it already exists."""
         parent = f"projects/{self.project_id}"
         secret_path = f"{parent}/secrets/{secret_name}"
         try:
-            self.client.get_secret(request={"name": secret_path})
+            self._call_backend(self.client.get_secret, request={"name": secret_path})
         except exceptions.NotFound:
             try:
-                self.client.create_secret(
+                self._call_backend(
+                    self.client.create_secret,
                     request={
                         "parent": parent,
                         "secret_id": secret_name,
                         "secret": {"replication": {"automatic": {}}},
-                    }
+                    },
                 )
             except exceptions.AlreadyExists:
                 pass  # Another process created it; proceed to add_secret_version
@@ -68,21 +211,20 @@ class GCPSecretsProvider(BaseSecretProvider):
                 )
         except Exception as e:
             raise ConfigurationError(f"Failed to store secret '{secret_name}': {e}")
-        try:
-            self.client.add_secret_version(
-                request={
-                    "parent": secret_path,
-                    "payload": {"data": secret_value.encode("UTF-8")},
-                }
-            )
-        except Exception as e:
-            raise ConfigurationError(f"Failed to store secret '{secret_name}': {e}")
 
     def _delete_raw_secret(self, secret_name: str) -> None:
         secret_path = f"projects/{self.project_id}/secrets/{secret_name}"
+        self._known_secrets.discard(secret_name)
         try:
-            self.client.delete_secret(request={"name": secret_path})
+            self._call_backend(self.client.delete_secret, request={"name": secret_path})
         except exceptions.NotFound:
             pass
         except Exception as e:
             raise ConfigurationError(f"Failed to delete secret '{secret_name}': {e}")
+
+
+def _version_id(resource_name) -> Optional[str]:
+    """Return ``7`` from ``projects/p/secrets/s/versions/7``."""
+    if not isinstance(resource_name, str) or "/versions/" not in resource_name:
+        return None
+    return resource_name.rsplit("/", 1)[-1]
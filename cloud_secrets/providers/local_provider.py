@@ -1,18 +1,60 @@
 import json
 import os
+import re
+import tempfile
+import threading
+from contextlib import contextmanager, suppress
 from pathlib import Path
+from typing import Dict, Iterator, List, Mapping, Optional, Sequence, Set, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows has no flock
+    fcntl = None
 
 from .base import BaseSecretProvider
 from cloud_secrets.common.exceptions import ConfigurationError, SecretNotFoundError
 
+# A variable assignment in a .env file, as django-environ parses it
+ENV_LINE = re.compile(r"\A\s*(?:export\s+)?([A-Za-z_0-9]+)\s*=")
+
 
 class LocalEnvProvider(BaseSecretProvider):
-    """Local environment file provider."""
+    """Local environment file provider.
+
+    Secrets written with ``set_secret`` live in a ``.secrets.json`` snapshot
+    plus an append-only ``.secrets.journal`` of later changes. Both are loaded
+    into memory once and re-read only when their inode, mtime or size change,
+    so reads don't parse the file. A write appends one line to the journal;
+    once the journal holds more than ``journal_max_entries`` lines (and more
+    lines than there are secrets) it is folded back into ``.secrets.json``.
+    Call ``compact()`` to do that explicitly, e.g. before exporting the file.
+
+    Each journal starts with a header naming the snapshot it extends. A
+    ``.secrets.json`` dropped in from elsewhere doesn't match that header, so
+    the journal is discarded rather than replayed over the imported values,
+    and the next write starts a fresh one.
+
+    Writes hold a thread lock plus an exclusive ``flock`` on
+    ``.secrets.json.lock``, and the snapshot is replaced atomically, so
+    concurrent writers never lose updates and readers never see a partially
+    written file.
+    """
 
-    def __init__(self, **kwargs):
+    def __init__(self, journal_max_entries: int = 1000, **kwargs):
         """Initialize local environment provider."""
-        super().__init__()
+        super().__init__(**kwargs)
+        self._file_lock = threading.RLock()
         self.env_path = kwargs.get("env_path", ".env")
+        self.cache_namespace = f"local:{os.path.abspath(self.env_path)}"
+        self.journal_max_entries = journal_max_entries
+        self._sidecar: Dict[str, str] = {}
+        self._snapshot_stamp: Optional[Tuple[int, int, int]] = None
+        self._journal_inode: Optional[int] = None
+        self._journal_offset = 0
+        self._journal_entries = 0
+        # The journal on disk extends an older snapshot and must not be applied
+        self._journal_stale = False
         if not os.path.exists(self.env_path):
             raise ConfigurationError(f"Environment file not found: {self.env_path}")
         try:
@@ -23,38 +65,278 @@ class LocalEnvProvider(BaseSecretProvider):
     def _get_secrets_file_path(self) -> Path:
         return Path(self.env_path).parent / ".secrets.json"
 
+    def _get_journal_path(self) -> Path:
+        return Path(self.env_path).parent / ".secrets.journal"
+
     def _load_secrets_file(self) -> dict:
+        """Return the sidecar secrets, re-reading only what changed on disk."""
+        with self._file_lock:
+            self._revalidate_sidecar()
+            return self._sidecar
+
+    def _revalidate_sidecar(self) -> None:
+        snapshot = _stamp(self._get_secrets_file_path())
+        journal = _stamp(self._get_journal_path())
+        journal_inode = journal[0] if journal is not None else None
+        if (
+            snapshot != self._snapshot_stamp
+            or journal_inode != self._journal_inode
+            or (journal is not None and journal[2] < self._journal_offset)
+        ):
+            self._sidecar, self._snapshot_stamp = self._read_snapshot()
+            self._journal_inode = journal_inode
+            self._journal_offset = 0
+            self._journal_entries = 0
+            self._journal_stale = False
+        if journal is not None and journal[2] > self._journal_offset:
+            self._replay_journal()
+
+    def _read_snapshot(self) -> Tuple[Dict[str, str], Optional[Tuple[int, int, int]]]:
         path = self._get_secrets_file_path()
-        if not path.exists():
-            return {}
         try:
-            return json.loads(path.read_text())
+            with open(path, "rb") as f:
+                stamp = _fstamp(f.fileno())
+                raw = f.read()
+        except FileNotFoundError:
+            return {}, None
+        try:
+            return json.loads(raw), stamp
         except json.JSONDecodeError:
             raise ConfigurationError(f"Corrupt secrets file: {path}")
 
+    def _replay_journal(self) -> None:
+        path = self._get_journal_path()
+        with suppress(FileNotFoundError), open(path, "rb") as f:
+            if _fstamp(f.fileno())[0] != self._journal_inode:
+                # Replaced by a compaction since the stat; the next read reloads
+                return
+            f.seek(self._journal_offset)
+            data = f.read()
+            # A line without its newline is still being written; leave it
+            complete = data[: data.rfind(b"\n") + 1]
+            for line in complete.splitlines():
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    raise ConfigurationError(f"Corrupt secrets journal: {path}")
+                if entry["op"] == "snapshot":
+                    if tuple(entry["stamp"]) != self._snapshot_stamp:
+                        # .secrets.json was replaced by an import, not by
+                        # compaction: its values win over the old journal
+                        self._journal_stale = True
+                    continue
+                if self._journal_stale:
+                    break
+                _apply(self._sidecar, entry)
+                self._journal_entries += 1
+            self._journal_offset += len(complete)
+
+    def _append_journal(self, entries: List[dict]) -> None:
+        """Durably append ``entries`` and apply them; caller holds the file lock."""
+        if self._snapshot_stamp is None or self._journal_stale:
+            # Start a journal extending the current (possibly empty) snapshot
+            self._compact_locked()
+        path = self._get_journal_path()
+        payload = b"".join(json.dumps(entry).encode() + b"\n" for entry in entries)
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+        try:
+            # Drop a torn line left by a writer that crashed mid-append
+            os.ftruncate(fd, self._journal_offset)
+            self._journal_inode = _fstamp(fd)[0]
+            os.write(fd, payload)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        for entry in entries:
+            _apply(self._sidecar, entry)
+        self._journal_offset += len(payload)
+        self._journal_entries += len(entries)
+        if self._journal_entries > max(self.journal_max_entries, len(self._sidecar)):
+            self._compact_locked()
+
+    def compact(self) -> None:
+        """Fold the journal into ``.secrets.json`` and start an empty journal."""
+        with self._locked_secrets_file():
+            self._revalidate_sidecar()
+            self._compact_locked()
+
+    def _compact_locked(self) -> None:
+        self._save_secrets_file(self._sidecar)
+        self._snapshot_stamp = _stamp(self._get_secrets_file_path())
+        # Replace rather than truncate the journal so other processes notice
+        # the new inode and reload the snapshot
+        journal = self._get_journal_path()
+        header = (
+            json.dumps({"op": "snapshot", "stamp": self._snapshot_stamp}).encode()
+            + b"\n"
+        )
+        fd, tmp_path = tempfile.mkstemp(
+            dir=journal.parent, prefix=".secrets.", suffix=".tmp"
+        )
+        try:
+            self._journal_inode = _fstamp(fd)[0]
+            os.write(fd, header)
+            os.fsync(fd)
+            os.close(fd)
+            os.replace(tmp_path, journal)
+        except BaseException:
+            with suppress(FileNotFoundError):
+                os.unlink(tmp_path)
+            raise
+        self._journal_offset = len(header)
+        self._journal_entries = 0
+        self._journal_stale = False
+
     def _save_secrets_file(self, data: dict) -> None:
         path = self._get_secrets_file_path()
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(json.dumps(data, indent=2))
+        # Write to a temp file in the same directory, then rename over the
+        # original so readers see either the old or the new file, never a mix
+        fd, tmp_path = tempfile.mkstemp(
+            dir=path.parent, prefix=".secrets.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(json.dumps(data, indent=2))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            with suppress(FileNotFoundError):
+                os.unlink(tmp_path)
+            raise
+
+    @contextmanager
+    def _locked_secrets_file(self) -> Iterator[None]:
+        """Serialize sidecar writes across threads and processes."""
+        with self._file_lock:
+            path = self._get_secrets_file_path()
+            if fcntl is None:
+                yield
+                return
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path.with_name(path.name + ".lock"), "a") as lock_file:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
 
     def _fetch_raw_secret(self, secret_name: str) -> str:
         """Check JSON sidecar first, then fall back to .env."""
         secrets = self._load_secrets_file()
         if secret_name in secrets:
-            self.env.ENVIRON[secret_name] = secrets[secret_name]
+            self._publish(secret_name, secrets[secret_name])
             return secrets[secret_name]
         try:
             return self.env(secret_name)
         except Exception as e:
             raise SecretNotFoundError(f"Secret {secret_name} not found")
 
-    def _store_raw_secret(self, secret_name: str, secret_value: str) -> None:
+    def _iter_secret_names(self, prefix: str) -> Iterator[str]:
+        """Yield the sidecar's names, then those only defined in the .env file."""
+        seen: Set[str] = set()
+        for secret_name in sorted(self._load_secrets_file()):
+            seen.add(secret_name)
+            if secret_name.startswith(prefix):
+                yield secret_name
+        with open(self.env_path) as f:
+            for line in f:
+                match = ENV_LINE.match(line)
+                if match is None:
+                    continue
+                secret_name = match.group(1)
+                if secret_name not in seen and secret_name.startswith(prefix):
+                    seen.add(secret_name)
+                    yield secret_name
+
+    def _fetch_raw_secrets(
+        self, secret_names: Sequence[str]
+    ) -> Tuple[Dict[str, str], Dict[str, Exception]]:
+        """Revalidate the JSON sidecar once for the whole batch."""
         secrets = self._load_secrets_file()
-        secrets[secret_name] = secret_value
-        self._save_secrets_file(secrets)
+        values: Dict[str, str] = {}
+        errors: Dict[str, Exception] = {}
+        for secret_name in secret_names:
+            if secret_name in secrets:
+                self._publish(secret_name, secrets[secret_name])
+                values[secret_name] = secrets[secret_name]
+            elif secret_name in self.env:
+                values[secret_name] = self.env(secret_name)
+            else:
+                errors[secret_name] = SecretNotFoundError(
+                    f"Secret {secret_name} not found"
+                )
+        return values, errors
+
+    def _store_raw_secret(self, secret_name: str, secret_value: str) -> None:
+        with self._locked_secrets_file():
+            self._revalidate_sidecar()
+            self._append_journal(
+                [{"op": "set", "name": secret_name, "value": secret_value}]
+            )
 
     def _delete_raw_secret(self, secret_name: str) -> None:
-        secrets = self._load_secrets_file()
-        secrets.pop(secret_name, None)
-        self._save_secrets_file(secrets)
-        self.env.ENVIRON.pop(secret_name, None)
+        with self._locked_secrets_file():
+            self._revalidate_sidecar()
+            if secret_name in self._sidecar:
+                self._append_journal([{"op": "delete", "name": secret_name}])
+        self.store.pop(secret_name, None)
+
+    def _store_raw_secrets(self, secrets: Mapping[str, str]) -> Dict[str, Exception]:
+        """Append the whole batch to the journal in one write.
+
+        The batch is all or nothing: if the write fails every name reports it.
+        """
+        if not secrets:
+            return {}
+        entries = [
+            {"op": "set", "name": name, "value": value}
+            for name, value in secrets.items()
+        ]
+        try:
+            with self._locked_secrets_file():
+                self._revalidate_sidecar()
+                self._append_journal(entries)
+        except Exception as e:
+            return {name: e for name in secrets}
+        return {}
+
+    def _delete_raw_secrets(self, secret_names: Sequence[str]) -> Dict[str, Exception]:
+        """Append one journal write deleting every name present."""
+        try:
+            with self._locked_secrets_file():
+                self._revalidate_sidecar()
+                entries = [
+                    {"op": "delete", "name": name}
+                    for name in secret_names
+                    if name in self._sidecar
+                ]
+                if entries:
+                    self._append_journal(entries)
+        except Exception as e:
+            return {name: e for name in secret_names}
+        for secret_name in secret_names:
+            self.store.pop(secret_name, None)
+        return {}
+
+
+def _apply(secrets: Dict[str, str], entry: dict) -> None:
+    if entry["op"] == "set":
+        secrets[entry["name"]] = entry["value"]
+    else:
+        secrets.pop(entry["name"], None)
+
+
+def _stamp(path: Path) -> Optional[Tuple[int, int, int]]:
+    """Return (inode, mtime_ns, size) of ``path``, or None if it's missing."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_ino, st.st_mtime_ns, st.st_size
+
+
+def _fstamp(fd: int) -> Tuple[int, int, int]:
+    st = os.fstat(fd)
+    return st.st_ino, st.st_mtime_ns, st.st_size
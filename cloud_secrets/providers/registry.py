@@ -0,0 +1,36 @@
+"""Lazy lookup of provider classes so only the selected SDK is imported."""
+
+from importlib import import_module
+from importlib.metadata import entry_points
+from typing import Mapping, Type, Union
+
+from cloud_secrets.common.exceptions import ConfigurationError
+
+ProviderSpec = Union[str, type]
+
+
+def load_provider_class(
+    provider_type: str, providers: Mapping[str, ProviderSpec], group: str
+) -> Type:
+    """Resolve ``provider_type`` to a provider class.
+
+    ``providers`` maps names to classes or ``"module:Class"`` import paths,
+    which are imported on first use. Names not found there are looked up in
+    the ``group`` entry-point group, so other packages can register providers.
+    """
+    spec = providers.get(provider_type)
+    if spec is None:
+        matches = entry_points(group=group, name=provider_type)
+        if not matches:
+            raise ConfigurationError(f"Invalid provider type: {provider_type}")
+        spec = next(iter(matches)).value
+    if not isinstance(spec, str):
+        return spec
+
+    module_name, _, class_name = spec.partition(":")
+    try:
+        return getattr(import_module(module_name), class_name)
+    except (ImportError, AttributeError) as e:
+        raise ConfigurationError(
+            f"Failed to load provider {provider_type} from {spec}: {str(e)}"
+        )
@@ -0,0 +1,204 @@
+"""Background refresh-ahead and rotation detection for fetched secrets."""
+
+import heapq
+import logging
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from cloud_secrets.common.exceptions import SecretNotFoundError
+from cloud_secrets.providers.base import BaseSecretProvider
+
+logger = logging.getLogger(__name__)
+
+ChangeCallback = Callable[[str, Optional[str], str], None]
+
+
+class SecretRefresher:
+    """Re-fetches watched secrets shortly before they expire from the cache.
+
+    Every secret a caching provider fetches while the refresher runs is
+    watched. A refresh is scheduled ``refresh_ahead`` seconds before its cache
+    entry expires (or every ``interval`` seconds when the entry never
+    expires), moved earlier by a random fraction of up to ``jitter`` so a fleet
+    of processes spreads its requests out. Refreshes run on a pool of at most
+    ``max_workers`` threads.
+
+    Where the backend reports a secret's current version without its value
+    (AWS, GCP), an unchanged secret is not downloaded again. When a refreshed
+    value has a new backend version (or, for backends without versions, a new
+    value), the registered ``on_change(name, old, new)`` callbacks are invoked
+    from a worker thread.
+    """
+
+    def __init__(
+        self,
+        provider: BaseSecretProvider,
+        refresh_ahead: float = 30.0,
+        interval: float = 300.0,
+        max_workers: int = 4,
+        jitter: float = 0.1,
+        retry_delay: float = 5.0,
+    ):
+        self.provider = provider
+        self.refresh_ahead = refresh_ahead
+        self.interval = interval
+        self.max_workers = max_workers
+        self.jitter = jitter
+        self.retry_delay = retry_delay
+
+        self._callbacks: List[Tuple[ChangeCallback, Optional[Set[str]]]] = []
+        self._heap: List[Tuple[float, str]] = []
+        self._due: Dict[str, float] = {}
+        self._running: Set[str] = set()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._stopped = False
+
+        self.refreshes = 0
+        self.changes = 0
+        self.failures = 0
+
+    def on_change(
+        self, callback: ChangeCallback, secret_names: Optional[List[str]] = None
+    ) -> None:
+        """Register ``callback(name, old, new)``, optionally for some names only."""
+        names = set(secret_names) if secret_names is not None else None
+        self._callbacks.append((callback, names))
+
+    def start(self) -> None:
+        """Start the scheduler thread and attach to the provider."""
+        with self._condition:
+            if self._thread is not None:
+                return
+            self._stopped = False
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="secret-refresh"
+            )
+            self._thread = threading.Thread(
+                target=self._run, name="secret-refresher", daemon=True
+            )
+            self.provider.refresher = self
+            self._thread.start()
+
+    def stop(self, wait: bool = True) -> None:
+        """Stop scheduling refreshes and detach from the provider."""
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+            thread, executor = self._thread, self._executor
+            self._thread = self._executor = None
+        if self.provider.refresher is self:
+            self.provider.refresher = None
+        if thread is not None:
+            thread.join()
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def schedule(self, secret_name: str, delay: Optional[float] = None) -> None:
+        """Schedule the next refresh of ``secret_name``.
+
+        A name already due sooner keeps its earlier refresh.
+        """
+        if delay is None:
+            delay = self._next_delay(secret_name)
+        due = time.monotonic() + delay
+        with self._condition:
+            if self._stopped:
+                return
+            scheduled = self._due.get(secret_name)
+            if scheduled is not None and scheduled <= due:
+                return
+            self._due[secret_name] = due
+            heapq.heappush(self._heap, (due, secret_name))
+            self._condition.notify()
+
+    def unwatch(self, secret_name: str) -> None:
+        """Stop refreshing ``secret_name``."""
+        with self._condition:
+            self._due.pop(secret_name, None)
+
+    def watched(self) -> List[str]:
+        with self._condition:
+            return sorted(self._due)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "watched": len(self._due),
+            "refreshes": self.refreshes,
+            "changes": self.changes,
+            "failures": self.failures,
+        }
+
+    def _next_delay(self, secret_name: str) -> float:
+        remaining = None
+        if self.provider.cache is not None:
+            ttl_remaining = getattr(self.provider.cache, "ttl_remaining", None)
+            if ttl_remaining is not None:
+                remaining = ttl_remaining(secret_name)
+        if remaining is None:
+            delay = self.interval
+        else:
+            delay = max(0.0, remaining - self.refresh_ahead)
+        return delay * (1 - self.jitter * random.random())
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._stopped:
+                    now = time.monotonic()
+                    if self._heap and self._heap[0][0] <= now:
+                        break
+                    timeout = self._heap[0][0] - now if self._heap else None
+                    self._condition.wait(timeout)
+                if self._stopped:
+                    return
+                due, secret_name = heapq.heappop(self._heap)
+                # Skip entries superseded by a later schedule() or unwatch()
+                if self._due.get(secret_name) != due:
+                    continue
+                if secret_name in self._running:
+                    continue
+                del self._due[secret_name]
+                self._running.add(secret_name)
+                executor = self._executor
+            executor.submit(self._refresh, secret_name)
+
+    def _refresh(self, secret_name: str) -> None:
+        provider = self.provider
+        old_value = provider.store.get(secret_name)
+        try:
+            new_value, changed = provider._conditional_fetch(secret_name)
+        except SecretNotFoundError:
+            logger.warning("Secret %s disappeared; no longer refreshing", secret_name)
+            with self._condition:
+                self._running.discard(secret_name)
+            return
+        except Exception:
+            self.failures += 1
+            logger.warning("Refreshing secret %s failed", secret_name, exc_info=True)
+            with self._condition:
+                self._running.discard(secret_name)
+            self.schedule(secret_name, delay=self.retry_delay)
+            return
+
+        self.refreshes += 1
+        with self._condition:
+            self._running.discard(secret_name)
+        # Re-caching reschedules the next refresh
+        provider._cache_set(secret_name, new_value)
+        if changed:
+            self.changes += 1
+            self._notify(secret_name, old_value, new_value)
+
+    def _notify(self, secret_name: str, old: Optional[str], new: str) -> None:
+        for callback, names in list(self._callbacks):
+            if names is not None and secret_name not in names:
+                continue
+            try:
+                callback(secret_name, old, new)
+            except Exception:
+                logger.exception("on_change callback failed for %s", secret_name)
@@ -1,46 +1,220 @@
 """Secret Manager implementation."""
 
-from typing import Any
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from environ import Env
 
-from cloud_secrets.common.exceptions import ConfigurationError
-from cloud_secrets.providers.aws_provider import AWSSecretsProvider
-from cloud_secrets.providers.gcp_provider import GCPSecretsProvider
-from cloud_secrets.providers.azure_provider import AzureSecretsProvider
-from cloud_secrets.providers.local_provider import LocalEnvProvider
-from cloud_secrets.providers.base import BaseSecretProvider
+from cloud_secrets.common.instrumentation import Hook
+from cloud_secrets.common.lazy import LazySecret
+from cloud_secrets.common.manifest import Manifest, load_manifest
+from cloud_secrets.providers.base import BaseSecretProvider, SecretBatch, WriteBatch
+from cloud_secrets.providers.registry import ProviderSpec, load_provider_class
+from cloud_secrets.refresher import ChangeCallback, SecretRefresher
+from cloud_secrets.snapshot import LiveSnapshot, SecretSnapshot
 
 
 class SecretManager:
-    """Main class for managing secrets across different providers."""
+    """Main class for managing secrets across different providers.
 
-    PROVIDERS = {
-        "aws": AWSSecretsProvider,
-        "gcp": GCPSecretsProvider,
-        "azure": AzureSecretsProvider,
-        "local": LocalEnvProvider,
+    Provider classes are imported only when selected, so e.g. a local-only
+    process never loads the cloud SDKs. Other packages can add providers under
+    the ``cloud_secrets.providers`` entry-point group.
+    """
+
+    PROVIDERS: Dict[str, ProviderSpec] = {
+        "aws": "cloud_secrets.providers.aws_provider:AWSSecretsProvider",
+        "gcp": "cloud_secrets.providers.gcp_provider:GCPSecretsProvider",
+        "azure": "cloud_secrets.providers.azure_provider:AzureSecretsProvider",
+        "local": "cloud_secrets.providers.local_provider:LocalEnvProvider",
+        "chain": "cloud_secrets.providers.chain_provider:ChainProvider",
     }
+    ENTRY_POINT_GROUP = "cloud_secrets.providers"
 
     def __init__(self, provider_type: str, **kwargs):
         """Initialize the secret manager with specified provider.
 
         Args:
-            provider_type: Type of provider ('aws', 'gcp', 'azure', or 'local')
-            **kwargs: Provider-specific configuration options
+            provider_type: Type of provider ('aws', 'gcp', 'azure', 'local' or
+                'chain')
+            **kwargs: Provider-specific configuration options. All providers
+                also accept ``cache_ttl``, ``cache_max_size``, ``cache_ttls``
+                and ``cache`` to enable in-process caching of fetched secrets.
 
         Raises:
             ConfigurationError: If provider type is invalid or configuration is incomplete
         """
-        if provider_type not in self.PROVIDERS:
-            raise ConfigurationError(f"Invalid provider type: {provider_type}")
-
-        self.provider: BaseSecretProvider = self.PROVIDERS[provider_type](**kwargs)
+        provider_class = load_provider_class(
+            provider_type, self.PROVIDERS, self.ENTRY_POINT_GROUP
+        )
+        self.provider: BaseSecretProvider = provider_class(**kwargs)
+        self.refresher: Optional[SecretRefresher] = None
 
     def get_secret(self, secret_name: str, **kwargs) -> Any:
-        """Get a secret by name."""
+        """Get a secret by name; pass ``version=`` to read a specific version."""
         return self.provider.get_secret(secret_name, **kwargs)
 
+    def lazy(
+        self,
+        secret_name: str,
+        cast: Union[str, Callable[[str], Any]] = "str",
+        **kwargs,
+    ) -> LazySecret:
+        """Reference a secret without fetching it until it is first used.
+
+        Meant for settings modules, where most secrets go unused by a given
+        command. ``get_env().lazy(...)`` does the same.
+
+        Args:
+            secret_name: Name of the secret
+            cast: Cast type as for ``get_secret`` (e.g. ``"int"``), or a
+                callable applied to the string value
+            **kwargs: Passed to ``get_secret`` (e.g. ``field``)
+
+        Returns:
+            A LazySecret proxy; ``.value`` fetches and returns the value
+        """
+        return self.provider.lazy(secret_name, cast, **kwargs)
+
+    def get_secret_version(self, secret_name: str) -> Optional[str]:
+        """Return the id of a secret's current version.
+
+        AWS and GCP read only metadata. Azure Key Vault has no metadata-only
+        read of the current version, so there the value is downloaded too.
+
+        Args:
+            secret_name: Name of the secret
+
+        Returns:
+            The backend's version id (AWS VersionId, GCP version number, Azure
+            version), or None if the provider has no versions
+        """
+        return self.provider.get_secret_version(secret_name)
+
+    def refresh_if_changed(self, secret_name: str) -> bool:
+        """Re-read a secret, downloading its value only if its version changed.
+
+        AWS and GCP compare the current version id first; other providers
+        always fetch the value.
+
+        Args:
+            secret_name: Name of the secret
+
+        Returns:
+            True if the value changed since it was last fetched
+        """
+        return self.provider.refresh_if_changed(secret_name)
+
+    def iter_secrets(
+        self,
+        prefix: str = "",
+        include_values: bool = False,
+        chunk_size: Optional[int] = None,
+    ) -> Iterator[Union[str, Tuple[str, str]]]:
+        """Lazily list the secrets whose names start with a prefix.
+
+        Backend pages are requested only as the iteration reaches them.
+
+        Args:
+            prefix: Only names starting with this are yielded
+            include_values: Yield ``(name, value)`` pairs instead of names
+            chunk_size: Names whose values are fetched together, at most
+                ``batch_max_workers`` requests at a time
+
+        Returns:
+            An iterator of names, or of ``(name, value)`` pairs
+        """
+        return self.provider.iter_secrets(prefix, include_values, chunk_size)
+
+    def load_namespace(self, prefix: str, strip_prefix: bool = False) -> SecretSnapshot:
+        """Fetch every secret under a prefix into an immutable snapshot.
+
+        Names are listed and values read in bulk (see ``iter_secrets``). Pass
+        ``export_env=False`` to the manager to keep them out of ``os.environ``.
+
+        Args:
+            prefix: Namespace to load, e.g. ``"myapp/prod/"``
+            strip_prefix: Key the snapshot by names without the prefix
+
+        Returns:
+            A hashable SecretSnapshot with typed accessors (get_int, get_bool,
+            get_dict, ...)
+        """
+        values = self.iter_secrets(prefix, include_values=True)
+        if strip_prefix:
+            values = ((name[len(prefix) :], value) for name, value in values)
+        return SecretSnapshot(values)
+
+    def watch_namespace(self, prefix: str, strip_prefix: bool = False) -> LiveSnapshot:
+        """Load a namespace into a snapshot that is replaced whole when it changes.
+
+        Call ``refresh()`` on the result to reload the namespace. If the
+        background refresher is running, rotations it detects under the prefix
+        are swapped in as they happen.
+
+        Args:
+            prefix: Namespace to load, e.g. ``"myapp/prod/"``
+            strip_prefix: Key the snapshot by names without the prefix
+
+        Returns:
+            A LiveSnapshot; read ``.current`` for the latest SecretSnapshot
+        """
+
+        def key(secret_name: str) -> Optional[str]:
+            if not secret_name.startswith(prefix):
+                return None
+            return secret_name[len(prefix) :] if strip_prefix else secret_name
+
+        live = LiveSnapshot(lambda: self.load_namespace(prefix, strip_prefix), key)
+        if self.refresher is not None:
+            self.refresher.on_change(live._on_change)
+        return live
+
+    def get_secrets(
+        self,
+        secret_names: Iterable[str],
+        cast: Union[str, Mapping[str, str]] = "str",
+    ) -> SecretBatch:
+        """Get several secrets in one pass.
+
+        Args:
+            secret_names: Names of the secrets to fetch
+            cast: Cast type for every secret, or a mapping of name to cast type
+
+        Returns:
+            SecretBatch with ``values`` (name -> cast value) and ``errors``
+            (name -> exception) for secrets that could not be retrieved
+        """
+        return self.provider.get_secrets(secret_names, cast=cast)
+
+    def preload(self, manifest: Manifest) -> Dict[str, Any]:
+        """Fetch every secret the application needs in one parallel pass.
+
+        Args:
+            manifest: Mapping of name to cast type or to a dict with ``cast``,
+                ``default`` and ``required``; a list of names; or the path of a
+                manifest file (see ``load_manifest``)
+
+        Returns:
+            Mapping of name to cast value, defaults included
+
+        Raises:
+            ConfigurationError: If the manifest itself is invalid
+            PreloadError: Listing every missing required secret and every
+                value that fails to cast
+        """
+        return self.provider.preload(load_manifest(manifest))
+
     def set_secret(self, secret_name: str, secret_value: str) -> None:
         """Create or update a secret."""
         self.provider.set_secret(secret_name, secret_value)
@@ -49,6 +223,81 @@ class SecretManager:
         """Delete a secret. No-op if it doesn't exist."""
         self.provider.delete_secret(secret_name)
 
+    def set_secrets(self, secrets: Mapping[str, str]) -> WriteBatch:
+        """Create or update several secrets concurrently.
+
+        Args:
+            secrets: Mapping of secret name to value
+
+        Returns:
+            WriteBatch with ``succeeded`` (names written) and ``errors``
+            (name -> exception) for secrets that could not be written
+        """
+        return self.provider.set_secrets(secrets)
+
+    def delete_secrets(self, secret_names: Iterable[str]) -> WriteBatch:
+        """Delete several secrets concurrently. Missing secrets count as deleted.
+
+        Args:
+            secret_names: Names of the secrets to delete
+
+        Returns:
+            WriteBatch with ``succeeded`` and per-name ``errors``
+        """
+        return self.provider.delete_secrets(secret_names)
+
+    def invalidate(self, secret_name: str) -> None:
+        """Drop a cached secret so the next read goes to the provider."""
+        self.provider.invalidate(secret_name)
+
+    def clear_cache(self) -> None:
+        """Drop every cached secret."""
+        self.provider.clear_cache()
+
+    def close(self) -> None:
+        """Release threads held by the provider, e.g. for hedged reads."""
+        self.provider.close()
+
+    def add_hook(self, hook: Hook) -> None:
+        """Call ``hook`` with an ``OperationEvent`` after every secret operation.
+
+        Args:
+            hook: Callable such as ``MetricsRecorder()``, ``OpenTelemetryHook()``
+                or ``PrometheusHook()``
+        """
+        self.provider.add_hook(hook)
+
+    def start_refresher(self, **kwargs) -> SecretRefresher:
+        """Start refreshing fetched secrets in the background before they expire.
+
+        Args:
+            **kwargs: SecretRefresher options (refresh_ahead, interval,
+                max_workers, jitter, retry_delay)
+
+        Returns:
+            The running SecretRefresher
+        """
+        if self.refresher is None:
+            self.refresher = SecretRefresher(self.provider, **kwargs)
+        self.refresher.start()
+        return self.refresher
+
+    def stop_refresher(self) -> None:
+        """Stop the background refresher, if running."""
+        if self.refresher is not None:
+            self.refresher.stop()
+
+    def on_change(
+        self, callback: ChangeCallback, secret_names: Optional[List[str]] = None
+    ) -> None:
+        """Call ``callback(name, old, new)`` when a refresh sees a rotated secret.
+
+        Starts the refresher with default options if it isn't running.
+        """
+        if self.refresher is None:
+            self.start_refresher()
+        self.refresher.on_change(callback, secret_names)
+
     def get_env(self) -> Env:
         return self.provider.get_env()
 
@@ -0,0 +1,172 @@
+"""Immutable snapshots of every secret under a prefix."""
+
+import threading
+from types import MappingProxyType
+from typing import Any, Callable, Iterable, Iterator, Mapping, Optional, Tuple, Union
+
+from cloud_secrets.common.cast_memo import freeze
+from cloud_secrets.common.exceptions import CloudSecretsError, SecretNotFoundError
+from cloud_secrets.common.structured import cast_fields, parse_structured
+from cloud_secrets.providers.base import cast_raw_value
+
+
+class SecretSnapshot(Mapping[str, str]):
+    """An immutable, hashable mapping of secret names to raw values.
+
+    Typed reads parse a value on first use and reuse the result. Parsed dicts
+    are returned read-only and lists as tuples, so nothing reachable from a
+    snapshot can change and readers never need a lock.
+    """
+
+    __slots__ = ("_values", "_casts", "_hash")
+
+    def __init__(
+        self, values: Union[Mapping[str, str], Iterable[Tuple[str, str]]] = ()
+    ):
+        object.__setattr__(self, "_values", MappingProxyType(dict(values)))
+        object.__setattr__(self, "_casts", {})
+        object.__setattr__(self, "_hash", None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("SecretSnapshot is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("SecretSnapshot is immutable")
+
+    def __getitem__(self, secret_name: str) -> str:
+        return self._values[secret_name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __contains__(self, secret_name: object) -> bool:
+        return secret_name in self._values
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, SecretSnapshot):
+            return self._values == other._values
+        return super().__eq__(other)
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            object.__setattr__(self, "_hash", hash(frozenset(self._values.items())))
+        return self._hash
+
+    def __repr__(self) -> str:
+        # Never show the values
+        return f"SecretSnapshot({sorted(self._values)!r})"
+
+    def _cast(self, secret_name: str, cast_type: str) -> Any:
+        key = (secret_name, cast_type)
+        try:
+            return self._casts[key]
+        except KeyError:
+            pass
+        raw = self._raw(secret_name)
+        try:
+            value = freeze(cast_raw_value(secret_name, raw, cast_type))
+        except Exception as e:
+            raise SecretNotFoundError(
+                f"Error retrieving secret {secret_name}: {str(e)}"
+            )
+        self._casts[key] = value
+        return value
+
+    def _raw(self, secret_name: str) -> str:
+        try:
+            return self._values[secret_name]
+        except KeyError:
+            raise SecretNotFoundError(f"Secret {secret_name} not found")
+
+    def get_str(self, secret_name: str) -> str:
+        """Get secret as string."""
+        return self._raw(secret_name)
+
+    def get_int(self, secret_name: str) -> int:
+        """Get secret as integer."""
+        return self._cast(secret_name, "int")
+
+    def get_float(self, secret_name: str) -> float:
+        """Get secret as float."""
+        return self._cast(secret_name, "float")
+
+    def get_bool(self, secret_name: str) -> bool:
+        """Get secret as boolean."""
+        return self._cast(secret_name, "bool")
+
+    def get_list(self, secret_name: str) -> Tuple:
+        """Get secret as a tuple of strings."""
+        return self._cast(secret_name, "list")
+
+    def get_dict(
+        self, secret_name: str, field_types: Optional[Mapping[str, Any]] = None
+    ) -> Mapping[str, Any]:
+        """Get secret as a read-only dictionary with optional field type casting.
+
+        Structured secrets return their parsed fields; other values are parsed
+        as ``key=value,...`` by environ.
+        """
+        if field_types is None and (secret_name, "dict") in self._casts:
+            return self._casts[(secret_name, "dict")]
+        raw = self._raw(secret_name)
+        try:
+            parsed = parse_structured(raw)
+            if parsed is None:
+                value = cast_raw_value(secret_name, raw, "dict", field_types)
+            else:
+                value = cast_fields(parsed, field_types)
+        except CloudSecretsError:
+            raise
+        except Exception as e:
+            raise SecretNotFoundError(
+                f"Error retrieving secret {secret_name}: {str(e)}"
+            )
+        value = freeze(value)
+        if field_types is None:
+            self._casts[(secret_name, "dict")] = value
+        return value
+
+
+class LiveSnapshot:
+    """The current ``SecretSnapshot`` of a namespace, swapped whole on refresh.
+
+    Readers take ``current`` once and use that snapshot: one attribute read,
+    no lock, and never a mix of old and new values. ``refresh()`` reloads the
+    namespace; rotations seen by a running refresher are swapped in as they
+    are detected.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[], SecretSnapshot],
+        key: Callable[[str], Optional[str]],
+    ):
+        self._loader = loader
+        # Maps a secret name to its snapshot key, or None if outside the prefix
+        self._key = key
+        self._lock = threading.Lock()
+        self.current = loader()
+        self.swaps = 0
+
+    def refresh(self) -> bool:
+        """Reload the namespace. Returns whether the snapshot changed."""
+        snapshot = self._loader()
+        with self._lock:
+            if snapshot == self.current:
+                return False
+            self.current = snapshot
+            self.swaps += 1
+        return True
+
+    def _on_change(self, secret_name: str, old: Optional[str], new: str) -> None:
+        key = self._key(secret_name)
+        if key is None:
+            return
+        with self._lock:
+            if self.current.get(key) == new:
+                return
+            self.current = SecretSnapshot({**self.current, key: new})
+            self.swaps += 1
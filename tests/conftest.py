@@ -1,6 +1,131 @@
+import asyncio
+import threading
+import time
+from typing import Optional
+
 import pytest
+from botocore.exceptions import ClientError
 from unittest.mock import MagicMock, patch
 
+from cloud_secrets.common.clients import client_registry
+from cloud_secrets.common.exceptions import ConfigurationError, SecretNotFoundError
+from cloud_secrets.providers.async_base import AsyncBaseSecretProvider
+from cloud_secrets.providers.base import BaseSecretProvider
+
+
+class FakeClock:
+    """A monotonic clock that only moves when told to, or when slept on."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+def client_error(code, operation="GetSecretValue"):
+    """A botocore ClientError with the given error code."""
+    return ClientError({"Error": {"Code": code, "Message": code}}, operation)
+
+
+class MemoryProvider(BaseSecretProvider):
+    """In-memory provider with injectable latency, failures and versions.
+
+    ``secrets`` is used as is, so tests can change the backend behind the
+    provider's back. Only secrets written with ``rotate`` have version ids.
+    With ``gate``, every fetch waits for the event to be set first.
+    """
+
+    def __init__(
+        self,
+        secrets=None,
+        delay=0.0,
+        gate: Optional[threading.Event] = None,
+        **kwargs,
+    ):
+        kwargs.setdefault("export_env", False)
+        super().__init__(**kwargs)
+        self.secrets = secrets if secrets is not None else {}
+        self.versions = {}
+        self.delay = delay
+        self.gate = gate
+        self.fail = False
+        self.fetches = 0
+
+    def rotate(self, secret_name, value):
+        """Write a new value under the next version id (v1, v2, ...)."""
+        version = int(self.versions.get(secret_name, "v0")[1:]) + 1
+        self.secrets[secret_name] = value
+        self.versions[secret_name] = f"v{version}"
+
+    def _fetch_raw_secret(self, secret_name):
+        self.fetches += 1
+        if self.gate is not None:
+            self.gate.wait(5)
+        if self.delay:
+            time.sleep(self.delay)
+        if self.fail:
+            raise ConfigurationError("backend down")
+        if secret_name not in self.secrets:
+            raise SecretNotFoundError(f"Secret {secret_name} not found")
+        self._record_version(secret_name, self.versions.get(secret_name))
+        self._publish(secret_name, self.secrets[secret_name])
+        return self.secrets[secret_name]
+
+    def _fetch_current_version(self, secret_name):
+        if self.fail:
+            raise ConfigurationError("backend down")
+        return self.versions.get(secret_name)
+
+    def _store_raw_secret(self, secret_name, secret_value):
+        self.rotate(secret_name, secret_value)
+
+    def _delete_raw_secret(self, secret_name):
+        self.secrets.pop(secret_name, None)
+        self.versions.pop(secret_name, None)
+
+
+class AsyncMemoryProvider(AsyncBaseSecretProvider):
+    """Async in-memory provider whose fetches take ``delay`` seconds."""
+
+    def __init__(self, secrets=None, delay=0.01, **kwargs):
+        super().__init__(**kwargs)
+        self.secrets = secrets if secrets is not None else {}
+        self.delay = delay
+        self.fetches = 0
+
+    async def _fetch_raw_secret(self, secret_name):
+        self.fetches += 1
+        await asyncio.sleep(self.delay)
+        if secret_name not in self.secrets:
+            raise SecretNotFoundError(f"Secret {secret_name} not found")
+        self._publish(secret_name, self.secrets[secret_name])
+        return self.secrets[secret_name]
+
+    async def _store_raw_secret(self, secret_name, secret_value):
+        self.secrets[secret_name] = secret_value
+
+    async def _delete_raw_secret(self, secret_name):
+        self.secrets.pop(secret_name, None)
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture(autouse=True)
+def fresh_client_registry():
+    """Keep SDK clients (and mocks) from leaking between tests."""
+    client_registry.clear()
+    yield
+    client_registry.clear()
+
 
 @pytest.fixture
 def sample_env_content():
@@ -0,0 +1,285 @@
+import asyncio
+import os
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from google.api_core import exceptions as gcp_exceptions
+
+from cloud_secrets import AsyncSecretManager
+from cloud_secrets.common.cache import SecretCache
+from cloud_secrets.common.exceptions import (
+    ConfigurationError,
+    RateLimitExceededError,
+    SecretNotFoundError,
+)
+from cloud_secrets.common.resilience import CircuitBreaker, RetryPolicy
+from cloud_secrets.providers.async_azure_provider import AsyncAzureSecretsProvider
+from cloud_secrets.providers.async_base import ThreadedAsyncProvider
+from cloud_secrets.providers.async_gcp_provider import AsyncGCPSecretsProvider
+from tests.conftest import AsyncMemoryProvider, client_error
+
+
+class TestCoalescing:
+    def teardown_method(self):
+        os.environ.pop("ASYNC_SHARED", None)
+
+    def test_concurrent_gets_share_one_fetch(self):
+        provider = AsyncMemoryProvider({"ASYNC_SHARED": "42"})
+
+        async def run():
+            return await asyncio.gather(
+                *(provider.get_int("ASYNC_SHARED") for _ in range(10))
+            )
+
+        assert asyncio.run(run()) == [42] * 10
+        assert provider.fetches == 1
+        assert provider.coalesced == 9
+
+    def test_errors_reach_every_waiter(self):
+        provider = AsyncMemoryProvider({"ASYNC_SHARED": "42"})
+
+        async def run():
+            return await asyncio.gather(
+                *(provider.get_secret("MISSING_ASYNC") for _ in range(3)),
+                return_exceptions=True,
+            )
+
+        results = asyncio.run(run())
+        assert all(isinstance(r, SecretNotFoundError) for r in results)
+        assert provider.fetches == 1
+
+    def test_get_secrets_reports_per_name(self):
+        provider = AsyncMemoryProvider({"ASYNC_SHARED": "42"})
+        values, errors = asyncio.run(
+            provider.get_secrets(["ASYNC_SHARED", "MISSING_ASYNC"], cast="int")
+        )
+        assert values == {"ASYNC_SHARED": 42}
+        assert isinstance(errors["MISSING_ASYNC"], SecretNotFoundError)
+
+
+class TestThreadedResilience:
+    def test_open_breaker_serves_last_known_good(self, mock_aws_client, clock):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30, clock=clock)
+        manager = AsyncSecretManager(
+            provider_type="aws",
+            export_env=False,
+            cache=SecretCache(ttl=1, clock=clock, keep_expired=True),
+            retry_policy=RetryPolicy(max_attempts=1, clock=clock),
+            circuit_breaker=breaker,
+        )
+
+        async def run():
+            values = [await manager.get_secret("API_KEY")]
+            clock.now = 1
+            mock_aws_client.get_secret_value.side_effect = client_error(
+                "InternalServiceError"
+            )
+            values.append(await manager.get_secret("API_KEY"))
+            values.append(await manager.get_secret("API_KEY"))
+            return values
+
+        assert asyncio.run(run()) == ["secret123"] * 3
+        assert manager.provider.circuit_breaker is breaker
+        assert breaker.state == CircuitBreaker.OPEN
+        stats = manager.provider.backend_stats()
+        assert (stats["served_stale"], stats["short_circuited"]) == (2, 1)
+
+
+class TestAsyncSecretManager:
+    def test_local_round_trip(self, env_file):
+        async def run():
+            async with AsyncSecretManager(
+                provider_type="local", env_path=env_file
+            ) as manager:
+                assert isinstance(manager.provider, ThreadedAsyncProvider)
+                await manager.set_secret("ASYNC_KEY", "async_value")
+                value = await manager.get_secret("ASYNC_KEY")
+                await manager.delete_secret("ASYNC_KEY")
+                with pytest.raises(SecretNotFoundError):
+                    await manager.get_secret("ASYNC_KEY")
+                return value
+
+        assert asyncio.run(run()) == "async_value"
+
+    def test_threaded_aws_uses_batch_endpoint(self, mock_aws_client):
+        mock_aws_client.batch_get_secret_value.return_value = {
+            "SecretValues": [{"Name": "ASYNC_AWS", "SecretString": "v"}]
+        }
+
+        async def run():
+            async with AsyncSecretManager(provider_type="aws") as manager:
+                return await manager.get_secrets(["ASYNC_AWS"])
+
+        try:
+            values, errors = asyncio.run(run())
+        finally:
+            os.environ.pop("ASYNC_AWS", None)
+        assert values == {"ASYNC_AWS": "v"}
+        mock_aws_client.get_secret_value.assert_not_called()
+
+    def test_close_closes_the_wrapped_provider(self, env_file, mocker):
+        manager = AsyncSecretManager(provider_type="local", env_path=env_file)
+        close = mocker.spy(manager.provider.provider, "close")
+
+        asyncio.run(manager.close())
+
+        close.assert_called_once_with()
+        with pytest.raises(RuntimeError):
+            manager.provider.executor.submit(print)
+
+    def test_threaded_providers_reject_hooks(self, env_file):
+        with pytest.raises(ConfigurationError, match="does not support hooks"):
+            AsyncSecretManager(
+                provider_type="local", env_path=env_file, hooks=[lambda event: None]
+            )
+
+    def test_invalid_provider(self):
+        with pytest.raises(ConfigurationError):
+            AsyncSecretManager(provider_type="invalid")
+
+
+class TestNativeAsyncProviders:
+    def test_gcp_fetch(self):
+        with patch(
+            "google.cloud.secretmanager.SecretManagerServiceAsyncClient"
+        ) as mock_cls:
+            client = mock_cls.return_value
+            response = MagicMock()
+            response.payload.data = b"gcp-async"
+            client.access_secret_version = AsyncMock(return_value=response)
+            provider = AsyncGCPSecretsProvider(project_id="test-project")
+            try:
+                assert asyncio.run(provider.get_secret("ASYNC_GCP")) == "gcp-async"
+            finally:
+                os.environ.pop("ASYNC_GCP", None)
+            client.access_secret_version.assert_awaited_once_with(
+                request={
+                    "name": "projects/test-project/secrets/ASYNC_GCP/versions/latest"
+                }
+            )
+
+    def test_gcp_not_found(self):
+        with patch(
+            "google.cloud.secretmanager.SecretManagerServiceAsyncClient"
+        ) as mock_cls:
+            mock_cls.return_value.access_secret_version = AsyncMock(
+                side_effect=gcp_exceptions.NotFound("nope")
+            )
+            provider = AsyncGCPSecretsProvider(project_id="test-project")
+            with pytest.raises(SecretNotFoundError):
+                asyncio.run(provider.get_secret("MISSING_GCP"))
+
+    def test_azure_fetch_and_delete(self):
+        with (
+            patch(
+                "cloud_secrets.providers.async_azure_provider.DefaultAzureCredential"
+            ),
+            patch("cloud_secrets.providers.async_azure_provider.SecretClient") as cls,
+        ):
+            client = cls.return_value
+            secret = MagicMock()
+            secret.value = "azure-async"
+            client.get_secret = AsyncMock(return_value=secret)
+            client.delete_secret = AsyncMock()
+            provider = AsyncAzureSecretsProvider(
+                vault_url="https://test.vault.azure.net/"
+            )
+
+            async def run():
+                value = await provider.get_secret("ASYNCAZURE")
+                await provider.delete_secret("ASYNCAZURE")
+                return value
+
+            assert asyncio.run(run()) == "azure-async"
+            client.delete_secret.assert_awaited_once_with("ASYNCAZURE")
+
+    def test_gcp_retries_transient_errors(self):
+        with patch(
+            "google.cloud.secretmanager.SecretManagerServiceAsyncClient"
+        ) as mock_cls:
+            response = MagicMock()
+            response.payload.data = b"after-retry"
+            mock_cls.return_value.access_secret_version = AsyncMock(
+                side_effect=[gcp_exceptions.ServiceUnavailable("down"), response]
+            )
+            provider = AsyncGCPSecretsProvider(
+                project_id="test-project",
+                export_env=False,
+                retry_policy=RetryPolicy(max_attempts=2, base_delay=0),
+            )
+            assert asyncio.run(provider.get_secret("RETRIED")) == "after-retry"
+            assert provider.backend_stats()["retries"] == 1
+
+    def test_gcp_is_called_once_by_default(self):
+        with patch(
+            "google.cloud.secretmanager.SecretManagerServiceAsyncClient"
+        ) as mock_cls:
+            client = mock_cls.return_value
+            client.access_secret_version = AsyncMock(
+                side_effect=gcp_exceptions.ServiceUnavailable("down")
+            )
+            provider = AsyncGCPSecretsProvider(project_id="test-project")
+            with pytest.raises(ConfigurationError):
+                asyncio.run(provider.get_secret("DOWN"))
+            assert client.access_secret_version.await_count == 1
+
+    def test_open_breaker_serves_cached_value(self):
+        with patch(
+            "google.cloud.secretmanager.SecretManagerServiceAsyncClient"
+        ) as mock_cls:
+            client = mock_cls.return_value
+            response = MagicMock()
+            response.payload.data = b"cached"
+            client.access_secret_version = AsyncMock(return_value=response)
+            provider = AsyncGCPSecretsProvider(
+                project_id="test-project",
+                export_env=False,
+                cache=SecretCache(ttl=0, keep_expired=True),
+                circuit_breaker=CircuitBreaker(failure_threshold=1),
+            )
+
+            async def run():
+                await provider.get_secret("STALE")
+                client.access_secret_version.side_effect = (
+                    gcp_exceptions.ServiceUnavailable("down")
+                )
+                return await provider.get_secret("STALE")
+
+            assert asyncio.run(run()) == "cached"
+            assert provider.backend_stats()["served_stale"] == 1
+
+    def test_gcp_calls_take_rate_limit_tokens(self):
+        with patch(
+            "google.cloud.secretmanager.SecretManagerServiceAsyncClient"
+        ) as mock_cls:
+            response = MagicMock()
+            response.payload.data = b"limited"
+            mock_cls.return_value.access_secret_version = AsyncMock(
+                return_value=response
+            )
+            provider = AsyncGCPSecretsProvider(
+                project_id="test-project",
+                export_env=False,
+                rate_limit=1,
+                rate_limit_max_wait=0,
+            )
+
+            async def run():
+                await provider.get_secret("FIRST")
+                await provider.get_secret("SECOND")
+
+            with pytest.raises(RateLimitExceededError):
+                asyncio.run(run())
+            assert mock_cls.return_value.access_secret_version.await_count == 1
+            assert provider.backend_stats()["rate_limiter"]["rejected"] == 1
+
+    def test_hooks_are_rejected(self):
+        with patch("google.cloud.secretmanager.SecretManagerServiceAsyncClient"):
+            with pytest.raises(ConfigurationError, match="does not support hooks"):
+                AsyncGCPSecretsProvider(project_id="test-project", hooks=[print])
+
+    def test_missing_config(self):
+        with pytest.raises(ConfigurationError):
+            AsyncGCPSecretsProvider()
+        with pytest.raises(ConfigurationError):
+            AsyncAzureSecretsProvider()
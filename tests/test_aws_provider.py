@@ -26,6 +26,7 @@ def test_aws_provider(aws_credentials):
     secret_manager = SecretManager(
         provider_type="aws",
         region_name=region,
+        flatten_env=True,
     )
     secret_manager.get_secret(secret_name)
     env = secret_manager.get_env()
@@ -0,0 +1,155 @@
+import os
+
+from botocore.exceptions import ClientError
+from google.api_core import exceptions as gcp_exceptions
+
+from cloud_secrets import SecretManager
+from cloud_secrets.common.exceptions import ConfigurationError, SecretNotFoundError
+from cloud_secrets.providers.aws_provider import AWSSecretsProvider
+from cloud_secrets.providers.gcp_provider import GCPSecretsProvider
+from cloud_secrets.providers.local_provider import LocalEnvProvider
+
+
+def fake_batch_get(**kwargs):
+    """Return every requested id except those starting with MISSING_."""
+    ids = kwargs["SecretIdList"]
+    return {
+        "SecretValues": [
+            {"Name": i, "SecretString": f"value-{i}"}
+            for i in ids
+            if not i.startswith("MISSING_")
+        ],
+        "Errors": [
+            {
+                "SecretId": i,
+                "ErrorCode": "ResourceNotFoundException",
+                "Message": "not found",
+            }
+            for i in ids
+            if i.startswith("MISSING_")
+        ],
+    }
+
+
+class TestAWSBatch:
+    def teardown_method(self):
+        for key in list(os.environ):
+            if key.startswith(("BATCH_", "MISSING_")):
+                os.environ.pop(key)
+
+    def test_chunks_of_twenty(self, mock_aws_client):
+        mock_aws_client.batch_get_secret_value.side_effect = fake_batch_get
+        provider = AWSSecretsProvider(region_name="us-east-1")
+
+        names = [f"BATCH_{i}" for i in range(45)]
+        batch = provider.get_secrets(names)
+
+        assert mock_aws_client.batch_get_secret_value.call_count == 3
+        sizes = [
+            len(call.kwargs["SecretIdList"])
+            for call in mock_aws_client.batch_get_secret_value.call_args_list
+        ]
+        assert sizes == [20, 20, 5]
+        assert batch.values["BATCH_44"] == "value-BATCH_44"
+        assert batch.errors == {}
+        mock_aws_client.get_secret_value.assert_not_called()
+
+    def test_per_name_errors(self, mock_aws_client):
+        mock_aws_client.batch_get_secret_value.side_effect = fake_batch_get
+        provider = AWSSecretsProvider(region_name="us-east-1")
+
+        values, errors = provider.get_secrets(["BATCH_A", "MISSING_B"])
+
+        assert values == {"BATCH_A": "value-BATCH_A"}
+        assert isinstance(errors["MISSING_B"], SecretNotFoundError)
+
+    def test_other_error_codes(self, mock_aws_client):
+        mock_aws_client.batch_get_secret_value.return_value = {
+            "SecretValues": [],
+            "Errors": [
+                {
+                    "SecretId": "BATCH_DENIED",
+                    "ErrorCode": "AccessDeniedException",
+                    "Message": "denied",
+                }
+            ],
+        }
+        provider = AWSSecretsProvider(region_name="us-east-1")
+
+        _, errors = provider.get_secrets(["BATCH_DENIED"])
+
+        assert isinstance(errors["BATCH_DENIED"], ConfigurationError)
+
+    def test_falls_back_to_single_fetch(self, mock_aws_client):
+        mock_aws_client.batch_get_secret_value.side_effect = ClientError(
+            {"Error": {"Code": "AccessDeniedException", "Message": ""}},
+            "BatchGetSecretValue",
+        )
+        mock_aws_client.get_secret_value.return_value = {"SecretString": "single"}
+        provider = AWSSecretsProvider(region_name="us-east-1")
+
+        values, errors = provider.get_secrets(["BATCH_X", "BATCH_Y"])
+
+        assert values == {"BATCH_X": "single", "BATCH_Y": "single"}
+        assert mock_aws_client.get_secret_value.call_count == 2
+
+    def test_cast_mapping(self, mock_aws_client):
+        mock_aws_client.batch_get_secret_value.return_value = {
+            "SecretValues": [
+                {"Name": "BATCH_PORT", "SecretString": "5432"},
+                {"Name": "BATCH_DEBUG", "SecretString": "true"},
+            ]
+        }
+        provider = AWSSecretsProvider(region_name="us-east-1")
+
+        values, _ = provider.get_secrets(
+            ["BATCH_PORT", "BATCH_DEBUG"],
+            cast={"BATCH_PORT": "int", "BATCH_DEBUG": "bool"},
+        )
+
+        assert values == {"BATCH_PORT": 5432, "BATCH_DEBUG": True}
+
+
+class TestGCPBatch:
+    def test_concurrent_fallback(self, mock_gcp_client):
+        client_instance = mock_gcp_client.return_value
+
+        def access(request):
+            if request["name"].endswith("/MISSING_GCP/versions/latest"):
+                raise gcp_exceptions.NotFound("nope")
+            return client_instance.access_secret_version.return_value
+
+        client_instance.access_secret_version.side_effect = access
+        provider = GCPSecretsProvider(project_id="test-project")
+        try:
+            values, errors = provider.get_secrets(["BATCH_GCP", "MISSING_GCP"])
+        finally:
+            os.environ.pop("BATCH_GCP", None)
+
+        assert values == {"BATCH_GCP": "secret123"}
+        assert isinstance(errors["MISSING_GCP"], SecretNotFoundError)
+
+
+class TestLocalBatch:
+    def test_mixed_sources(self, env_file, mocker):
+        provider = LocalEnvProvider(env_path=env_file)
+        provider.set_secret("SIDE_CAR", "from-json")
+        load = mocker.spy(provider, "_load_secrets_file")
+
+        values, errors = provider.get_secrets(
+            ["API_KEY", "SIDE_CAR", "PORT", "NOPE"], cast={"PORT": "int"}
+        )
+
+        assert values == {"API_KEY": "secret123", "SIDE_CAR": "from-json", "PORT": 8080}
+        assert list(errors) == ["NOPE"]
+        assert load.call_count == 1
+
+    def test_batch_uses_cache(self, env_file, mocker):
+        manager = SecretManager(provider_type="local", env_path=env_file, cache_ttl=60)
+        manager.get_secret("API_KEY")
+        fetch = mocker.spy(manager.provider, "_fetch_raw_secrets")
+
+        values, _ = manager.get_secrets(["API_KEY", "PORT"])
+
+        fetch.assert_called_once_with(["PORT"])
+        assert values == {"API_KEY": "secret123", "PORT": "8080"}
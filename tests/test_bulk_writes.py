@@ -0,0 +1,150 @@
+import threading
+import time
+from unittest.mock import MagicMock
+
+from botocore.exceptions import ClientError
+from google.api_core import exceptions as gcp_exceptions
+
+from cloud_secrets import SecretManager
+from cloud_secrets.common.exceptions import ConfigurationError
+from cloud_secrets.providers.gcp_provider import GCPSecretsProvider
+from cloud_secrets.providers.local_provider import LocalEnvProvider
+
+
+class TestLocalBulkWrites:
+    def test_batch_is_one_journal_write(self, env_file, mocker):
+        provider = LocalEnvProvider(env_path=env_file)
+        provider.set_secret("SEED", "1")
+        append = mocker.spy(provider, "_append_journal")
+
+        result = provider.set_secrets({"A": "1", "B": "2", "C": "3"})
+
+        assert result.succeeded == ["A", "B", "C"]
+        assert result.errors == {}
+        assert append.call_count == 1
+        assert provider.get_secret("B") == "2"
+
+        result = provider.delete_secrets(["A", "C", "NEVER_SET"])
+        assert result.succeeded == ["A", "C", "NEVER_SET"]
+        assert append.call_count == 2
+        assert set(LocalEnvProvider(env_path=env_file)._load_secrets_file()) == {
+            "SEED",
+            "B",
+        }
+
+    def test_failed_write_reports_every_name(self, env_file, mocker):
+        provider = LocalEnvProvider(env_path=env_file)
+        mocker.patch.object(provider, "_append_journal", side_effect=OSError("full"))
+
+        result = provider.set_secrets({"A": "1", "B": "2"})
+
+        assert result.succeeded == []
+        assert set(result.errors) == {"A", "B"}
+
+    def test_set_invalidates_cached_values(self, env_file):
+        provider = LocalEnvProvider(env_path=env_file, cache_ttl=60)
+        provider.set_secrets({"A": "1"})
+        assert provider.get_secret("A") == "1"
+        provider.set_secrets({"A": "2"})
+        assert provider.get_secret("A") == "2"
+
+
+def gcp_provider(mock_gcp_client, **kwargs):
+    provider = GCPSecretsProvider(project_id="test-project", **kwargs)
+    return provider, mock_gcp_client.return_value
+
+
+class TestGCPKnownSecrets:
+    def test_known_secret_skips_existence_probe(self, mock_gcp_client):
+        provider, client = gcp_provider(mock_gcp_client)
+        provider.get_secret("API_KEY")
+
+        provider.set_secret("API_KEY", "rotated")
+
+        client.get_secret.assert_not_called()
+        client.create_secret.assert_not_called()
+        client.add_secret_version.assert_called_once()
+
+    def test_unknown_secret_is_probed_then_remembered(self, mock_gcp_client):
+        provider, client = gcp_provider(mock_gcp_client)
+        client.get_secret.side_effect = gcp_exceptions.NotFound("missing")
+
+        provider.set_secret("NEW", "1")
+        provider.set_secret("NEW", "2")
+
+        assert client.get_secret.call_count == 1
+        assert client.create_secret.call_count == 1
+        assert client.add_secret_version.call_count == 2
+
+    def test_secret_deleted_elsewhere_is_recreated(self, mock_gcp_client):
+        provider, client = gcp_provider(mock_gcp_client)
+        provider.get_secret("API_KEY")
+        client.add_secret_version.side_effect = [
+            gcp_exceptions.NotFound("deleted"),
+            MagicMock(),
+        ]
+        client.get_secret.side_effect = gcp_exceptions.NotFound("deleted")
+
+        provider.set_secret("API_KEY", "again")
+
+        client.create_secret.assert_called_once()
+        assert client.add_secret_version.call_count == 2
+
+    def test_delete_forgets_known_secret(self, mock_gcp_client):
+        provider, client = gcp_provider(mock_gcp_client)
+        provider.get_secret("API_KEY")
+        provider.delete_secrets(["API_KEY"])
+
+        provider.set_secret("API_KEY", "back")
+        client.get_secret.assert_called_once()
+
+    def test_bounded_concurrency_and_per_item_errors(self, mock_gcp_client):
+        provider, client = gcp_provider(mock_gcp_client, batch_max_workers=3)
+        lock = threading.Lock()
+        active = []
+        peak = []
+
+        def add_version(request):
+            with lock:
+                active.append(1)
+                peak.append(len(active))
+            time.sleep(0.02)
+            with lock:
+                active.pop()
+            if "BAD" in request["parent"]:
+                raise gcp_exceptions.PermissionDenied("no")
+
+        client.add_secret_version.side_effect = add_version
+        secrets = {f"S{i}": str(i) for i in range(8)}
+        secrets["BAD"] = "x"
+
+        result = provider.set_secrets(secrets)
+
+        assert sorted(result.succeeded) == sorted(f"S{i}" for i in range(8))
+        assert list(result.errors) == ["BAD"]
+        assert isinstance(result.errors["BAD"], ConfigurationError)
+        assert 1 < max(peak) <= 3
+
+
+class TestManagerBulkWrites:
+    def test_aws_per_item_outcomes(self, mock_aws_client):
+        def put(SecretId, SecretString):
+            if SecretId == "LOCKED":
+                raise ClientError(
+                    {"Error": {"Code": "AccessDeniedException", "Message": "no"}},
+                    "PutSecretValue",
+                )
+
+        mock_aws_client.put_secret_value.side_effect = put
+        mock_aws_client.exceptions.ResourceNotFoundException = type(
+            "ResourceNotFoundException", (ClientError,), {}
+        )
+        manager = SecretManager(provider_type="aws")
+
+        written = manager.set_secrets({"A": "1", "LOCKED": "2"})
+        deleted = manager.delete_secrets(["A", "A"])
+
+        assert written.succeeded == ["A"]
+        assert isinstance(written.errors["LOCKED"], ConfigurationError)
+        assert deleted.succeeded == ["A"]
+        assert mock_aws_client.delete_secret.call_count == 1
@@ -0,0 +1,113 @@
+import pytest
+
+from cloud_secrets import SecretManager
+from cloud_secrets.common.cache import SecretCache
+from cloud_secrets.common.exceptions import ConfigurationError
+from cloud_secrets.providers.local_provider import LocalEnvProvider
+
+
+class TestSecretCache:
+    def test_hit_and_miss_counters(self):
+        cache = SecretCache(ttl=10)
+        assert cache.get("A") is None
+        cache.set("A", "1")
+        assert cache.get("A") == "1"
+        assert cache.stats() == {"hits": 1, "misses": 1, "evictions": 0, "size": 1}
+
+    def test_entry_expires_after_ttl(self, clock):
+        cache = SecretCache(ttl=10, clock=clock)
+        cache.set("A", "1")
+        clock.now = 9.9
+        assert cache.get("A") == "1"
+        clock.now = 10.0
+        assert cache.get("A") is None
+        assert len(cache) == 0
+
+    def test_keep_expired_serves_stale_entries(self, clock):
+        cache = SecretCache(ttl=10, clock=clock, keep_expired=True)
+        cache.set("A", "1")
+        clock.now = 10.0
+        assert cache.get("A") is None
+        assert cache.get_stale("A") == "1"
+        assert cache.get_stale("B") is None
+
+    def test_per_entry_ttl_override(self, clock):
+        cache = SecretCache(ttl=10, clock=clock)
+        cache.set("SHORT", "1", ttl=1)
+        cache.set("FOREVER", "2", ttl=float("inf"))
+        clock.now = 1000
+        assert "SHORT" not in cache
+        assert cache.get("FOREVER") == "2"
+
+    def test_lru_eviction(self):
+        cache = SecretCache(ttl=None, max_size=2)
+        cache.set("A", "1")
+        cache.set("B", "2")
+        cache.get("A")  # A becomes most recently used
+        cache.set("C", "3")
+        assert "A" in cache
+        assert "B" not in cache
+        assert cache.evictions == 1
+
+    def test_invalidate_and_clear(self):
+        cache = SecretCache()
+        cache.set("A", "1")
+        cache.set("B", "2")
+        assert cache.invalidate("A") is True
+        assert cache.invalidate("A") is False
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_invalid_max_size(self):
+        with pytest.raises(ConfigurationError):
+            SecretCache(max_size=0)
+
+
+class TestProviderCaching:
+    def test_cache_disabled_by_default(self, env_file):
+        provider = LocalEnvProvider(env_path=env_file)
+        assert provider.cache is None
+
+    def test_repeated_reads_served_from_cache(self, env_file, mocker):
+        provider = LocalEnvProvider(env_path=env_file, cache_ttl=60)
+        fetch = mocker.spy(provider, "_fetch_raw_secret")
+
+        assert provider.get_int("PORT") == 8080
+        assert provider.get_int("PORT") == 8080
+        assert provider.get_secret("PORT") == "8080"
+
+        assert fetch.call_count == 1
+        assert provider.cache.hits == 2
+
+    def test_set_secret_invalidates(self, env_file):
+        provider = LocalEnvProvider(env_path=env_file, cache_ttl=60)
+        provider.set_secret("ROTATED", "old")
+        assert provider.get_secret("ROTATED") == "old"
+        provider.set_secret("ROTATED", "new")
+        assert provider.get_secret("ROTATED") == "new"
+
+    def test_delete_secret_invalidates(self, env_file):
+        provider = LocalEnvProvider(env_path=env_file, cache_ttl=60)
+        provider.set_secret("TEMP", "value")
+        assert provider.get_secret("TEMP") == "value"
+        provider.delete_secret("TEMP")
+        assert "TEMP" not in provider.cache
+
+    def test_per_secret_ttl(self, env_file):
+        provider = LocalEnvProvider(
+            env_path=env_file, cache_ttl=60, cache_ttls={"API_KEY": 0}
+        )
+        provider.get_secret("API_KEY")
+        provider.get_secret("PORT")
+        assert "API_KEY" not in provider.cache
+        assert "PORT" in provider.cache
+
+    def test_manager_invalidate(self, env_file, mocker):
+        manager = SecretManager(provider_type="local", env_path=env_file, cache_ttl=60)
+        fetch = mocker.spy(manager.provider, "_fetch_raw_secret")
+        manager.get_secret("API_KEY")
+        manager.invalidate("API_KEY")
+        manager.get_secret("API_KEY")
+        manager.clear_cache()
+        manager.get_secret("API_KEY")
+        assert fetch.call_count == 3
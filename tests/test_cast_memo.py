@@ -0,0 +1,102 @@
+from types import MappingProxyType
+
+import pytest
+
+from cloud_secrets.common.cast_memo import CastMemo
+from cloud_secrets.common.exceptions import ConfigurationError
+from cloud_secrets.providers.local_provider import LocalEnvProvider
+
+FIELDS = {"db": str, "port": int, "debug": bool, "rate": float}
+EXPECTED = {"db": "postgres", "port": 5432, "debug": True, "rate": 1.5}
+
+
+class TestCastMemo:
+    def test_reuses_until_raw_changes(self):
+        memo = CastMemo()
+        calls = []
+
+        def cast():
+            calls.append(1)
+            return len(calls)
+
+        assert memo.get_or_cast("N", "raw", ("int",), cast) == 1
+        assert memo.get_or_cast("N", "raw", ("int",), cast) == 1
+        assert memo.get_or_cast("N", "raw", ("float",), cast) == 2
+        assert memo.get_or_cast("N", "rotated", ("int",), cast) == 3
+        assert memo.stats() == {"hits": 1, "misses": 3, "size": 2}
+
+    def test_evicts_least_recently_used(self):
+        memo = CastMemo(max_size=2)
+        for name in ("A", "B", "C"):
+            memo.get_or_cast(name, "v", "str", lambda: name)
+        assert memo.stats()["size"] == 2
+        assert memo.get_or_cast("A", "v", "str", lambda: "again") == "again"
+
+    def test_invalid_size(self):
+        with pytest.raises(ConfigurationError):
+            CastMemo(max_size=0)
+
+
+class TestProviderCasts:
+    def test_dict_is_parsed_once(self, env_file, mocker):
+        provider = LocalEnvProvider(env_path=env_file, export_env=False, cache_ttl=60)
+        parse = mocker.spy(provider.env, "parse_value")
+
+        assert provider.get_dict("CONFIG", field_types=FIELDS) == EXPECTED
+        parsed = parse.call_count
+        for _ in range(5):
+            assert provider.get_dict("CONFIG", field_types=FIELDS) == EXPECTED
+        assert parse.call_count == parsed
+
+    def test_callers_get_copies(self, env_file):
+        provider = LocalEnvProvider(env_path=env_file, export_env=False)
+        first = provider.get_dict("CONFIG", field_types=FIELDS)
+        first["port"] = 1
+        hosts = provider.get_list("ALLOWED_HOSTS")
+        hosts.append("evil")
+
+        assert provider.get_dict("CONFIG", field_types=FIELDS) == EXPECTED
+        assert provider.get_list("ALLOWED_HOSTS") == ["localhost", "127.0.0.1"]
+
+    def test_nested_values_are_not_shared(self, tmp_path):
+        env_path = tmp_path / ".env"
+        env_path.write_text('CFG={"db": {"host": "a", "tags": ["x"]}}\n')
+        provider = LocalEnvProvider(env_path=str(env_path), export_env=False)
+
+        first = provider.get_secret("CFG", cast_type="json")
+        first["db"]["host"] = "MUTATED"
+        first["db"]["tags"].append("y")
+
+        assert provider.get_secret("CFG", cast_type="json") == {
+            "db": {"host": "a", "tags": ["x"]}
+        }
+        assert provider.cast_memo.stats()["hits"] == 1
+
+    def test_read_only_is_deep(self):
+        memo = CastMemo(read_only=True)
+        value = memo.get_or_cast("CFG", "raw", ("json",), lambda: {"db": {"h": "a"}})
+        with pytest.raises(TypeError):
+            value["db"]["h"] = "MUTATED"
+
+    def test_read_only(self, env_file):
+        provider = LocalEnvProvider(
+            env_path=env_file, export_env=False, cast_memo=CastMemo(read_only=True)
+        )
+        config = provider.get_dict("CONFIG", field_types=FIELDS)
+        assert isinstance(config, MappingProxyType)
+        assert config is provider.get_dict("CONFIG", field_types=FIELDS)
+        assert provider.get_list("ALLOWED_HOSTS") == ("localhost", "127.0.0.1")
+
+    def test_rotated_value_is_reparsed(self, env_file):
+        provider = LocalEnvProvider(env_path=env_file, export_env=False)
+        assert provider.get_int("PORT") == 8080
+        provider.set_secret("PORT", "9090")
+        assert provider.get_int("PORT") == 9090
+        # A change that bypasses the provider is noticed too
+        provider.store["PORT"] = "7070"
+        assert provider._cast_secret("PORT", "int") == 7070
+
+    def test_disabled(self, env_file):
+        provider = LocalEnvProvider(env_path=env_file, memoize_casts=False)
+        assert provider.cast_memo is None
+        assert provider.get_int("PORT") == 8080
@@ -0,0 +1,133 @@
+import time
+
+import pytest
+
+from cloud_secrets import SecretManager
+from cloud_secrets.common.exceptions import ConfigurationError, SecretNotFoundError
+from cloud_secrets.providers.chain_provider import ChainProvider
+from tests.conftest import MemoryProvider
+
+
+def chain(*layers, **kwargs):
+    return ChainProvider(layers=layers, export_env=False, **kwargs)
+
+
+class TestFallback:
+    def test_first_layer_with_the_secret_wins(self):
+        overrides = MemoryProvider({"DEBUG": "true"})
+        primary = MemoryProvider({"DEBUG": "false", "API_KEY": "abc"})
+        provider = chain(overrides, primary)
+
+        assert provider.get_bool("DEBUG") is True
+        assert provider.get_secret("API_KEY") == "abc"
+        assert provider.serving_layer("DEBUG") == "0:MemoryProvider"
+        assert provider.serving_layer("API_KEY") == "1:MemoryProvider"
+        stats = provider.layer_stats()
+        assert stats["0:MemoryProvider"]["served"] == 1
+        assert stats["0:MemoryProvider"]["not_found"] == 1
+        assert stats["1:MemoryProvider"]["served"] == 1
+
+    def test_failing_layer_falls_through(self):
+        primary = MemoryProvider({"KEY": "primary"})
+        primary.fail = True
+        provider = chain(primary, MemoryProvider({"KEY": "replica"}))
+
+        assert provider.get_secret("KEY") == "replica"
+        assert provider.layer_stats()["0:MemoryProvider"]["errors"] == 1
+
+    def test_missing_everywhere(self):
+        provider = chain(MemoryProvider(), MemoryProvider())
+        with pytest.raises(SecretNotFoundError, match="MISSING not found"):
+            provider.get_secret("MISSING")
+
+    def test_every_layer_failing(self):
+        first, second = MemoryProvider(), MemoryProvider()
+        first.fail = second.fail = True
+        provider = chain(first, second)
+        with pytest.raises(ConfigurationError, match="from every layer"):
+            provider.get_secret("KEY")
+
+    def test_layer_timeout(self):
+        slow = MemoryProvider({"KEY": "slow"}, delay=0.5)
+        provider = chain(slow, MemoryProvider({"KEY": "fast"}), layer_timeout=0.05)
+
+        start = time.monotonic()
+        assert provider.get_secret("KEY") == "fast"
+        assert time.monotonic() - start < 0.3
+        assert provider.layer_stats()["0:MemoryProvider"]["timeouts"] == 1
+
+
+class TestHedging:
+    def test_hedge_after_fixed_delay(self):
+        primary = MemoryProvider({"KEY": "primary"}, delay=0.5)
+        replica = MemoryProvider({"KEY": "replica"})
+        provider = chain(primary, replica, hedge_after=0.02)
+
+        start = time.monotonic()
+        assert provider.get_secret("KEY") == "replica"
+        assert time.monotonic() - start < 0.3
+        stats = provider.layer_stats()["1:MemoryProvider"]
+        assert stats["hedges"] == 1
+        assert stats["hedges_won"] == 1
+
+    def test_fast_primary_is_not_hedged(self):
+        replica = MemoryProvider({"KEY": "replica"})
+        provider = chain(MemoryProvider({"KEY": "primary"}), replica, hedge_after=0.2)
+
+        assert provider.get_secret("KEY") == "primary"
+        assert replica.fetches == 0
+
+    def test_hedge_at_latency_percentile(self):
+        primary = MemoryProvider({f"S{i}": "p" for i in range(21)}, delay=0.01)
+        replica = MemoryProvider({f"S{i}": "r" for i in range(21)})
+        provider = chain(primary, replica, hedge_percentile=90, hedge_min_samples=20)
+        for i in range(20):
+            assert provider.get_secret(f"S{i}") == "p"
+        assert replica.fetches == 0
+
+        primary.delay = 0.5
+        assert provider.get_secret("S20") == "r"
+        assert provider.layer_stats()["1:MemoryProvider"]["hedges_won"] == 1
+
+    def test_layer_cache_hits_are_not_latency_samples(self):
+        primary = MemoryProvider({"KEY": "p"}, delay=0.01, cache_ttl=60)
+        provider = chain(primary, MemoryProvider({"KEY": "r"}))
+        for _ in range(5):
+            assert provider.get_secret("KEY") == "p"
+
+        # Only the first read reached the layer's backend
+        assert primary.fetches == 1
+        assert len(provider.layers[0].latencies) == 1
+        assert provider.layer_stats()["0:MemoryProvider"]["served"] == 5
+
+
+class TestManagerChain:
+    def test_layers_from_dicts(self, env_file):
+        primary = MemoryProvider({"API_KEY": "cloud", "TOKEN": "t"})
+        manager = SecretManager(
+            provider_type="chain",
+            layers=[
+                {"provider_type": "local", "env_path": env_file, "name": "local"},
+                primary,
+            ],
+            write_layer=1,
+            export_env=False,
+        )
+
+        assert manager.get_secret("API_KEY") == "secret123"
+        assert manager.get_secret("TOKEN") == "t"
+        assert manager.provider.serving_layer("TOKEN") == "1:MemoryProvider"
+
+        manager.set_secret("TOKEN", "rotated")
+        assert primary.secrets["TOKEN"] == "rotated"
+        assert manager.get_secret("TOKEN") == "rotated"
+
+    def test_invalid_configuration(self):
+        with pytest.raises(ConfigurationError, match="at least one layer"):
+            SecretManager(provider_type="chain")
+        with pytest.raises(ConfigurationError, match="no provider_type"):
+            SecretManager(provider_type="chain", layers=[{"region_name": "x"}])
+        with pytest.raises(ConfigurationError, match="write_layer"):
+            SecretManager(
+                provider_type="chain", layers=[MemoryProvider()], write_layer=1
+            )
@@ -0,0 +1,115 @@
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+from cloud_secrets import SecretManager
+from cloud_secrets.common.clients import ClientRegistry, client_registry
+from cloud_secrets.providers.aws_provider import AWSSecretsProvider
+from cloud_secrets.providers.azure_provider import AzureSecretsProvider
+from cloud_secrets.providers.gcp_provider import GCPSecretsProvider
+
+
+class TestClientRegistry:
+    def test_reuses_clients_and_counts(self):
+        registry = ClientRegistry()
+        factory = MagicMock(side_effect=lambda: object())
+
+        first = registry.get(("aws", "us-east-1"), factory)
+        second = registry.get(("aws", "us-east-1"), factory)
+        other = registry.get(("aws", "eu-west-1"), factory)
+
+        assert first is second
+        assert other is not first
+        assert factory.call_count == 2
+        assert registry.stats() == {"aws": {"created": 2, "reused": 1, "clients": 2}}
+
+    def test_concurrent_creation_is_shared(self):
+        registry = ClientRegistry()
+        calls = []
+
+        def factory():
+            calls.append(1)
+            time.sleep(0.05)
+            return object()
+
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(registry.get(("gcp",), factory))
+            )
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert len({id(client) for client in results}) == 1
+        assert registry.stats()["gcp"] == {"created": 1, "reused": 7, "clients": 1}
+
+    def test_clear_closes_clients(self):
+        registry = ClientRegistry()
+        client = MagicMock()
+        registry.get(("azure", "vault"), lambda: client)
+        registry.clear()
+        client.close.assert_called_once()
+        assert registry.get(("azure", "vault"), MagicMock) is not client
+
+
+class TestProviderSharing:
+    def test_aws_managers_share_a_client(self, mock_aws_client):
+        with patch("boto3.client", return_value=mock_aws_client) as create:
+            first = SecretManager(provider_type="aws", region_name="us-east-1")
+            second = SecretManager(provider_type="aws", region_name="us-east-1")
+            SecretManager(provider_type="aws", region_name="eu-west-1")
+
+        assert first.provider.client is second.provider.client
+        assert create.call_count == 2
+        assert client_registry.stats()["aws"] == {
+            "created": 2,
+            "reused": 1,
+            "clients": 2,
+        }
+
+    def test_opt_out(self, mock_aws_client):
+        with patch("boto3.client", return_value=mock_aws_client) as create:
+            AWSSecretsProvider(share_client=False)
+            AWSSecretsProvider(share_client=False)
+        assert create.call_count == 2
+        assert client_registry.stats() == {}
+
+    def test_aws_pool_options(self):
+        with patch("boto3.client") as create:
+            AWSSecretsProvider(max_pool_connections=50, keepalive=True)
+            AWSSecretsProvider(max_pool_connections=50, keepalive=True)
+            AWSSecretsProvider()
+
+        assert create.call_count == 2
+        config = create.call_args_list[0].kwargs["config"]
+        assert config.max_pool_connections == 50
+        assert config.tcp_keepalive is True
+        assert "config" not in create.call_args_list[1].kwargs
+
+    def test_gcp_keepalive_channel(self, mock_gcp_client):
+        GCPSecretsProvider(project_id="one", keepalive=30)
+        GCPSecretsProvider(project_id="two", keepalive=30)
+
+        transport_cls = mock_gcp_client.get_transport_class.return_value
+        transport_cls.create_channel.assert_called_once()
+        options = dict(transport_cls.create_channel.call_args.kwargs["options"])
+        assert options["grpc.keepalive_time_ms"] == 30000
+
+    def test_azure_vaults_share_credential(self):
+        module = "cloud_secrets.providers.azure_provider"
+        with (
+            patch(f"{module}.DefaultAzureCredential") as credential_cls,
+            patch(f"{module}.SecretClient") as client_cls,
+        ):
+            AzureSecretsProvider(vault_url="https://one.vault.azure.net/")
+            AzureSecretsProvider(vault_url="https://one.vault.azure.net/")
+            AzureSecretsProvider(vault_url="https://two.vault.azure.net/")
+
+        credential_cls.assert_called_once_with()
+        assert client_cls.call_count == 2
+        assert client_registry.stats()["azure"]["reused"] == 1
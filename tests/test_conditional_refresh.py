@@ -0,0 +1,143 @@
+import time
+
+from cloud_secrets import SecretManager
+from cloud_secrets.common.instrumentation import MetricsRecorder
+from cloud_secrets.providers.aws_provider import AWSSecretsProvider
+from cloud_secrets.providers.azure_provider import AzureSecretsProvider
+from cloud_secrets.providers.gcp_provider import GCPSecretsProvider
+from cloud_secrets.refresher import SecretRefresher
+from tests.conftest import MemoryProvider
+
+
+def aws_backend(mock_aws_client, secrets):
+    """Serve ``secrets`` (name -> (value, version)) from the mocked client."""
+
+    def get_secret_value(SecretId, **kwargs):
+        value, version = secrets[SecretId]
+        return {"SecretString": value, "VersionId": version}
+
+    def describe_secret(SecretId):
+        return {"VersionIdsToStages": {secrets[SecretId][1]: ["AWSCURRENT"]}}
+
+    mock_aws_client.get_secret_value.side_effect = get_secret_value
+    mock_aws_client.describe_secret.side_effect = describe_secret
+
+
+class TestAWSConditionalRefresh:
+    def test_unchanged_secret_is_not_downloaded(self, mock_aws_client):
+        secrets = {"KEY": ("x" * 100, "v1")}
+        aws_backend(mock_aws_client, secrets)
+        provider = AWSSecretsProvider(cache_ttl=60)
+        provider.get_secret("KEY")
+
+        assert provider.refresh_if_changed("KEY") is False
+        assert provider.refresh_if_changed("KEY") is False
+
+        assert mock_aws_client.get_secret_value.call_count == 1
+        assert mock_aws_client.describe_secret.call_count == 2
+        stats = provider.backend_stats()
+        assert stats["payloads_skipped"] == 2
+        assert stats["bytes_saved"] == 200
+
+    def test_new_version_is_downloaded(self, mock_aws_client):
+        secrets = {"KEY": ("old", "v1")}
+        aws_backend(mock_aws_client, secrets)
+        manager = SecretManager(provider_type="aws", cache_ttl=60)
+        manager.get_secret("KEY")
+
+        secrets["KEY"] = ("new", "v2")
+        assert manager.get_secret("KEY") == "old"
+        assert manager.refresh_if_changed("KEY") is True
+        assert manager.get_secret("KEY") == "new"
+        assert mock_aws_client.get_secret_value.call_count == 2
+
+    def test_unseen_secret_is_fetched(self, mock_aws_client):
+        aws_backend(mock_aws_client, {"KEY": ("value", "v1")})
+        provider = AWSSecretsProvider()
+
+        assert provider.refresh_if_changed("KEY") is True
+        mock_aws_client.describe_secret.assert_not_called()
+        assert provider.get_secret("KEY") == "value"
+
+    def test_skip_renews_cache_entry(self, mock_aws_client):
+        aws_backend(mock_aws_client, {"KEY": ("value", "v1")})
+        provider = AWSSecretsProvider(cache_ttl=0.2)
+        provider.get_secret("KEY")
+        time.sleep(0.15)
+
+        provider.refresh_if_changed("KEY")
+        time.sleep(0.1)
+        provider.get_secret("KEY")
+        assert mock_aws_client.get_secret_value.call_count == 1
+
+    def test_hooks_report_saved_bytes(self, mock_aws_client):
+        secrets = {"KEY": ("abcd", "v1")}
+        aws_backend(mock_aws_client, secrets)
+        recorder = MetricsRecorder()
+        provider = AWSSecretsProvider(hooks=[recorder])
+        provider.get_secret("KEY")
+
+        provider.refresh_if_changed("KEY")
+        secrets["KEY"] = ("abcdef", "v2")
+        provider.refresh_if_changed("KEY")
+
+        metrics = recorder.snapshot()["AWSSecretsProvider.refresh_if_changed"]
+        assert metrics["calls"] == 2
+        assert metrics["cache"] == {"hit": 1, "miss": 1}
+        assert metrics["payloads_skipped"] == 1
+        assert metrics["bytes_saved"] == 4
+        assert metrics["size"]["sum"] == 6
+
+
+class TestOtherProviders:
+    def test_gcp_compares_latest_version(self, mock_gcp_client):
+        client = mock_gcp_client.return_value
+        client.access_secret_version.return_value.name = (
+            "projects/test-project/secrets/API_KEY/versions/3"
+        )
+        client.get_secret_version.return_value.name = (
+            "projects/test-project/secrets/API_KEY/versions/3"
+        )
+        provider = GCPSecretsProvider(project_id="test-project")
+        provider.get_secret("API_KEY")
+
+        assert provider.refresh_if_changed("API_KEY") is False
+        assert client.access_secret_version.call_count == 1
+
+        client.get_secret_version.return_value.name = (
+            "projects/test-project/secrets/API_KEY/versions/4"
+        )
+        client.access_secret_version.return_value.name = (
+            "projects/test-project/secrets/API_KEY/versions/4"
+        )
+        assert provider.refresh_if_changed("API_KEY") is True
+        assert client.access_secret_version.call_count == 2
+
+    def test_azure_always_fetches(self, mock_azure_client):
+        provider = AzureSecretsProvider(vault_url="https://test.vault.azure.net/")
+        provider.client = mock_azure_client
+        mock_azure_client.get_secret.return_value.properties.version = "abc"
+        provider.get_secret("API_KEY")
+
+        assert provider.refresh_if_changed("API_KEY") is False
+        assert mock_azure_client.get_secret.call_count == 2
+        assert provider.payloads_skipped == 0
+
+
+def test_refresher_skips_unchanged_downloads():
+    provider = MemoryProvider(cache_ttl=0.3)
+    provider.rotate("KEY", "value")
+    refresher = SecretRefresher(provider, refresh_ahead=0.25, jitter=0)
+    refresher.start()
+    try:
+        provider.get_secret("KEY")
+        deadline = time.monotonic() + 2
+        while refresher.refreshes < 2:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+    finally:
+        refresher.stop()
+
+    assert provider.fetches == 1
+    assert provider.payloads_skipped >= 2
+    assert refresher.changes == 0
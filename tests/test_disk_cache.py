@@ -0,0 +1,105 @@
+import pytest
+
+from cloud_secrets.common.disk_cache import EncryptedDiskCache
+from cloud_secrets.common.exceptions import ConfigurationError
+from tests.conftest import MemoryProvider
+
+
+@pytest.fixture
+def key():
+    return EncryptedDiskCache.generate_key()
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return tmp_path / "secrets.cache"
+
+
+class TestEncryptedDiskCache:
+    def test_round_trip_is_encrypted(self, cache_path, key):
+        cache = EncryptedDiskCache(cache_path, key=key)
+        cache.put("aws:us-east-1", "DB_PASSWORD", "hunter2")
+        cache.flush()
+
+        assert b"hunter2" not in cache_path.read_bytes()
+        reloaded = EncryptedDiskCache(cache_path, key=key)
+        assert reloaded.get("aws:us-east-1", "DB_PASSWORD") == "hunter2"
+        assert reloaded.get("gcp:project", "DB_PASSWORD") is None
+
+    def test_wrong_key_starts_empty(self, cache_path, key):
+        cache = EncryptedDiskCache(cache_path, key=key)
+        cache.put("ns", "A", "1")
+        cache.flush()
+
+        other = EncryptedDiskCache(cache_path, key=EncryptedDiskCache.generate_key())
+        assert other.get("ns", "A") is None
+
+    def test_key_from_env_or_callable(self, cache_path, key, monkeypatch):
+        monkeypatch.setenv(EncryptedDiskCache.KEY_ENV_VAR, key)
+        EncryptedDiskCache(cache_path)
+        EncryptedDiskCache(cache_path, key=lambda: key)
+
+    def test_missing_or_invalid_key(self, cache_path, monkeypatch):
+        monkeypatch.delenv(EncryptedDiskCache.KEY_ENV_VAR, raising=False)
+        with pytest.raises(ConfigurationError, match="No disk cache key"):
+            EncryptedDiskCache(cache_path)
+        with pytest.raises(ConfigurationError, match="Invalid disk cache key"):
+            EncryptedDiskCache(cache_path, key="not-a-key")
+
+    def test_max_age(self, cache_path, key):
+        cache = EncryptedDiskCache(cache_path, key=key, max_age=0)
+        cache.put("ns", "A", "1")
+        assert cache.get("ns", "A") is None
+
+
+class TestStaleWhileRevalidate:
+    def warm(self, cache_path, key, secrets):
+        cache = EncryptedDiskCache(cache_path, key=key)
+        provider = MemoryProvider(secrets, disk_cache=cache)
+        provider.get_secret("DB_PASSWORD")
+        cache.flush()
+
+    def test_cold_start_served_from_disk(self, cache_path, key):
+        backend = {"DB_PASSWORD": "old"}
+        self.warm(cache_path, key, backend)
+
+        backend["DB_PASSWORD"] = "rotated"
+        provider = MemoryProvider(
+            backend, disk_cache=EncryptedDiskCache(cache_path, key=key), cache_ttl=60
+        )
+        assert provider.get_secret("DB_PASSWORD") == "old"
+        assert provider.wait_revalidated(timeout=5)
+        assert provider.fetches == 1
+        assert provider.get_secret("DB_PASSWORD") == "rotated"
+        assert provider.fetches == 1
+
+    def test_revalidation_drops_deleted_secret(self, cache_path, key):
+        backend = {"DB_PASSWORD": "old"}
+        self.warm(cache_path, key, backend)
+
+        del backend["DB_PASSWORD"]
+        disk = EncryptedDiskCache(cache_path, key=key)
+        provider = MemoryProvider(backend, disk_cache=disk)
+        provider.get_secret("DB_PASSWORD")
+        assert provider.wait_revalidated(timeout=5)
+        assert disk.get(provider.cache_namespace, "DB_PASSWORD") is None
+
+    def test_batch_read_uses_disk(self, cache_path, key):
+        backend = {"DB_PASSWORD": "old", "API_KEY": "k"}
+        self.warm(cache_path, key, backend)
+
+        provider = MemoryProvider(
+            backend, disk_cache=EncryptedDiskCache(cache_path, key=key)
+        )
+        values, errors = provider.get_secrets(["DB_PASSWORD", "API_KEY"])
+        assert values == {"DB_PASSWORD": "old", "API_KEY": "k"}
+        assert provider.wait_revalidated(timeout=5)
+        # API_KEY was fetched synchronously, DB_PASSWORD revalidated
+        assert provider.fetches == 2
+
+    def test_set_secret_drops_disk_entry(self, cache_path, key):
+        disk = EncryptedDiskCache(cache_path, key=key)
+        provider = MemoryProvider({"A": "1"}, disk_cache=disk)
+        provider.get_secret("A")
+        provider.set_secret("A", "2")
+        assert disk.get(provider.cache_namespace, "A") is None
@@ -22,6 +22,7 @@ def test_gcp_provider(gcp_credentials):
     secret_manager = SecretManager(
         provider_type="gcp",
         project_id=test_project_id,  # Replace with your staging project ID
+        flatten_env=True,
     )
     # Test fetching an existing secret
     test_secret = secret_manager.get_secret("REDACTO_USER_SETTINGS")
@@ -0,0 +1,179 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+
+from cloud_secrets.common.exceptions import (
+    BackendUnavailableError,
+    ConfigurationError,
+    SecretNotFoundError,
+)
+from cloud_secrets.common.hedging import hedged_call
+from cloud_secrets.common.rate_limit import TokenBucket
+from cloud_secrets.common.resilience import CircuitBreaker, RetryPolicy
+from cloud_secrets.providers.aws_provider import AWSSecretsProvider
+from tests.conftest import client_error
+
+
+def slow_client(value, delay=0.0, error=None):
+    """A client whose get_secret_value takes ``delay`` seconds."""
+
+    def get_secret_value(SecretId):
+        time.sleep(delay)
+        if error is not None:
+            raise error
+        return {"SecretString": value, "VersionId": "v1"}
+
+    client = MagicMock()
+    client.get_secret_value.side_effect = get_secret_value
+    return client
+
+
+def hedged_provider(mock_aws_client, primary, *replicas, **kwargs):
+    mock_aws_client.get_secret_value.side_effect = primary.get_secret_value.side_effect
+    return AWSSecretsProvider(
+        replica_clients={f"replica-{i}": c for i, c in enumerate(replicas)},
+        hedge_delay=0.02,
+        **kwargs,
+    )
+
+
+class TestAWSHedging:
+    def test_fast_primary_sends_no_hedge(self, mock_aws_client):
+        replica = slow_client("replica")
+        provider = hedged_provider(mock_aws_client, slow_client("primary"), replica)
+
+        assert provider.get_secret("KEY") == "primary"
+        replica.get_secret_value.assert_not_called()
+        assert provider.backend_stats()["hedges_issued"] == 0
+
+    def test_slow_primary_is_hedged(self, mock_aws_client):
+        replica = slow_client("replica")
+        provider = hedged_provider(
+            mock_aws_client, slow_client("primary", delay=0.5), replica
+        )
+
+        start = time.monotonic()
+        assert provider.get_secret("KEY") == "replica"
+        assert time.monotonic() - start < 0.3
+        stats = provider.backend_stats()
+        assert stats["hedges_issued"] == 1
+        assert stats["hedges_won"] == 1
+        assert provider.seen_version("KEY") == "v1"
+
+    def test_replicas_are_tried_one_delay_apart(self, mock_aws_client):
+        first = slow_client("first", delay=0.5)
+        second = slow_client("second")
+        provider = hedged_provider(
+            mock_aws_client, slow_client("primary", delay=0.5), first, second
+        )
+
+        assert provider.get_secret("KEY") == "second"
+        assert provider.backend_stats()["hedges_issued"] == 2
+
+    def test_primary_not_found_is_final(self, mock_aws_client):
+        replica = slow_client("replica", delay=0.2)
+        primary = slow_client(
+            None, delay=0.05, error=client_error("ResourceNotFoundException")
+        )
+        provider = hedged_provider(mock_aws_client, primary, replica)
+
+        with pytest.raises(SecretNotFoundError):
+            provider.get_secret("KEY")
+        assert provider.backend_stats()["hedges_won"] == 0
+
+    def test_unavailable_primary_fails_over_at_once(self, mock_aws_client):
+        replica = slow_client("replica")
+        primary = slow_client(None, error=client_error("ServiceUnavailable"))
+        breaker = CircuitBreaker(failure_threshold=1)
+        provider = hedged_provider(
+            mock_aws_client,
+            primary,
+            replica,
+            retry_policy=RetryPolicy(max_attempts=1),
+            circuit_breaker=breaker,
+        )
+
+        assert provider.get_secret("KEY") == "replica"
+        assert breaker.state == CircuitBreaker.OPEN
+        # The breaker fails the primary fast; the replica still answers
+        provider.invalidate("KEY")
+        assert provider.get_secret("KEY") == "replica"
+        assert provider.backend_stats()["hedges_won"] == 2
+
+    def test_every_region_failing_raises_primary_error(self, mock_aws_client):
+        breaker = CircuitBreaker(failure_threshold=1)
+        breaker.record_failure()
+        provider = hedged_provider(
+            mock_aws_client,
+            slow_client("primary"),
+            slow_client(None, error=client_error("ServiceUnavailable")),
+            circuit_breaker=breaker,
+        )
+
+        with pytest.raises(BackendUnavailableError):
+            provider.get_secret("KEY")
+
+
+class TestHedgedCall:
+    def test_queued_call_is_not_hedged(self):
+        pool = ThreadPoolExecutor(max_workers=1)
+        try:
+            # Occupy the only worker so the first call waits in the queue
+            pool.submit(time.sleep, 0.1)
+            replica = MagicMock(return_value="replica")
+            result = hedged_call(
+                pool,
+                [lambda: time.sleep(0.01) or "primary", replica],
+                lambda index: 0.03,
+            )
+        finally:
+            pool.shutdown()
+
+        assert result.value == "primary"
+        assert result.launched == 1
+        replica.assert_not_called()
+
+    def test_timeouts_and_failures_are_reported(self):
+        def fail():
+            raise ValueError("boom")
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            result = hedged_call(
+                pool,
+                [lambda: time.sleep(0.5), fail, lambda: "last"],
+                lambda index: None,
+                timeouts=[0.02, None, None],
+            )
+
+        assert (result.index, result.value) == (2, "last")
+        assert result.failures[0] == (0, None)
+        assert isinstance(result.failures[1][1], ValueError)
+        assert not result.hedged
+
+
+class TestReplicaCalls:
+    def test_replicas_take_rate_limit_tokens(self, mock_aws_client):
+        replica = slow_client("replica")
+        provider = hedged_provider(
+            mock_aws_client,
+            slow_client(None, error=client_error("ServiceUnavailable")),
+            replica,
+            rate_limiter=TokenBucket(rate=1, burst=1, max_wait=0),
+        )
+
+        # The primary takes the only token; the replica is refused one, and
+        # the primary's error is the one reported
+        with pytest.raises(ConfigurationError, match="ServiceUnavailable"):
+            provider.get_secret("KEY")
+        replica.get_secret_value.assert_not_called()
+        assert provider.rate_limiter.stats()["rejected"] == 1
+
+    def test_close_stops_the_hedge_pool(self, mock_aws_client):
+        provider = hedged_provider(
+            mock_aws_client, slow_client("primary"), slow_client("replica")
+        )
+        provider.close()
+        with pytest.raises(RuntimeError):
+            provider._hedge_pool.submit(print)
@@ -0,0 +1,178 @@
+import logging
+from unittest.mock import MagicMock
+
+import pytest
+
+from cloud_secrets import SecretManager
+from cloud_secrets.common.exceptions import ConfigurationError, SecretNotFoundError
+from cloud_secrets.common.instrumentation import (
+    Histogram,
+    MetricsRecorder,
+    OpenTelemetryHook,
+    OperationEvent,
+    PrometheusHook,
+)
+from cloud_secrets.providers.aws_provider import AWSSecretsProvider
+from cloud_secrets.providers.local_provider import LocalEnvProvider
+
+
+class TestHistogram:
+    def test_cumulative_buckets(self):
+        histogram = Histogram([1, 10])
+        for value in (0.5, 1, 5, 50):
+            histogram.observe(value)
+
+        snapshot = histogram.snapshot()
+        assert snapshot["count"] == 4
+        assert snapshot["sum"] == 56.5
+        assert snapshot["buckets"] == {1: 2, 10: 3, float("inf"): 4}
+
+
+class TestProviderHooks:
+    def test_reads_report_cache_outcome_and_size(self, env_file):
+        recorder = MetricsRecorder()
+        provider = LocalEnvProvider(env_path=env_file, cache_ttl=60, hooks=[recorder])
+
+        assert provider.get_secret("API_KEY") == "secret123"
+        assert provider.get_int("PORT") == 8080
+        provider.get_secret("API_KEY")
+
+        metrics = recorder.snapshot()["LocalEnvProvider.get_secret"]
+        assert metrics["calls"] == 3
+        assert metrics["cache"] == {"miss": 2, "hit": 1}
+        assert metrics["latency"]["count"] == 3
+        assert metrics["size"]["sum"] == len("secret123") * 2 + len("8080")
+        assert metrics["errors"] == {}
+
+    def test_errors_by_exception_class(self, env_file):
+        events = []
+        provider = LocalEnvProvider(env_path=env_file, hooks=[events.append])
+
+        with pytest.raises(SecretNotFoundError):
+            provider.get_secret("MISSING")
+
+        (event,) = events
+        assert event.operation == "get_secret"
+        assert event.secret_name == "MISSING"
+        assert event.error == "SecretNotFoundError"
+        assert event.size is None
+
+    def test_batch_reads_report_one_event_per_name(self, env_file):
+        events = []
+        provider = LocalEnvProvider(
+            env_path=env_file, cache_ttl=60, hooks=[events.append]
+        )
+        provider.get_secret("API_KEY")
+        events.clear()
+
+        values, errors = provider.get_secrets(["API_KEY", "PORT", "MISSING"])
+
+        by_name = {event.secret_name: event for event in events}
+        assert set(by_name) == {"API_KEY", "PORT", "MISSING"}
+        assert {event.operation for event in events} == {"get_secrets"}
+        assert len({event.seconds for event in events}) == 1
+        assert by_name["API_KEY"].cache == "hit"
+        assert by_name["PORT"].cache == "miss"
+        assert by_name["PORT"].size == len("8080")
+        assert by_name["MISSING"].error == "SecretNotFoundError"
+        assert by_name["MISSING"].size is None
+
+    def test_get_dict(self, env_file):
+        recorder = MetricsRecorder()
+        provider = LocalEnvProvider(env_path=env_file, cache_ttl=60, hooks=[recorder])
+        provider.set_secret("DATABASE", '{"host": "db", "port": 5432}')
+
+        assert provider.get_dict("DATABASE") == {"host": "db", "port": 5432}
+        provider.get_dict("DATABASE")
+
+        metrics = recorder.snapshot()["LocalEnvProvider.get_dict"]
+        assert metrics["calls"] == 2
+        assert metrics["cache"] == {"miss": 1, "hit": 1}
+        assert metrics["size"]["sum"] == 2 * len('{"host": "db", "port": 5432}')
+
+    def test_writes(self, mock_aws_client):
+        events = []
+        manager = SecretManager(provider_type="aws")
+        manager.add_hook(events.append)
+
+        manager.set_secret("API_KEY", "hunter2")
+        manager.delete_secret("API_KEY")
+
+        assert [(e.provider, e.operation, e.size, e.cache) for e in events] == [
+            ("AWSSecretsProvider", "set_secret", 7, None),
+            ("AWSSecretsProvider", "delete_secret", None, None),
+        ]
+
+    def test_failing_hook_is_logged(self, mock_aws_client, caplog):
+        def broken(event):
+            raise RuntimeError("boom")
+
+        provider = AWSSecretsProvider(hooks=[broken])
+        with caplog.at_level(logging.ERROR):
+            assert provider.get_secret("API_KEY") == "secret123"
+        assert "Instrumentation hook" in caplog.text
+
+    def test_remove_hook(self, mock_aws_client):
+        events = []
+        provider = AWSSecretsProvider(hooks=[events.append])
+        provider.remove_hook(events.append)
+        provider.get_secret("API_KEY")
+        assert events == []
+
+
+class TestAdapters:
+    def test_opentelemetry_records_instruments(self):
+        meter = MagicMock()
+        hook = OpenTelemetryHook(meter=meter)
+        # Both histograms (duration, size) are the same mock here
+        histogram = meter.create_histogram.return_value
+        errors = meter.create_counter.return_value
+
+        hook(
+            OperationEvent(
+                "AWSSecretsProvider",
+                "get_secret",
+                "API_KEY",
+                0.01,
+                "ConfigurationError",
+                "miss",
+                None,
+            )
+        )
+
+        histogram.record.assert_called_once_with(
+            0.01, {"provider": "AWSSecretsProvider", "operation": "get_secret"}
+        )
+        errors.add.assert_any_call(
+            1,
+            {
+                "provider": "AWSSecretsProvider",
+                "operation": "get_secret",
+                "error.type": "ConfigurationError",
+            },
+        )
+
+    def test_opentelemetry_with_global_meter(self):
+        pytest.importorskip("opentelemetry")
+        hook = OpenTelemetryHook()
+        hook(
+            OperationEvent("LocalEnvProvider", "get_secret", "A", 0.001, None, "hit", 3)
+        )
+
+    def test_prometheus(self):
+        try:
+            import prometheus_client
+        except ImportError:
+            with pytest.raises(ConfigurationError, match="prometheus-client"):
+                PrometheusHook()
+            return
+        registry = prometheus_client.CollectorRegistry()
+        hook = PrometheusHook(registry=registry)
+        hook(
+            OperationEvent("LocalEnvProvider", "get_secret", "A", 0.001, None, "hit", 3)
+        )
+        labels = {"provider": "LocalEnvProvider", "operation": "get_secret"}
+        assert (
+            registry.get_sample_value("cloud_secrets_operation_seconds_count", labels)
+            == 1
+        )
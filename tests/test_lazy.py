@@ -0,0 +1,164 @@
+import copy
+import pickle
+import threading
+from decimal import Decimal
+
+import pytest
+
+from cloud_secrets import SecretManager
+from cloud_secrets.common.exceptions import SecretNotFoundError
+from cloud_secrets.common.lazy import LazySecret
+
+
+@pytest.fixture
+def manager(env_file):
+    return SecretManager(provider_type="local", env_path=env_file, export_env=False)
+
+
+class CountingResolve:
+    def __init__(self, value):
+        self.value = value
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.value
+
+
+class TestLazySecret:
+    def test_resolves_once_on_first_use(self):
+        resolve = CountingResolve("secret123")
+        secret = LazySecret("API_KEY", resolve)
+        assert resolve.calls == 0
+        assert not secret.resolved
+
+        assert str(secret) == "secret123"
+        assert secret == "secret123"
+        assert f"key={secret}" == "key=secret123"
+        assert secret.upper() == "SECRET123"
+        assert resolve.calls == 1
+        assert secret.resolved
+
+    def test_repr_hides_value(self):
+        secret = LazySecret("API_KEY", CountingResolve("secret123"))
+        assert repr(secret) == "<LazySecret API_KEY (pending)>"
+        secret.value
+        assert "secret123" not in repr(secret)
+        assert repr(secret) == "<LazySecret API_KEY (resolved)>"
+
+    def test_forwards_numeric_and_container_operations(self):
+        port = LazySecret("PORT", CountingResolve(8080))
+        assert int(port) == 8080
+        assert port + 1 == 8081
+        assert port > LazySecret("LOW", CountingResolve(80))
+        assert list(range(3))[LazySecret("I", CountingResolve(1))] == 1
+
+        hosts = LazySecret("HOSTS", CountingResolve(["a", "b"]))
+        assert len(hosts) == 2
+        assert "a" in hosts
+        assert hosts[1] == "b"
+        assert list(hosts) == ["a", "b"]
+        assert {LazySecret("K", CountingResolve("k")): 1}["k"] == 1
+
+    def test_errors_are_raised_on_use_and_retried(self):
+        calls = []
+
+        def resolve():
+            calls.append(1)
+            raise SecretNotFoundError("Secret MISSING not found")
+
+        secret = LazySecret("MISSING", resolve)
+        for _ in range(2):
+            with pytest.raises(SecretNotFoundError):
+                str(secret)
+        assert len(calls) == 2
+        assert not secret.resolved
+
+    def test_concurrent_first_use_resolves_once(self):
+        resolve = CountingResolve("value")
+        secret = LazySecret("KEY", resolve)
+        barrier = threading.Barrier(8)
+        results = []
+
+        def use():
+            barrier.wait()
+            results.append(secret.value)
+
+        threads = [threading.Thread(target=use) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == ["value"] * 8
+        assert resolve.calls == 1
+
+
+class TestManagerLazy:
+    def test_defers_fetch_until_used(self, manager, monkeypatch):
+        fetched = []
+        original = manager.provider._fetch_raw_secret
+
+        def fetch(secret_name):
+            fetched.append(secret_name)
+            return original(secret_name)
+
+        monkeypatch.setattr(manager.provider, "_fetch_raw_secret", fetch)
+        api_key = manager.lazy("API_KEY")
+        manager.lazy("APP_NAME")
+        assert fetched == []
+
+        assert api_key == "secret123"
+        assert fetched == ["API_KEY"]
+
+    def test_cast_types(self, manager):
+        assert manager.lazy("PORT", cast="int").value == 8080
+        assert manager.lazy("DEBUG", cast="bool").value is True
+        assert manager.lazy("ALLOWED_HOSTS", cast="list").value == [
+            "localhost",
+            "127.0.0.1",
+        ]
+
+    def test_callable_cast(self, manager):
+        rate = manager.lazy("RATE_LIMIT", cast=Decimal)
+        assert rate.value == Decimal("12.5")
+
+    def test_kwargs_reach_get_secret(self, manager):
+        manager.set_secret("DATABASE", '{"host": "db", "port": 5432}')
+        assert manager.lazy("DATABASE", cast="int", field="port").value == 5432
+
+    def test_missing_secret_raises_on_use(self, manager):
+        secret = manager.lazy("MISSING")
+        with pytest.raises(SecretNotFoundError):
+            secret.value
+
+    def test_env_lazy(self, manager):
+        env = manager.get_env()
+        port = env.lazy("PORT", cast="int")
+        assert isinstance(port, LazySecret)
+        assert port.value == 8080
+
+
+class TestCopying:
+    def test_copy_and_deepcopy_resolve_to_value(self):
+        assert copy.copy(LazySecret("KEY", CountingResolve("value"))) == "value"
+        settings = {"DATABASES": {"PASSWORD": LazySecret("DB", CountingResolve("pw"))}}
+        copied = copy.deepcopy(settings)
+        assert copied == {"DATABASES": {"PASSWORD": "pw"}}
+        assert type(copied["DATABASES"]["PASSWORD"]) is str
+
+    def test_pickle_resolves_to_value(self):
+        secret = LazySecret("HOSTS", CountingResolve(["a", "b"]))
+        assert pickle.loads(pickle.dumps(secret)) == ["a", "b"]
+
+    def test_private_attributes_do_not_resolve(self):
+        resolve = CountingResolve("value")
+        secret = LazySecret("KEY", resolve)
+        with pytest.raises(AttributeError):
+            secret._private
+        assert resolve.calls == 0
+
+    def test_env_lazy_is_a_method_of_the_env_class(self, manager):
+        env = manager.get_env()
+        assert "lazy" not in vars(env)
+        assert env.lazy("APP_NAME").value == "MyApp"
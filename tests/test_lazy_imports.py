@@ -0,0 +1,78 @@
+import subprocess
+import sys
+from importlib.metadata import EntryPoint
+
+import pytest
+
+from cloud_secrets import SecretManager
+from cloud_secrets.common.exceptions import ConfigurationError
+from cloud_secrets.providers.local_provider import LocalEnvProvider
+from cloud_secrets.providers.registry import load_provider_class
+
+SDK_PREFIXES = ("boto3", "botocore", "grpc", "google.cloud", "azure")
+
+
+def imported_after(code):
+    """Return SDK modules loaded by running ``code`` in a fresh interpreter."""
+    script = (
+        f"import sys\n{code}\n"
+        f"print('\\n'.join(m for m in sys.modules if m.startswith({SDK_PREFIXES})))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    return set(result.stdout.split())
+
+
+class TestLazyImports:
+    def test_import_does_not_load_sdks(self):
+        assert imported_after("import cloud_secrets") == set()
+
+    def test_local_provider_does_not_load_sdks(self, env_file):
+        code = (
+            "from cloud_secrets import SecretManager\n"
+            f"SecretManager(provider_type='local', env_path={env_file!r})"
+        )
+        assert imported_after(code) == set()
+
+    def test_only_selected_sdk_is_loaded(self):
+        code = (
+            "from cloud_secrets import SecretManager\n"
+            "SecretManager(provider_type='aws', region_name='us-east-1')"
+        )
+        loaded = imported_after(code)
+        assert "boto3" in loaded
+        assert not any(m.startswith(("grpc", "google.cloud", "azure")) for m in loaded)
+
+    def test_async_manager_is_still_exported(self):
+        from cloud_secrets import AsyncSecretManager
+
+        assert AsyncSecretManager.__name__ == "AsyncSecretManager"
+
+
+class TestRegistry:
+    def test_class_and_import_path_specs(self):
+        providers = {
+            "cls": LocalEnvProvider,
+            "path": "cloud_secrets.providers.local_provider:LocalEnvProvider",
+        }
+        assert load_provider_class("cls", providers, "none") is LocalEnvProvider
+        assert load_provider_class("path", providers, "none") is LocalEnvProvider
+
+    def test_entry_point_lookup(self, mocker, env_file):
+        entry_point = EntryPoint(
+            name="custom",
+            value="cloud_secrets.providers.local_provider:LocalEnvProvider",
+            group=SecretManager.ENTRY_POINT_GROUP,
+        )
+        lookup = mocker.patch(
+            "cloud_secrets.providers.registry.entry_points",
+            return_value=[entry_point],
+        )
+        manager = SecretManager(provider_type="custom", env_path=env_file)
+        assert isinstance(manager.provider, LocalEnvProvider)
+        lookup.assert_called_once_with(group="cloud_secrets.providers", name="custom")
+
+    def test_broken_import_path(self):
+        with pytest.raises(ConfigurationError, match="Failed to load provider"):
+            load_provider_class("bad", {"bad": "no_such_module:Provider"}, "none")
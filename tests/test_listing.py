@@ -0,0 +1,189 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+from google.api_core import exceptions as gcp_exceptions
+
+from benchmarks.backends import FakeAzureClient, FakePageIterator
+from cloud_secrets import SecretManager
+from cloud_secrets.common.exceptions import ConfigurationError
+from cloud_secrets.common.resilience import RetryPolicy
+from cloud_secrets.providers.aws_provider import AWSSecretsProvider
+from cloud_secrets.providers.azure_provider import AzureSecretsProvider
+from cloud_secrets.providers.base import BaseSecretProvider
+from cloud_secrets.providers.chain_provider import ChainProvider
+from cloud_secrets.providers.gcp_provider import GCPSecretsProvider
+from cloud_secrets.providers.local_provider import LocalEnvProvider
+
+
+class TestAWSListing:
+    def test_pages_are_requested_lazily(self, mock_aws_client):
+        pages = [
+            {"SecretList": [{"Name": "app/a"}, {"Name": "APP/b"}], "NextToken": "1"},
+            {"SecretList": [{"Name": "app/c"}]},
+        ]
+        mock_aws_client.list_secrets.side_effect = pages
+        provider = AWSSecretsProvider()
+
+        names = provider.iter_secrets("app/")
+        assert next(names) == "app/a"
+        assert mock_aws_client.list_secrets.call_count == 1
+        # The server-side filter ignores case
+        assert list(names) == ["app/c"]
+
+        calls = mock_aws_client.list_secrets.call_args_list
+        assert calls[0].kwargs == {
+            "MaxResults": 100,
+            "Filters": [{"Key": "name", "Values": ["app/"]}],
+        }
+        assert calls[1].kwargs["NextToken"] == "1"
+
+    def test_values_use_batch_reads(self, mock_aws_client):
+        mock_aws_client.list_secrets.return_value = {
+            "SecretList": [{"Name": f"app/{i}"} for i in range(5)]
+        }
+        mock_aws_client.batch_get_secret_value.return_value = {
+            "SecretValues": [
+                {"Name": f"app/{i}", "SecretString": str(i)} for i in range(5)
+            ],
+            "Errors": [],
+        }
+        manager = SecretManager(provider_type="aws", export_env=False)
+
+        pairs = list(manager.iter_secrets("app/", include_values=True))
+
+        assert pairs == [(f"app/{i}", str(i)) for i in range(5)]
+        mock_aws_client.get_secret_value.assert_not_called()
+        assert mock_aws_client.batch_get_secret_value.call_count == 1
+
+
+def gcp_page(names, next_page_token=""):
+    """A ListSecrets pager as read by the provider: one response."""
+    return SimpleNamespace(
+        secrets=[
+            SimpleNamespace(name=f"projects/test-project/secrets/{name}")
+            for name in names
+        ],
+        next_page_token=next_page_token,
+    )
+
+
+class TestGCPListing:
+    def test_strips_resource_path(self, mock_gcp_client):
+        client = mock_gcp_client.return_value
+        client.list_secrets.return_value = gcp_page(
+            ("app_db", "other_app_key", "app_key")
+        )
+        provider = GCPSecretsProvider(project_id="test-project")
+
+        assert list(provider.iter_secrets("app_")) == ["app_db", "app_key"]
+        client.list_secrets.assert_called_once_with(
+            request={"parent": "projects/test-project", "filter": "name:app_"}
+        )
+        # Listed secrets are known to exist, so writes skip the probe
+        provider.set_secret("app_db", "new")
+        client.get_secret.assert_not_called()
+
+    def test_each_page_is_a_retried_backend_call(self, mock_gcp_client):
+        client = mock_gcp_client.return_value
+        client.list_secrets.side_effect = [
+            gcp_page(["app_a"], next_page_token="t1"),
+            gcp_exceptions.ResourceExhausted("slow down"),
+            gcp_page(["app_b"]),
+        ]
+        provider = GCPSecretsProvider(
+            project_id="test-project",
+            retry_policy=RetryPolicy(sleep=lambda seconds: None),
+        )
+
+        names = provider.iter_secrets()
+        assert next(names) == "app_a"
+        assert client.list_secrets.call_count == 1
+        assert list(names) == ["app_b"]
+
+        assert provider.backend_stats()["retries"] == 1
+        last = client.list_secrets.call_args.kwargs["request"]
+        assert last == {"parent": "projects/test-project", "page_token": "t1"}
+
+
+class TestAzureListing:
+    def test_skips_disabled_secrets(self, mock_azure_client):
+        provider = AzureSecretsProvider(vault_url="https://test.vault.azure.net/")
+        provider.client = mock_azure_client
+        page = [
+            SimpleNamespace(name="app-a", enabled=True),
+            SimpleNamespace(name="app-b", enabled=False),
+            SimpleNamespace(name="web-c", enabled=True),
+        ]
+        paged = mock_azure_client.list_properties_of_secrets.return_value
+        paged.by_page.return_value = FakePageIterator(lambda token: (page, None))
+
+        assert list(provider.iter_secrets("app-")) == ["app-a"]
+
+    def test_pages_are_requested_lazily(self, mock_azure_client):
+        provider = AzureSecretsProvider(vault_url="https://test.vault.azure.net/")
+        provider.client = FakeAzureClient({f"app-{i}": str(i) for i in range(5)})
+        provider.client.PAGE_SIZE = 2
+
+        names = provider.iter_secrets("app-")
+        assert next(names) == "app-0"
+        assert provider.client.calls == 1
+        assert list(names) == ["app-1", "app-2", "app-3", "app-4"]
+        assert provider.client.calls == 3
+
+
+class TestLocalListing:
+    def test_sidecar_then_env_file(self, env_file, tmp_path):
+        (tmp_path / ".secrets.json").write_text(
+            json.dumps({"API_KEY": "override", "API_TOKEN": "t"})
+        )
+        provider = LocalEnvProvider(env_path=env_file, export_env=False)
+
+        assert list(provider.iter_secrets("API_")) == ["API_KEY", "API_TOKEN"]
+        assert "PORT" in list(provider.iter_secrets())
+        assert dict(provider.iter_secrets("A", include_values=True)) == {
+            "API_KEY": "override",
+            "API_TOKEN": "t",
+            "APP_NAME": "MyApp",
+            "ALLOWED_HOSTS": "localhost,127.0.0.1",
+        }
+
+    def test_deleted_between_listing_and_reading(self, env_file, mocker):
+        provider = LocalEnvProvider(env_path=env_file, export_env=False)
+        provider.set_secrets({"JOB_A": "1"})
+        mocker.patch.object(
+            provider, "_iter_secret_names", return_value=iter(["JOB_A", "JOB_B"])
+        )
+
+        assert list(provider.iter_secrets("JOB_", include_values=True)) == [
+            ("JOB_A", "1")
+        ]
+
+
+class TestChainListing:
+    def test_each_name_once(self, env_file, tmp_path):
+        other = tmp_path / "other"
+        other.mkdir()
+        (other / ".env").write_text("API_KEY=x\nEXTRA=y\n")
+        provider = ChainProvider(
+            layers=[
+                LocalEnvProvider(env_path=env_file, export_env=False),
+                LocalEnvProvider(env_path=str(other / ".env"), export_env=False),
+            ],
+            export_env=False,
+        )
+
+        names = list(provider.iter_secrets())
+        assert names.count("API_KEY") == 1
+        assert "EXTRA" in names
+
+    def test_no_listable_layer(self):
+        class Unlistable(BaseSecretProvider):
+            _fetch_raw_secret = _store_raw_secret = _delete_raw_secret = None
+
+        provider = ChainProvider(layers=[Unlistable()], export_env=False)
+
+        with pytest.raises(ConfigurationError, match="can list secrets"):
+            list(provider.iter_secrets())
+        with pytest.raises(ConfigurationError, match="does not support listing"):
+            list(Unlistable().iter_secrets())
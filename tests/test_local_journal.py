@@ -0,0 +1,143 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from cloud_secrets.common.exceptions import ConfigurationError, SecretNotFoundError
+from cloud_secrets.providers.local_provider import LocalEnvProvider
+
+
+def sidecar_paths(env_file):
+    parent = Path(env_file).parent
+    return parent / ".secrets.json", parent / ".secrets.journal"
+
+
+def journal_entries(journal):
+    """Return the journal's changes, without its snapshot header."""
+    entries = [json.loads(line) for line in journal.read_text().splitlines()]
+    return [entry for entry in entries if entry["op"] != "snapshot"]
+
+
+class TestJournal:
+    def test_writes_append_without_rewriting_snapshot(self, env_file):
+        provider = LocalEnvProvider(env_path=env_file, export_env=False)
+        provider.set_secret("FIRST", "1")
+        snapshot, journal = sidecar_paths(env_file)
+        before = snapshot.stat()
+
+        provider.set_secret("SECOND", "2")
+        provider.delete_secret("FIRST")
+
+        after = snapshot.stat()
+        assert (after.st_ino, after.st_mtime_ns) == (before.st_ino, before.st_mtime_ns)
+        assert journal_entries(journal)[-2:] == [
+            {"op": "set", "name": "SECOND", "value": "2"},
+            {"op": "delete", "name": "FIRST"},
+        ]
+
+    def test_reads_do_not_reparse_unchanged_sidecar(self, env_file, mocker):
+        provider = LocalEnvProvider(env_path=env_file, export_env=False)
+        provider.set_secret("CACHED", "v")
+        read_snapshot = mocker.spy(provider, "_read_snapshot")
+        replay = mocker.spy(provider, "_replay_journal")
+
+        for _ in range(5):
+            assert provider.get_secret("CACHED") == "v"
+
+        assert read_snapshot.call_count == 0
+        assert replay.call_count == 0
+
+    def test_other_instances_see_appends(self, env_file):
+        writer = LocalEnvProvider(env_path=env_file, export_env=False)
+        reader = LocalEnvProvider(env_path=env_file, export_env=False)
+        writer.set_secret("SHARED", "one")
+        assert reader.get_secret("SHARED") == "one"
+
+        writer.set_secret("SHARED", "two")
+        assert reader.get_secret("SHARED") == "two"
+
+        writer.delete_secret("SHARED")
+        assert "SHARED" not in reader._load_secrets_file()
+
+    def test_torn_trailing_line_is_ignored(self, env_file):
+        provider = LocalEnvProvider(env_path=env_file, export_env=False)
+        provider.set_secret("WHOLE", "ok")
+        _, journal = sidecar_paths(env_file)
+        with open(journal, "a") as f:
+            f.write('{"op": "set", "name": "TORN"')
+
+        reader = LocalEnvProvider(env_path=env_file, export_env=False)
+        assert reader.get_secret("WHOLE") == "ok"
+        with pytest.raises(SecretNotFoundError):
+            reader.get_secret("TORN")
+
+        # The next write replaces the torn line
+        provider.set_secret("AFTER", "fine")
+        assert LocalEnvProvider(env_path=env_file).get_secret("AFTER") == "fine"
+
+    def test_corrupt_journal(self, env_file):
+        _, journal = sidecar_paths(env_file)
+        journal.write_text("not json\n")
+        provider = LocalEnvProvider(env_path=env_file)
+        with pytest.raises(ConfigurationError, match="Corrupt secrets journal"):
+            provider.get_secret("ANY_KEY")
+
+
+class TestCompaction:
+    def test_compacts_after_threshold(self, env_file):
+        provider = LocalEnvProvider(
+            env_path=env_file, export_env=False, journal_max_entries=5
+        )
+        # Compaction waits until the journal outgrows the secret count too
+        for n in range(12):
+            provider.set_secret(f"C{n % 3}", str(n))
+
+        snapshot, journal = sidecar_paths(env_file)
+        assert len(journal_entries(journal)) <= 5
+        reader = LocalEnvProvider(env_path=env_file, export_env=False)
+        assert reader._load_secrets_file() == {"C0": "9", "C1": "10", "C2": "11"}
+
+    def test_compact_exports_secrets_json(self, env_file):
+        provider = LocalEnvProvider(env_path=env_file, export_env=False)
+        provider.set_secret("KEEP", "k")
+        provider.set_secret("DROP", "d")
+        provider.delete_secret("DROP")
+        reader = LocalEnvProvider(env_path=env_file, export_env=False)
+        assert reader.get_secret("KEEP") == "k"
+
+        provider.compact()
+
+        snapshot, journal = sidecar_paths(env_file)
+        assert json.loads(snapshot.read_text()) == {"KEEP": "k"}
+        assert journal_entries(journal) == []
+        # Readers notice the replaced files and reload
+        assert reader._load_secrets_file() == {"KEEP": "k"}
+
+    def test_imports_existing_secrets_json(self, env_file):
+        snapshot, _ = sidecar_paths(env_file)
+        snapshot.write_text(json.dumps({"IMPORTED": "yes"}, indent=2))
+        provider = LocalEnvProvider(env_path=env_file, export_env=False)
+        assert provider.get_secret("IMPORTED") == "yes"
+
+        # Edits made to the file directly are picked up too
+        snapshot.write_text(json.dumps({"IMPORTED": "edited", "EXTRA": "x"}))
+        assert provider.get_secret("IMPORTED") == "edited"
+
+    def test_import_replaces_pending_journal_entries(self, env_file):
+        provider = LocalEnvProvider(env_path=env_file, export_env=False)
+        provider.set_secret("DB_PASSWORD", "old")
+        provider.set_secret("OTHER", "journal-only")
+        snapshot, journal = sidecar_paths(env_file)
+        assert journal_entries(journal)
+
+        snapshot.write_text(json.dumps({"DB_PASSWORD": "new"}))
+
+        assert provider.get_secret("DB_PASSWORD") == "new"
+        fresh = LocalEnvProvider(env_path=env_file, export_env=False)
+        assert fresh.get_secret("DB_PASSWORD") == "new"
+        assert "OTHER" not in fresh._load_secrets_file()
+
+        # The next write starts a journal on top of the imported snapshot
+        fresh.set_secret("ADDED", "1")
+        reader = LocalEnvProvider(env_path=env_file, export_env=False)
+        assert reader._load_secrets_file() == {"DB_PASSWORD": "new", "ADDED": "1"}
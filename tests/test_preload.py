@@ -0,0 +1,138 @@
+import os
+
+import pytest
+
+from cloud_secrets import SecretManager
+from cloud_secrets.common.exceptions import (
+    ConfigurationError,
+    PreloadError,
+    SecretNotFoundError,
+)
+from cloud_secrets.common.manifest import SecretSpec, load_manifest
+
+
+class TestManifest:
+    def test_mapping_and_names(self):
+        specs = load_manifest(
+            {"PORT": "int", "DEBUG": {"cast": "bool", "default": False}, "KEY": None}
+        )
+        assert specs == [
+            SecretSpec("PORT", "int"),
+            SecretSpec("DEBUG", "bool", default=False),
+            SecretSpec("KEY"),
+        ]
+        assert load_manifest(["A", "B"]) == [SecretSpec("A"), SecretSpec("B")]
+
+    def test_line_file(self, tmp_path):
+        path = tmp_path / "secrets.manifest"
+        path.write_text(
+            "# startup secrets\n"
+            "API_KEY\n"
+            "PORT int default=8080  # web port\n"
+            'GREETING str default="hello world"\n'
+            "SENTRY_DSN optional\n"
+        )
+        assert load_manifest(str(path)) == [
+            SecretSpec("API_KEY"),
+            SecretSpec("PORT", "int", default="8080"),
+            SecretSpec("GREETING", default="hello world"),
+            SecretSpec("SENTRY_DSN", required=False),
+        ]
+
+    def test_json_file(self, tmp_path):
+        path = tmp_path / "secrets.json"
+        path.write_text('{"PORT": "int"}')
+        assert load_manifest(path) == [SecretSpec("PORT", "int")]
+
+    def test_invalid_entries_reported_together(self, tmp_path):
+        with pytest.raises(ConfigurationError) as excinfo:
+            load_manifest({"A": "integer", "B": "money"})
+        assert "A: unknown cast type 'integer'" in str(excinfo.value)
+        assert "B: unknown cast type 'money'" in str(excinfo.value)
+
+        path = tmp_path / "bad.manifest"
+        path.write_text("PORT int sometimes\n")
+        with pytest.raises(ConfigurationError, match="bad.manifest:1"):
+            load_manifest(path)
+
+        with pytest.raises(ConfigurationError, match="Unknown manifest keys"):
+            load_manifest({"A": {"type": "int"}})
+
+
+class TestPreload:
+    def test_values_defaults_and_optional(self, env_file):
+        manager = SecretManager(provider_type="local", env_path=env_file)
+        values = manager.preload(
+            {
+                "API_KEY": "str",
+                "PORT": "int",
+                "DEBUG": "bool",
+                "TIMEOUT": {"cast": "int", "default": 30},
+                "SENTRY_DSN": {"required": False},
+            }
+        )
+        assert values == {
+            "API_KEY": "secret123",
+            "PORT": 8080,
+            "DEBUG": True,
+            "TIMEOUT": 30,
+        }
+        # Defaults are returned, not stored or exported
+        assert "TIMEOUT" not in os.environ
+        with pytest.raises(SecretNotFoundError):
+            manager.provider.get_int("TIMEOUT")
+
+    def test_default_does_not_hide_backend_errors(self, env_file, mocker):
+        manager = SecretManager(provider_type="local", env_path=env_file)
+        mocker.patch.object(
+            manager.provider,
+            "_get_raw_secrets",
+            return_value=({}, {"TIMEOUT": ConfigurationError("backend down")}),
+        )
+        with pytest.raises(PreloadError) as excinfo:
+            manager.preload({"TIMEOUT": {"cast": "int", "default": 30}})
+        assert str(excinfo.value.errors["TIMEOUT"]) == "backend down"
+
+    def test_later_reads_skip_backend(self, env_file, mocker):
+        manager = SecretManager(provider_type="local", env_path=env_file)
+        manager.preload(["API_KEY", "PORT"])
+        fetch = mocker.spy(manager.provider, "_fetch_raw_secret")
+        batch = mocker.spy(manager.provider, "_fetch_raw_secrets")
+
+        assert manager.get_secret("API_KEY") == "secret123"
+        assert manager.provider.get_int("PORT") == 8080
+        assert manager.get_secrets(["API_KEY", "PORT"]).errors == {}
+        assert fetch.call_count == 0
+        assert batch.call_count == 0
+
+        manager.invalidate("API_KEY")
+        manager.get_secret("API_KEY")
+        assert fetch.call_count == 1
+
+    def test_fetches_in_one_batch(self, mock_aws_client):
+        mock_aws_client.batch_get_secret_value.return_value = {
+            "SecretValues": [
+                {"Name": "PRELOAD_A", "SecretString": "a"},
+                {"Name": "PRELOAD_B", "SecretString": "2"},
+            ]
+        }
+        manager = SecretManager(provider_type="aws", export_env=False)
+        assert manager.preload({"PRELOAD_A": "str", "PRELOAD_B": "int"}) == {
+            "PRELOAD_A": "a",
+            "PRELOAD_B": 2,
+        }
+        mock_aws_client.batch_get_secret_value.assert_called_once()
+        mock_aws_client.get_secret_value.assert_not_called()
+
+    def test_aggregated_error(self, env_file):
+        manager = SecretManager(provider_type="local", env_path=env_file)
+        with pytest.raises(PreloadError) as excinfo:
+            manager.preload({"MISSING_ONE": "str", "APP_NAME": "int", "PORT": "int"})
+
+        errors = excinfo.value.errors
+        assert set(errors) == {"MISSING_ONE", "APP_NAME"}
+        assert isinstance(errors["MISSING_ONE"], SecretNotFoundError)
+        assert "APP_NAME is not a valid int" in str(excinfo.value)
+        assert str(excinfo.value).startswith("2 secret(s) failed to preload")
+        # Nothing is pinned when preloading fails
+        assert manager.provider._preloaded == {}
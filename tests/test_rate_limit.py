@@ -0,0 +1,113 @@
+import asyncio
+
+import pytest
+
+from cloud_secrets.common.exceptions import RateLimitExceededError
+from cloud_secrets.common.rate_limit import TokenBucket, rate_limiters
+from cloud_secrets.common.resilience import CircuitBreaker
+from cloud_secrets.providers.aws_provider import AWSSecretsProvider
+
+
+@pytest.fixture(autouse=True)
+def fresh_rate_limiters():
+    rate_limiters.clear()
+    yield
+    rate_limiters.clear()
+
+
+class TestTokenBucket:
+    def test_burst_then_waits(self, clock):
+        bucket = TokenBucket(rate=10, burst=2, clock=clock, sleep=clock.sleep)
+
+        assert bucket.acquire() == 0
+        assert bucket.acquire() == 0
+        assert bucket.acquire() == pytest.approx(0.1)
+        assert clock.slept == [pytest.approx(0.1)]
+        assert bucket.stats()["waited"] == 1
+
+    def test_refills_over_time(self, clock):
+        bucket = TokenBucket(rate=10, burst=2, clock=clock, sleep=clock.sleep)
+        bucket.acquire()
+        bucket.acquire()
+        clock.now += 1
+        assert bucket.acquire() == 0
+        assert bucket.acquire() == 0
+
+    def test_async_acquire_shares_the_bucket(self, clock, monkeypatch):
+        slept = []
+
+        async def fake_sleep(seconds):
+            slept.append(seconds)
+
+        monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+        bucket = TokenBucket(rate=10, burst=1, clock=clock, sleep=clock.sleep)
+        bucket.acquire()
+
+        assert asyncio.run(bucket.acquire_async()) == pytest.approx(0.1)
+        assert slept == [pytest.approx(0.1)]
+        assert clock.slept == []
+        assert bucket.stats()["acquired"] == 2
+
+    def test_queued_callers_reserve_successive_slots(self, clock):
+        # Nothing sleeps here, so each caller sees the previous reservation
+        bucket = TokenBucket(rate=10, burst=1, clock=clock, sleep=lambda s: None)
+        waits = [bucket.acquire() for _ in range(4)]
+        assert waits == [0, pytest.approx(0.1), pytest.approx(0.2), pytest.approx(0.3)]
+
+    def test_rejects_beyond_max_wait(self, clock):
+        bucket = TokenBucket(
+            rate=1, burst=1, max_wait=0.5, clock=clock, sleep=clock.sleep
+        )
+        bucket.acquire()
+        with pytest.raises(RateLimitExceededError, match="max wait is 0.5s"):
+            bucket.acquire()
+        assert bucket.stats()["rejected"] == 1
+        assert bucket.stats()["acquired"] == 1
+
+
+class TestProviderRateLimit:
+    def test_every_backend_call_takes_a_token(self, mock_aws_client):
+        provider = AWSSecretsProvider(rate_limit=100, rate_burst=10)
+        provider.get_secret("A")
+        provider.get_secret("B")
+
+        assert provider.backend_stats()["rate_limiter"]["acquired"] == 2
+
+    def test_rejection_raises_without_calling_backend(self, mock_aws_client):
+        provider = AWSSecretsProvider(
+            rate_limit=0.001, rate_burst=1, rate_limit_max_wait=0
+        )
+        provider.get_secret("A")
+        with pytest.raises(RateLimitExceededError):
+            provider.get_secret("B")
+        assert mock_aws_client.get_secret_value.call_count == 1
+
+    def test_rejection_frees_half_open_probe(self, mock_aws_client, clock):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=1, clock=clock)
+        breaker.record_failure()
+        clock.now = 1
+        provider = AWSSecretsProvider(
+            circuit_breaker=breaker,
+            rate_limiter=TokenBucket(rate=1, burst=1, max_wait=0, clock=clock),
+        )
+        provider.rate_limiter.acquire()
+
+        with pytest.raises(RateLimitExceededError):
+            provider.get_secret("A")
+        assert breaker.allow()
+
+    def test_shared_process_wide(self, mock_aws_client):
+        first = AWSSecretsProvider(rate_limit=5, shared_rate_limit=True)
+        second = AWSSecretsProvider(
+            region_name="eu-west-1", rate_limit=5, shared_rate_limit=True
+        )
+        keyed = AWSSecretsProvider(rate_limit=5, shared_rate_limit="account-2")
+        private = AWSSecretsProvider(rate_limit=5)
+
+        assert first.rate_limiter is second.rate_limiter
+        assert keyed.rate_limiter is not first.rate_limiter
+        assert private.rate_limiter is not first.rate_limiter
+        assert set(rate_limiters.stats()) == {"AWSSecretsProvider", "account-2"}
+
+    def test_off_by_default(self, mock_aws_client):
+        assert AWSSecretsProvider().rate_limiter is None
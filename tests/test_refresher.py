@@ -0,0 +1,123 @@
+import threading
+import time
+
+import pytest
+
+from cloud_secrets import SecretManager
+from cloud_secrets.refresher import SecretRefresher
+from tests.conftest import MemoryProvider
+
+
+def wait_until(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def provider():
+    provider = MemoryProvider(cache_ttl=0.3)
+    provider.rotate("DB_CREDS", "first")
+    return provider
+
+
+@pytest.fixture
+def refresher(provider):
+    refresher = SecretRefresher(
+        provider, refresh_ahead=0.25, jitter=0, retry_delay=0.05
+    )
+    refresher.start()
+    yield refresher
+    refresher.stop()
+
+
+class TestSecretRefresher:
+    def test_refreshes_before_expiry(self, provider, refresher):
+        provider.get_secret("DB_CREDS")
+        assert refresher.watched() == ["DB_CREDS"]
+
+        changed = threading.Event()
+        refresher.on_change(lambda *args: changed.set())
+        provider.rotate("DB_CREDS", "second")
+
+        assert changed.wait(2)
+        # The cache was refreshed in the background, so this is a hit
+        hits = provider.cache.hits
+        assert provider.get_secret("DB_CREDS") == "second"
+        assert provider.cache.hits == hits + 1
+
+    def test_callback_receives_old_and_new(self, provider, refresher):
+        provider.get_secret("DB_CREDS")
+        seen = []
+        done = threading.Event()
+
+        def callback(name, old, new):
+            seen.append((name, old, new))
+            done.set()
+
+        refresher.on_change(callback, secret_names=["DB_CREDS"])
+        provider.rotate("DB_CREDS", "second")
+
+        assert done.wait(2)
+        assert seen[0] == ("DB_CREDS", "first", "second")
+        assert refresher.stats()["changes"] >= 1
+
+    def test_unchanged_version_does_not_notify(self, provider, refresher):
+        calls = []
+        refresher.on_change(lambda *args: calls.append(args))
+        provider.get_secret("DB_CREDS")
+        wait_until(lambda: refresher.refreshes >= 2)
+        assert calls == []
+
+    def test_failures_retry(self, provider, refresher):
+        provider.get_secret("DB_CREDS")
+        provider.fail = True
+        wait_until(lambda: refresher.failures >= 2)
+        provider.fail = False
+        wait_until(lambda: refresher.refreshes >= 1)
+
+    def test_delete_unwatches(self, provider, refresher):
+        provider.get_secret("DB_CREDS")
+        provider.delete_secret("DB_CREDS")
+        assert refresher.watched() == []
+
+    def test_repeated_fetches_keep_one_entry(self, provider, refresher):
+        for _ in range(100):
+            provider.cache.invalidate("DB_CREDS")
+            provider.get_secret("DB_CREDS")
+        assert provider.fetches == 100
+        assert len(refresher._heap) == 1
+        assert refresher.watched() == ["DB_CREDS"]
+
+    def test_uncached_reads_are_not_watched(self):
+        provider = MemoryProvider()
+        provider.rotate("DB_CREDS", "first")
+        refresher = SecretRefresher(provider)
+        refresher.start()
+        try:
+            for _ in range(100):
+                provider.get_secret("DB_CREDS")
+        finally:
+            refresher.stop()
+        assert refresher._heap == []
+        assert refresher.watched() == []
+
+    def test_stop_detaches(self, provider):
+        refresher = SecretRefresher(provider)
+        refresher.start()
+        assert provider.refresher is refresher
+        refresher.stop()
+        assert provider.refresher is None
+
+
+class TestManagerRefresher:
+    def test_on_change_starts_refresher(self, env_file):
+        manager = SecretManager(provider_type="local", env_path=env_file, cache_ttl=60)
+        try:
+            manager.on_change(lambda *args: None)
+            assert manager.refresher is not None
+            manager.get_secret("API_KEY")
+            assert manager.refresher.watched() == ["API_KEY"]
+        finally:
+            manager.stop_refresher()
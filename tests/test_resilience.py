@@ -0,0 +1,240 @@
+import pytest
+from google.api_core import exceptions as gcp_exceptions
+from azure.core.exceptions import HttpResponseError
+
+from cloud_secrets.common.cache import SecretCache
+from cloud_secrets.common.exceptions import (
+    BackendUnavailableError,
+    ConfigurationError,
+    SecretNotFoundError,
+)
+from cloud_secrets.common.resilience import BackendGuard, CircuitBreaker, RetryPolicy
+from cloud_secrets.providers.aws_provider import AWSSecretsProvider
+from cloud_secrets.providers.azure_provider import AzureSecretsProvider
+from cloud_secrets.providers.gcp_provider import GCPSecretsProvider
+from tests.conftest import client_error
+
+
+@pytest.fixture
+def policy(clock):
+    return RetryPolicy(max_attempts=3, sleep=clock.sleep, clock=clock)
+
+
+class TestRetryPolicy:
+    def test_backoff_is_capped(self):
+        policy = RetryPolicy(base_delay=1.0, max_delay=2.0)
+        assert all(0 <= policy.backoff(10) <= 2.0 for _ in range(100))
+
+    def test_rejects_zero_attempts(self):
+        with pytest.raises(ConfigurationError):
+            RetryPolicy(max_attempts=0)
+
+
+class TestCircuitBreaker:
+    def test_opens_after_threshold_and_probes_once(self, clock):
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=5, clock=clock)
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.CLOSED
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        assert not breaker.allow()
+
+        clock.now = 5
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert breaker.allow()
+        assert not breaker.allow()  # only one probe at a time
+
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        assert breaker.opens == 2
+
+        clock.now = 10
+        assert breaker.allow()
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+
+class TestBackendGuard:
+    def test_retries_until_the_policy_gives_up(self, clock, policy):
+        breaker = CircuitBreaker(failure_threshold=1, clock=clock)
+        guard = BackendGuard("Test", policy, breaker)
+        start = guard.admit()
+
+        assert guard.failed(True, 0, start) is not None
+        assert guard.failed(True, 1, start) is not None
+        assert guard.failed(True, 2, start) is None
+        assert (guard.retries, guard.gave_up) == (2, 1)
+        with pytest.raises(BackendUnavailableError, match="Test backend"):
+            guard.admit()
+        assert guard.stats()["short_circuited"] == 1
+
+    def test_non_retryable_errors_count_as_healthy(self, clock):
+        breaker = CircuitBreaker(failure_threshold=1, clock=clock)
+        guard = BackendGuard("Test", circuit_breaker=breaker)
+        assert guard.failed(False, 0, guard.admit()) is None
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert guard.gave_up == 0
+
+
+class TestAWSRetries:
+    def test_retries_throttling_then_succeeds(self, mock_aws_client, policy):
+        mock_aws_client.get_secret_value.side_effect = [
+            client_error("ThrottlingException"),
+            client_error("ThrottlingException"),
+            {"SecretString": "secret123"},
+        ]
+        provider = AWSSecretsProvider(retry_policy=policy)
+
+        assert provider.get_secret("API_KEY") == "secret123"
+        assert mock_aws_client.get_secret_value.call_count == 3
+        assert provider.backend_stats()["retries"] == 2
+
+    def test_gives_up_after_max_attempts(self, mock_aws_client, policy):
+        mock_aws_client.get_secret_value.side_effect = client_error(
+            "ThrottlingException"
+        )
+        provider = AWSSecretsProvider(retry_policy=policy)
+
+        with pytest.raises(ConfigurationError):
+            provider.get_secret("API_KEY")
+        assert mock_aws_client.get_secret_value.call_count == 3
+        assert provider.backend_stats()["gave_up"] == 1
+
+    def test_deadline_stops_retries(self, mock_aws_client, clock):
+        mock_aws_client.get_secret_value.side_effect = client_error(
+            "ServiceUnavailable"
+        )
+        policy = RetryPolicy(
+            max_attempts=10,
+            base_delay=1.0,
+            max_delay=1.0,
+            deadline=0.5,
+            sleep=clock.sleep,
+            clock=clock,
+        )
+        policy.backoff = lambda attempt: 1.0
+        provider = AWSSecretsProvider(retry_policy=policy)
+
+        with pytest.raises(ConfigurationError):
+            provider.get_secret("API_KEY")
+        assert mock_aws_client.get_secret_value.call_count == 1
+
+    def test_not_found_is_not_retried(self, mock_aws_client, policy):
+        mock_aws_client.get_secret_value.side_effect = client_error(
+            "ResourceNotFoundException"
+        )
+        provider = AWSSecretsProvider(
+            retry_policy=policy, circuit_breaker=CircuitBreaker()
+        )
+
+        with pytest.raises(SecretNotFoundError):
+            provider.get_secret("MISSING")
+        assert mock_aws_client.get_secret_value.call_count == 1
+        assert provider.circuit_breaker.state == CircuitBreaker.CLOSED
+
+    def test_calls_once_by_default(self, mock_aws_client):
+        mock_aws_client.get_secret_value.side_effect = client_error(
+            "ThrottlingException"
+        )
+        provider = AWSSecretsProvider()
+
+        with pytest.raises(ConfigurationError):
+            provider.get_secret("API_KEY")
+        assert mock_aws_client.get_secret_value.call_count == 1
+        assert provider.backend_stats()["breaker"] is None
+
+    def test_resilient_uses_default_policy_and_breaker(self, mock_aws_client):
+        provider = AWSSecretsProvider(resilient=True, cache_ttl=60)
+        assert provider.retry_policy.max_attempts == 4
+        assert provider.circuit_breaker.state == CircuitBreaker.CLOSED
+        assert provider.cache.keep_expired
+
+
+class TestBreakerOnProvider:
+    def test_open_breaker_short_circuits_and_serves_last_known_good(
+        self, mock_aws_client, clock
+    ):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30, clock=clock)
+        provider = AWSSecretsProvider(
+            cache=SecretCache(ttl=1, clock=clock, keep_expired=True),
+            retry_policy=RetryPolicy(max_attempts=1, clock=clock),
+            circuit_breaker=breaker,
+        )
+        assert provider.get_secret("API_KEY") == "secret123"
+
+        clock.now = 1
+        mock_aws_client.get_secret_value.side_effect = client_error(
+            "InternalServiceError"
+        )
+        # The failing call opens the breaker; the old value is served
+        assert provider.get_secret("API_KEY") == "secret123"
+        assert breaker.state == CircuitBreaker.OPEN
+
+        # While open the backend isn't called at all
+        assert provider.get_secret("API_KEY") == "secret123"
+        assert mock_aws_client.get_secret_value.call_count == 2
+        with pytest.raises(BackendUnavailableError):
+            provider.get_secret("NEVER_FETCHED")
+
+        stats = provider.backend_stats()
+        assert stats["short_circuited"] == 2
+        assert stats["served_stale"] == 2
+        assert stats["breaker"]["state"] == CircuitBreaker.OPEN
+
+        # After the reset timeout a probe closes the breaker again
+        clock.now = 31
+        mock_aws_client.get_secret_value.side_effect = None
+        mock_aws_client.get_secret_value.return_value = {"SecretString": "rotated"}
+        assert provider.get_secret("API_KEY") == "rotated"
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_nothing_is_served_stale_without_a_cache(self, mock_aws_client, clock):
+        provider = AWSSecretsProvider(
+            retry_policy=RetryPolicy(max_attempts=1, clock=clock),
+            circuit_breaker=CircuitBreaker(failure_threshold=1, clock=clock),
+        )
+        provider.get_secret("API_KEY")
+        mock_aws_client.get_secret_value.side_effect = client_error(
+            "InternalServiceError"
+        )
+
+        with pytest.raises(ConfigurationError):
+            provider.get_secret("API_KEY")
+        with pytest.raises(BackendUnavailableError):
+            provider.get_secret("API_KEY")
+        assert provider.backend_stats()["served_stale"] == 0
+
+    def test_stale_values_are_bounded_by_the_cache(self, mock_aws_client, clock):
+        provider = AWSSecretsProvider(
+            cache=SecretCache(ttl=1, max_size=1, clock=clock, keep_expired=True),
+            retry_policy=RetryPolicy(max_attempts=1, clock=clock),
+            circuit_breaker=CircuitBreaker(failure_threshold=1, clock=clock),
+        )
+        provider.get_secret("FIRST")
+        provider.get_secret("SECOND")
+        clock.now = 1
+        mock_aws_client.get_secret_value.side_effect = client_error(
+            "InternalServiceError"
+        )
+
+        assert provider.get_secret("SECOND") == "secret123"
+        with pytest.raises(BackendUnavailableError):
+            provider.get_secret("FIRST")
+
+
+class TestClassification:
+    def test_gcp(self, mock_gcp_client):
+        provider = GCPSecretsProvider(project_id="test-project")
+        assert provider._is_retryable(gcp_exceptions.ResourceExhausted("quota"))
+        assert provider._is_retryable(gcp_exceptions.ServiceUnavailable("down"))
+        assert not provider._is_retryable(gcp_exceptions.NotFound("missing"))
+        assert not provider._is_retryable(gcp_exceptions.PermissionDenied("no"))
+
+    def test_azure(self, mock_azure_client):
+        provider = AzureSecretsProvider(vault_url="https://test.vault.azure.net/")
+        throttled = HttpResponseError("throttled")
+        throttled.status_code = 429
+        forbidden = HttpResponseError("forbidden")
+        forbidden.status_code = 403
+        assert provider._is_retryable(throttled)
+        assert not provider._is_retryable(forbidden)
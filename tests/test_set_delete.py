@@ -113,14 +113,14 @@ class TestAWSSetDelete:
         assert json.loads(result) == {"csv_connector/abc": {"private_key": "pk123"}}
 
     def test_flat_dict_destructures_env_vars(self, mock_aws_client):
-        """A flat dict secret is destructured into env vars AND the raw JSON is returned."""
+        """With flatten_env a flat dict secret is destructured into env vars AND the raw JSON is returned."""
         import json
         import os
 
         original = json.dumps({"DB_HOST": "localhost", "DB_PORT": "5432"})
         mock_aws_client.get_secret_value.return_value = {"SecretString": original}
 
-        provider = AWSSecretsProvider(region_name="us-east-1")
+        provider = AWSSecretsProvider(region_name="us-east-1", flatten_env=True)
         try:
             result = provider._fetch_raw_secret("my-bundle")
 
@@ -0,0 +1,77 @@
+import threading
+import time
+
+import pytest
+
+from cloud_secrets.common.exceptions import SecretNotFoundError
+from cloud_secrets.common.singleflight import SingleFlight
+from tests.conftest import MemoryProvider
+
+
+def run_concurrently(func, count=10):
+    results = [None] * count
+
+    def worker(i):
+        try:
+            results[i] = func()
+        except Exception as e:
+            results[i] = e
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    return threads, results
+
+
+def wait_for_waiters(flight, expected):
+    deadline = time.monotonic() + 5
+    while flight.coalesced < expected and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+class TestSingleFlight:
+    def test_sequential_calls_are_not_coalesced(self):
+        flight = SingleFlight()
+        assert flight.do("k", lambda: 1) == 1
+        assert flight.do("k", lambda: 2) == 2
+        assert flight.stats() == {"executed": 2, "coalesced": 0, "in_flight": 0}
+
+    def test_concurrent_readers_share_one_fetch(self):
+        release = threading.Event()
+        provider = MemoryProvider({"SF_SHARED": "value"}, gate=release)
+        threads, results = run_concurrently(lambda: provider.get_secret("SF_SHARED"))
+        wait_for_waiters(provider.single_flight, 9)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert results == ["value"] * 10
+        assert provider.fetches == 1
+        assert provider.single_flight.stats()["coalesced"] == 9
+
+    def test_exception_is_shared(self):
+        release = threading.Event()
+        provider = MemoryProvider({"SF_SHARED": "value"}, gate=release)
+        threads, results = run_concurrently(lambda: provider.get_secret("MISSING_SF"))
+        wait_for_waiters(provider.single_flight, 9)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert all(isinstance(r, SecretNotFoundError) for r in results)
+        assert provider.fetches == 1
+
+    def test_can_be_disabled(self):
+        provider = MemoryProvider({"SF_SHARED": "value"}, coalesce_requests=False)
+        assert provider.single_flight is None
+        assert provider.get_secret("SF_SHARED") == "value"
+
+    def test_leader_failure_does_not_poison_key(self):
+        flight = SingleFlight()
+
+        def boom():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            flight.do("k", boom)
+        assert flight.do("k", lambda: "ok") == "ok"
@@ -0,0 +1,126 @@
+import json
+
+import pytest
+
+from cloud_secrets import SecretManager
+from cloud_secrets.common.exceptions import SecretNotFoundError
+from cloud_secrets.snapshot import SecretSnapshot
+
+
+@pytest.fixture
+def manager(env_file, tmp_path):
+    (tmp_path / ".secrets.json").write_text(
+        json.dumps(
+            {
+                "APP_PORT": "8080",
+                "APP_DEBUG": "true",
+                "APP_HOSTS": "a.example,b.example",
+                "APP_DB": '{"host": "db", "port": 5432}',
+                "OTHER": "x",
+            }
+        )
+    )
+    return SecretManager(provider_type="local", env_path=env_file, export_env=False)
+
+
+class TestSecretSnapshot:
+    def test_typed_accessors(self):
+        snapshot = SecretSnapshot(
+            {"PORT": "8080", "DEBUG": "off", "RATE": "1.5", "HOSTS": "a,b"}
+        )
+
+        assert snapshot.get_int("PORT") == 8080
+        assert snapshot.get_bool("DEBUG") is False
+        assert snapshot.get_float("RATE") == 1.5
+        assert snapshot.get_list("HOSTS") == ("a", "b")
+        assert snapshot.get_str("PORT") == "8080"
+        assert snapshot.get_int("PORT") is snapshot.get_int("PORT")
+
+    def test_dicts_are_read_only(self):
+        snapshot = SecretSnapshot(
+            {"DB": '{"host": "db", "port": "5432", "tags": ["a"]}', "KV": "a=1,b=2"}
+        )
+
+        db = snapshot.get_dict("DB", {"port": int})
+        assert db["port"] == 5432
+        assert snapshot.get_dict("DB")["tags"] == ("a",)
+        with pytest.raises(TypeError):
+            snapshot.get_dict("DB")["host"] = "other"
+        assert dict(snapshot.get_dict("KV")) == {"a": "1", "b": "2"}
+
+    def test_immutable_and_hashable(self):
+        source = {"A": "1"}
+        snapshot = SecretSnapshot(source)
+        source["A"] = "2"
+
+        assert snapshot["A"] == "1"
+        with pytest.raises(AttributeError):
+            snapshot.extra = 1
+        with pytest.raises(AttributeError):
+            snapshot.__dict__
+        assert hash(snapshot) == hash(SecretSnapshot({"A": "1"}))
+        assert snapshot == SecretSnapshot({"A": "1"}) == {"A": "1"}
+        assert len({snapshot, SecretSnapshot({"A": "1"})}) == 1
+
+    def test_errors_and_repr(self):
+        snapshot = SecretSnapshot({"PORT": "eighty", "TOKEN": "hunter2"})
+        with pytest.raises(SecretNotFoundError, match="MISSING not found"):
+            snapshot.get_int("MISSING")
+        with pytest.raises(SecretNotFoundError, match="Error retrieving secret PORT"):
+            snapshot.get_int("PORT")
+        assert "hunter2" not in repr(snapshot)
+
+
+class TestLoadNamespace:
+    def test_loads_prefix_in_bulk(self, manager, mocker):
+        fetch = mocker.spy(manager.provider, "_fetch_raw_secrets")
+
+        snapshot = manager.load_namespace("APP_")
+
+        assert set(snapshot) == {
+            "APP_PORT",
+            "APP_DEBUG",
+            "APP_HOSTS",
+            "APP_DB",
+            "APP_NAME",
+        }
+        assert snapshot.get_int("APP_PORT") == 8080
+        assert fetch.call_count == 1
+
+    def test_strip_prefix(self, manager):
+        snapshot = manager.load_namespace("APP_", strip_prefix=True)
+        assert snapshot.get_bool("DEBUG") is True
+        assert snapshot.get_dict("DB")["port"] == 5432
+
+
+class TestWatchNamespace:
+    def test_refresh_swaps_whole_snapshot(self, manager):
+        live = manager.watch_namespace("APP_", strip_prefix=True)
+        before = live.current
+
+        assert live.refresh() is False
+        manager.set_secrets({"APP_PORT": "9090", "APP_DEBUG": "false"})
+        assert live.refresh() is True
+
+        assert before.get_int("PORT") == 8080
+        assert (live.current.get_int("PORT"), live.current.get_bool("DEBUG")) == (
+            9090,
+            False,
+        )
+        assert live.swaps == 1
+
+    def test_refresher_rotations_are_swapped_in(self, manager):
+        manager.start_refresher()
+        try:
+            live = manager.watch_namespace("APP_")
+            old = live.current
+
+            manager.refresher._notify("APP_PORT", "8080", "9090")
+            manager.refresher._notify("OTHER", "x", "y")
+        finally:
+            manager.stop_refresher()
+
+        assert live.current.get_int("APP_PORT") == 9090
+        assert "OTHER" not in live.current
+        assert old.get_int("APP_PORT") == 8080
+        assert live.swaps == 1
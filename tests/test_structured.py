@@ -0,0 +1,133 @@
+import asyncio
+import json
+import os
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from cloud_secrets import SecretManager
+from cloud_secrets.common import structured
+from cloud_secrets.common.exceptions import SecretNotFoundError
+from cloud_secrets.providers.async_gcp_provider import AsyncGCPSecretsProvider
+from cloud_secrets.providers.aws_provider import AWSSecretsProvider
+from cloud_secrets.providers.gcp_provider import GCPSecretsProvider
+
+DB_SECRET = json.dumps(
+    {"host": "db.internal", "port": 5432, "password": "hunter2", "tls": "true"}
+)
+
+
+@pytest.fixture
+def aws_db(mock_aws_client):
+    mock_aws_client.get_secret_value.return_value = {"SecretString": DB_SECRET}
+    provider = AWSSecretsProvider(export_env=False, cache_ttl=60)
+    yield provider
+
+
+class TestFields:
+    def test_field_access(self, aws_db):
+        assert aws_db.get_secret("DB", field="password") == "hunter2"
+        assert aws_db.get_secret("DB", field="port") == "5432"
+        assert aws_db.get_secret("DB", field="port", cast_type="int") == 5432
+        assert aws_db.get_secret("DB", field="tls", cast_type="bool") is True
+
+    def test_missing_field(self, aws_db):
+        with pytest.raises(SecretNotFoundError, match="Field user not found"):
+            aws_db.get_secret("DB", field="user")
+
+    def test_plain_secret_has_no_fields(self, mock_aws_client):
+        mock_aws_client.get_secret_value.return_value = {"SecretString": "plain"}
+        provider = AWSSecretsProvider(export_env=False)
+        with pytest.raises(SecretNotFoundError):
+            provider.get_secret("PLAIN", field="anything")
+
+    def test_get_dict(self, aws_db):
+        config = aws_db.get_dict("DB", field_types={"tls": bool, "port": str})
+        assert config == {
+            "host": "db.internal",
+            "port": "5432",
+            "password": "hunter2",
+            "tls": True,
+        }
+
+    def test_parsed_once_per_value(self, aws_db, mocker):
+        parse = mocker.spy(structured, "parse_structured")
+        for _ in range(5):
+            aws_db.get_secret("DB", field="host")
+        assert parse.call_count == 1
+
+        aws_db.client.get_secret_value.return_value = {
+            "SecretString": json.dumps({"host": "rotated"})
+        }
+        aws_db.invalidate("DB")
+        assert aws_db.get_secret("DB", field="host") == "rotated"
+        assert parse.call_count == 2
+
+    def test_manager_passes_field(self, mock_aws_client):
+        mock_aws_client.get_secret_value.return_value = {"SecretString": DB_SECRET}
+        manager = SecretManager(provider_type="aws", export_env=False)
+        assert manager.get_secret("DB", field="host") == "db.internal"
+
+
+class TestFlattening:
+    def test_not_flattened_by_default(self, mock_aws_client):
+        mock_aws_client.get_secret_value.return_value = {"SecretString": DB_SECRET}
+        provider = AWSSecretsProvider()
+        try:
+            provider.get_secret("STRUCTURED_DB")
+            assert "password" not in provider.store
+            assert os.environ["STRUCTURED_DB"] == DB_SECRET
+        finally:
+            os.environ.pop("STRUCTURED_DB", None)
+
+    def test_flatten_once_per_value(self, mock_aws_client, mocker):
+        mock_aws_client.get_secret_value.return_value = {"SecretString": DB_SECRET}
+        provider = AWSSecretsProvider(export_env=False, flatten_env=True)
+        update = mocker.spy(provider.store, "update")
+
+        for _ in range(3):
+            provider.get_secret("DB")
+
+        assert update.call_count == 1
+        env = provider.get_env()
+        assert env("password") == "hunter2"
+        assert env.int("port") == 5432
+        assert env.bool("tls") is True
+
+    def test_gcp_env_payload(self, mock_gcp_client):
+        response = mock_gcp_client.return_value.access_secret_version.return_value
+        response.payload.data = b"DUMMY=DUMMY\nENV=staging\nDEBUG=False\n"
+        provider = GCPSecretsProvider(project_id="p", export_env=False)
+
+        assert provider.get_secret("SETTINGS", field="ENV") == "staging"
+        assert provider.get_secret("SETTINGS", field="DEBUG", cast_type="bool") is False
+        assert "ENV" not in provider.store
+
+        flattening = GCPSecretsProvider(
+            project_id="p", export_env=False, flatten_env=True
+        )
+        flattening.get_secret("SETTINGS")
+        assert flattening.get_env()("DUMMY") == "DUMMY"
+
+
+class TestAsync:
+    def test_async_field_access(self):
+        with patch(
+            "google.cloud.secretmanager.SecretManagerServiceAsyncClient"
+        ) as mock_cls:
+            response = MagicMock()
+            response.payload.data = DB_SECRET.encode()
+            mock_cls.return_value.access_secret_version = AsyncMock(
+                return_value=response
+            )
+            provider = AsyncGCPSecretsProvider(project_id="p", export_env=False)
+
+            async def run():
+                password = await provider.get_secret("DB", field="password")
+                config = await provider.get_dict("DB")
+                return password, config
+
+            password, config = asyncio.run(run())
+
+        assert password == "hunter2"
+        assert config["port"] == 5432
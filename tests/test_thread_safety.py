@@ -0,0 +1,92 @@
+import io
+import json
+import os
+import threading
+from pathlib import Path
+
+from cloud_secrets import SecretManager
+from cloud_secrets.common.store import SecretStore, make_env
+from cloud_secrets.providers.aws_provider import AWSSecretsProvider
+from cloud_secrets.providers.local_provider import LocalEnvProvider
+
+
+class TestSecretStore:
+    def test_private_store_does_not_touch_os_environ(self):
+        env = make_env(export_env=False)
+        env.read_env(io.StringIO("PRIVATE_ONLY=1"))
+        assert env("PRIVATE_ONLY") == "1"
+        assert "PRIVATE_ONLY" not in os.environ
+
+    def test_private_store_sees_process_environment(self, monkeypatch):
+        monkeypatch.setenv("FROM_PROCESS", "yes")
+        env = make_env(export_env=False)
+        assert env("FROM_PROCESS") == "yes"
+
+    def test_iteration_is_a_snapshot(self):
+        store = SecretStore()
+        store.update({"A": "1", "B": "2"})
+        for key in store:
+            store.pop(key)
+        assert len(store) == 0
+
+
+class TestProviderIsolation:
+    def test_aws_json_secret_stays_private(self, mock_aws_client):
+        mock_aws_client.get_secret_value.return_value = {
+            "SecretString": json.dumps({"ISOLATED_HOST": "db"})
+        }
+        provider = AWSSecretsProvider(
+            region_name="us-east-1", export_env=False, flatten_env=True
+        )
+        provider.get_secret("ISOLATED_BUNDLE")
+
+        assert provider.get_env()("ISOLATED_HOST") == "db"
+        assert "ISOLATED_HOST" not in os.environ
+        assert "ISOLATED_BUNDLE" not in os.environ
+
+    def test_local_manager_without_export(self, env_file):
+        manager = SecretManager(
+            provider_type="local", env_path=env_file, export_env=False
+        )
+        manager.set_secret("NOT_EXPORTED", "v")
+        assert manager.get_secret("NOT_EXPORTED") == "v"
+        assert "NOT_EXPORTED" not in os.environ
+
+
+class TestLocalConcurrentWrites:
+    def test_no_lost_updates(self, env_file):
+        provider = LocalEnvProvider(env_path=env_file, export_env=False)
+
+        def writer(index):
+            for n in range(20):
+                provider.set_secret(f"T{index}_{n}", str(n))
+
+        threads = [threading.Thread(target=writer, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stored = provider._load_secrets_file()
+        assert len(stored) == 8 * 20
+
+    def test_separate_instances_share_file_lock(self, env_file):
+        providers = [LocalEnvProvider(env_path=env_file) for _ in range(4)]
+
+        def writer(index):
+            for n in range(10):
+                providers[index].set_secret(f"P{index}_{n}", "x")
+
+        threads = [threading.Thread(target=writer, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(providers[0]._load_secrets_file()) == 40
+
+    def test_atomic_write_leaves_no_temp_files(self, env_file):
+        provider = LocalEnvProvider(env_path=env_file)
+        provider.set_secret("ATOMIC", "1")
+        leftovers = list(Path(env_file).parent.glob(".secrets.*.tmp"))
+        assert leftovers == []
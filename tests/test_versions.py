@@ -0,0 +1,161 @@
+import pytest
+from botocore.exceptions import ClientError
+from google.api_core import exceptions as gcp_exceptions
+
+from cloud_secrets import SecretManager
+from cloud_secrets.common.exceptions import ConfigurationError, SecretNotFoundError
+from cloud_secrets.providers.aws_provider import AWSSecretsProvider
+from cloud_secrets.providers.azure_provider import AzureSecretsProvider
+from cloud_secrets.providers.gcp_provider import GCPSecretsProvider
+from cloud_secrets.providers.local_provider import LocalEnvProvider
+
+
+V1 = "a9b8c7d6-1111-4e5f-9a0b-0123456789ab"
+V2 = "a9b8c7d6-2222-4e5f-9a0b-0123456789ab"
+
+
+def aws_versions(mock_aws_client, versions, current, labels=None):
+    labels = {"AWSPREVIOUS": V1, **(labels or {})}
+
+    def get_secret_value(SecretId, VersionId=None, VersionStage=None):
+        if VersionStage is not None:
+            VersionId = labels.get(VersionStage, VersionStage)
+        version = VersionId or current
+        if version not in versions:
+            raise ClientError(
+                {"Error": {"Code": "ResourceNotFoundException", "Message": "no"}},
+                "GetSecretValue",
+            )
+        return {"SecretString": versions[version], "VersionId": version}
+
+    mock_aws_client.get_secret_value.side_effect = get_secret_value
+    mock_aws_client.describe_secret.return_value = {
+        "VersionIdsToStages": {V1: ["AWSPREVIOUS"], current: ["AWSCURRENT"]}
+    }
+
+
+class TestAWSVersions:
+    def test_pinned_version_is_cached_forever(self, mock_aws_client):
+        aws_versions(mock_aws_client, {V1: "old", V2: "8080"}, V2)
+        provider = AWSSecretsProvider()
+
+        assert provider.get_secret("PORT", version=V2, cast_type="int") == 8080
+        assert provider.get_secret("PORT", version=V2) == "8080"
+        assert provider.get_secret("PORT", version=V1) == "old"
+
+        calls = mock_aws_client.get_secret_value.call_args_list
+        assert [c.kwargs for c in calls] == [
+            {"SecretId": "PORT", "VersionId": V2},
+            {"SecretId": "PORT", "VersionId": V1},
+        ]
+
+    def test_staging_labels_are_not_cached(self, mock_aws_client):
+        aws_versions(mock_aws_client, {V1: "old", V2: "new"}, V2)
+        provider = AWSSecretsProvider()
+
+        assert provider.get_secret("KEY", version="AWSPREVIOUS") == "old"
+        assert provider.get_secret("KEY", version="AWSPREVIOUS") == "old"
+        assert mock_aws_client.get_secret_value.call_count == 2
+        assert mock_aws_client.get_secret_value.call_args.kwargs == {
+            "SecretId": "KEY",
+            "VersionStage": "AWSPREVIOUS",
+        }
+
+    def test_custom_staging_labels_are_sent_as_stages(self, mock_aws_client):
+        aws_versions(mock_aws_client, {V1: "blue", V2: "green"}, V2, {"blue": V1})
+        provider = AWSSecretsProvider()
+
+        assert provider.get_secret("KEY", version="blue") == "blue"
+        assert provider.get_secret("KEY", version="blue") == "blue"
+        assert mock_aws_client.get_secret_value.call_count == 2
+        assert mock_aws_client.get_secret_value.call_args.kwargs == {
+            "SecretId": "KEY",
+            "VersionStage": "blue",
+        }
+
+    def test_versioned_read_leaves_environment_alone(self, mock_aws_client):
+        aws_versions(mock_aws_client, {V1: "old", V2: "new"}, V2)
+        provider = AWSSecretsProvider(export_env=False)
+
+        assert provider.get_secret("KEY") == "new"
+        assert provider.get_secret("KEY", version=V1) == "old"
+        assert provider.get_env()("KEY") == "new"
+
+    def test_missing_version(self, mock_aws_client):
+        aws_versions(mock_aws_client, {V1: "old"}, V1)
+        with pytest.raises(SecretNotFoundError, match="Version nope"):
+            AWSSecretsProvider().get_secret("KEY", version="nope")
+
+    def test_current_version_uses_describe(self, mock_aws_client):
+        aws_versions(mock_aws_client, {V1: "old", V2: "new"}, V2)
+        manager = SecretManager(provider_type="aws")
+
+        assert manager.get_secret_version("KEY") == V2
+        mock_aws_client.get_secret_value.assert_not_called()
+
+    def test_delete_drops_pinned_versions(self, mock_aws_client):
+        aws_versions(mock_aws_client, {V1: "old"}, V1)
+        provider = AWSSecretsProvider()
+        provider.get_secret("KEY", version=V1)
+
+        provider.delete_secret("KEY")
+        provider.get_secret("KEY", version=V1)
+        assert mock_aws_client.get_secret_value.call_count == 2
+
+
+class TestGCPVersions:
+    def test_numbers_are_pinned_aliases_are_not(self, mock_gcp_client):
+        client = mock_gcp_client.return_value
+        provider = GCPSecretsProvider(project_id="test-project")
+
+        provider.get_secret("API_KEY", version="3")
+        provider.get_secret("API_KEY", version="3")
+        provider.get_secret("API_KEY", version="latest")
+        provider.get_secret("API_KEY", version="latest")
+
+        names = [
+            c.kwargs["request"]["name"]
+            for c in client.access_secret_version.call_args_list
+        ]
+        assert names == [
+            "projects/test-project/secrets/API_KEY/versions/3",
+            "projects/test-project/secrets/API_KEY/versions/latest",
+            "projects/test-project/secrets/API_KEY/versions/latest",
+        ]
+
+    def test_current_version_resolves_latest(self, mock_gcp_client):
+        client = mock_gcp_client.return_value
+        client.get_secret_version.return_value.name = (
+            "projects/test-project/secrets/API_KEY/versions/7"
+        )
+        provider = GCPSecretsProvider(project_id="test-project")
+
+        assert provider.get_secret_version("API_KEY") == "7"
+        client.access_secret_version.assert_not_called()
+
+    def test_missing_version(self, mock_gcp_client):
+        client = mock_gcp_client.return_value
+        client.access_secret_version.side_effect = gcp_exceptions.NotFound("no")
+        provider = GCPSecretsProvider(project_id="test-project")
+        with pytest.raises(SecretNotFoundError):
+            provider.get_secret("API_KEY", version="99")
+
+
+class TestAzureVersions:
+    def test_pinned_version(self, mock_azure_client):
+        provider = AzureSecretsProvider(vault_url="https://test.vault.azure.net/")
+        provider.client = mock_azure_client
+        mock_azure_client.get_secret.return_value.properties.version = "abc"
+
+        assert provider.get_secret("API_KEY", version="abc") == "secret123"
+        assert provider.get_secret("API_KEY", version="abc") == "secret123"
+        mock_azure_client.get_secret.assert_called_once_with("API_KEY", "abc")
+        assert provider.get_secret_version("API_KEY") == "abc"
+
+
+class TestLocalVersions:
+    def test_versions_unsupported(self, env_file):
+        provider = LocalEnvProvider(env_path=env_file)
+        assert provider.get_secret_version("API_KEY") is None
+        with pytest.raises(ConfigurationError, match="does not support"):
+            provider.get_secret("API_KEY", version="1")